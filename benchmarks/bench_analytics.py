@@ -0,0 +1,98 @@
+# benchmarks/bench_analytics.py
+"""
+Benchmark for computing the history insights dashboard.
+
+Generates a synthetic review history and compares the vectorized
+computations in ``src.data.analytics`` against a straightforward
+per-review Python loop computing the same daily, topic and retention
+statistics.
+
+Usage:
+    python -m benchmarks.bench_analytics [--reviews 1000000] [--cards 20000] [--topics 50]
+"""
+import time
+import argparse
+import datetime
+from collections import defaultdict
+import numpy as np
+from src.data.analytics import ReviewColumns, compute_dashboard, local_day_numbers, RETENTION_BINS
+
+
+def make_rows(num_reviews: int, num_cards: int, num_topics: int, days: int = 730):
+    """Build (reviewed at, correct, card id, topic) rows spread over ``days`` days, oldest first."""
+    rng = np.random.default_rng(42)
+    now = time.time()
+    timestamps = np.sort(now - rng.random(num_reviews) * days * 86400)
+    correct = rng.random(num_reviews) < 0.75
+    cards = rng.integers(0, num_cards, num_reviews)
+    card_topics = rng.integers(0, num_topics, num_cards)
+
+    card_ids = [f"card-{i}" for i in range(num_cards)]
+    topics = [f"Topic {i}" for i in range(num_topics)]
+    return [
+        (ts, int(ok), card_ids[card], topics[card_topics[card]])
+        for ts, ok, card in zip(timestamps.tolist(), correct.tolist(), cards.tolist())
+    ]
+
+
+def compute_baseline(rows):
+    """Per-review loop computing daily accuracy, topic accuracy and the retention curve."""
+    daily = defaultdict(lambda: [0, 0])
+    topics = defaultdict(lambda: [0, 0])
+    retention = [[0, 0] for _ in RETENTION_BINS]
+    last_seen = {}
+
+    for reviewed_at, correct, card_id, topic in rows:
+        day = datetime.date.fromtimestamp(reviewed_at)
+        daily[day][0] += 1
+        daily[day][1] += correct
+        topics[topic][0] += 1
+        topics[topic][1] += correct
+
+        previous = last_seen.get(card_id)
+        if previous is not None:
+            interval = (reviewed_at - previous) / 86400
+            bucket = max(i for i, low in enumerate(RETENTION_BINS) if interval >= low)
+            retention[bucket][0] += 1
+            retention[bucket][1] += correct
+        last_seen[card_id] = reviewed_at
+
+    return daily, topics, retention
+
+
+def timed(func, *args):
+    """Run ``func`` once and return (result, milliseconds)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=1000000, help="Synthetic reviews")
+    parser.add_argument("--cards", type=int, default=20000, help="Distinct cards")
+    parser.add_argument("--topics", type=int, default=50, help="Distinct topics")
+    args = parser.parse_args()
+
+    rows = make_rows(args.reviews, args.cards, args.topics)
+    print(f"{args.reviews} reviews of {args.cards} cards in {args.topics} topics\n")
+
+    (daily, topics, retention), baseline_ms = timed(compute_baseline, rows)
+    columns, columns_ms = timed(ReviewColumns.from_rows, rows)
+    dashboard, dashboard_ms = timed(compute_dashboard, columns)
+    _, days_ms = timed(local_day_numbers, columns.timestamps)
+
+    # Sanity check that both paths agree
+    assert sum(dashboard.daily_reviews) == sum(counts[0] for counts in daily.values())
+    assert dashboard.retention_reviews == [counts[0] for counts in retention]
+    assert sorted(dashboard.topic_reviews) == sorted(counts[0] for counts in topics.values())
+
+    print(f"{'python loop (daily, topics, retention)':<42} {baseline_ms:9.1f} ms")
+    print(f"{'rows -> columns':<42} {columns_ms:9.1f} ms")
+    print(f"{'vectorized dashboard (all statistics)':<42} {dashboard_ms:9.1f} ms")
+    print(f"{'  of which local day numbers':<42} {days_ms:9.1f} ms")
+    print(f"\nSpeedup (dashboard vs loop): {baseline_ms / dashboard_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
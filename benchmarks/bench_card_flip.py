@@ -0,0 +1,117 @@
+# benchmarks/bench_card_flip.py
+"""
+Benchmark for showing and flipping flashcards.
+
+Compares the previous FlashcardWidget, which changed style properties and
+unpolished/polished its frame and label on every card shown or flipped,
+with the current one, which swaps between two pre-styled faces. Both run
+under the compiled application stylesheet and pending events are processed
+after each step, so the time includes style resolution, layout and painting.
+
+Usage:
+    python -m benchmarks.bench_card_flip [--cards 200]
+"""
+import os
+import time
+import argparse
+import tempfile
+import statistics
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QFrame
+from PyQt6.QtCore import Qt
+from src.ui.theme import ThemeManager
+from src.ui.widgets.flashcard_widget import FlashcardWidget
+from benchmarks.bench_theme import BenchSettings
+
+
+class PolishingFlashcardWidget(QWidget):
+    """The previous FlashcardWidget: one frame and label, repolished on every change."""
+
+    def __init__(self):
+        super().__init__()
+        self.is_flipped = False
+        self.question = self.answer = ""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.card_frame = QFrame()
+        self.card_frame.setObjectName("flashcardFrame")
+        self.card_frame.setMinimumHeight(400)
+        card_layout = QVBoxLayout(self.card_frame)
+        card_layout.setContentsMargins(32, 32, 32, 32)
+        self.content_label = QLabel()
+        self.content_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.content_label.setWordWrap(True)
+        card_layout.addWidget(self.content_label, 1)
+        layout.addWidget(self.card_frame)
+
+    def update_display(self):
+        if self.is_flipped:
+            self.content_label.setText(self.answer)
+            self.content_label.setProperty("class", "card-content card-answer")
+            self.card_frame.setProperty("flipped", "true")
+        else:
+            self.content_label.setText(self.question)
+            self.content_label.setProperty("class", "card-content card-question")
+            self.card_frame.setProperty("flipped", "false")
+        self.card_frame.style().unpolish(self.card_frame)
+        self.card_frame.style().polish(self.card_frame)
+        self.content_label.style().unpolish(self.content_label)
+        self.content_label.style().polish(self.content_label)
+
+    def set_card(self, question, answer):
+        self.question, self.answer = question, answer
+        self.is_flipped = False
+        self.update_display()
+
+    def flip_card(self):
+        self.is_flipped = not self.is_flipped
+        self.update_display()
+
+
+def measure(app, widget, cards):
+    """
+    Show and flip every card, processing the resulting events after each step.
+
+    Returns:
+        (median, p95, worst) milliseconds per step
+    """
+    times = []
+    for question, answer in cards:
+        for step in (lambda: widget.set_card(question, answer), widget.flip_card):
+            start = time.perf_counter()
+            step()
+            app.processEvents()
+            times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return statistics.median(times), times[int(len(times) * 0.95)], times[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=200, help="Cards shown and flipped per widget")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ThemeManager(BenchSettings(), cache_dir=cache_dir).apply_theme()
+
+    cards = [
+        (f"Question {i}: what does the term number {i} mean?", f"Answer {i}: " + "an explanation " * (i % 20 + 1))
+        for i in range(args.cards)
+    ]
+
+    print(f"{args.cards} cards shown and flipped, ms per step (median / p95 / worst)\n")
+    for name, widget in (("repolish on change (before)", PolishingFlashcardWidget()),
+                         ("pre-styled faces (after)", FlashcardWidget(animate_flips=False))):
+        widget.resize(800, 500)
+        widget.show()
+        app.processEvents()
+        median, p95, worst = measure(app, widget, cards)
+        print(f"{name:<30} {median:7.3f} / {p95:7.3f} / {worst:7.3f}")
+        widget.close()
+
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
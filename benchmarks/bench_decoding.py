@@ -0,0 +1,64 @@
+# benchmarks/bench_decoding.py
+"""
+Micro-benchmark for decoding generate_flashcards responses.
+
+Compares the original ``response.json()`` + ``FlashCardResponse.from_dict``
+path against every decoder available in ``src.api.decoding``.
+
+Usage:
+    python -m benchmarks.bench_decoding [--cards 10000] [--repeat 20]
+"""
+import json
+import argparse
+import timeit
+from src.api.models import FlashCardResponse
+from src.api.decoding import DECODERS, DECODER_NAME
+
+
+def make_payload(num_cards: int) -> bytes:
+    """Build a response body with the given number of cards."""
+    data = {
+        'topic': "Benchmark topic",
+        'cards': [
+            {
+                'question': f"What is the answer to question number {i}?",
+                'answer': f"This is the fairly typical length answer to question number {i}."
+            }
+            for i in range(num_cards)
+        ],
+        'source_info': "Generated for benchmarking"
+    }
+    return json.dumps(data).encode('utf-8')
+
+
+def decode_baseline(content: bytes) -> FlashCardResponse:
+    """The decoding path used before the fast decoders were added."""
+    return FlashCardResponse.from_dict(json.loads(content))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10000, help="Cards per payload")
+    parser.add_argument("--repeat", type=int, default=20, help="Decodes per measurement")
+    args = parser.parse_args()
+
+    content = make_payload(args.cards)
+    print(f"Payload: {args.cards} cards, {len(content) / 1024:.0f} KiB")
+    print(f"Default decoder: {DECODER_NAME}\n")
+
+    candidates = {'baseline (json + from_dict)': decode_baseline}
+    candidates.update(DECODERS)
+
+    baseline_time = None
+    for name, decode in candidates.items():
+        # Sanity check that every path produces the same result
+        assert decode(content) == decode_baseline(content), name
+
+        best = min(timeit.repeat(lambda: decode(content), number=args.repeat, repeat=5)) / args.repeat
+        if baseline_time is None:
+            baseline_time = best
+        print(f"{name:<28} {best * 1000:8.2f} ms/decode  {baseline_time / best:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_error_handling.py
+"""
+Benchmark for the per-call overhead of ``handle_errors``.
+
+Times a trivial function called plainly and through ``handle_errors``, both
+when it returns and when it raises. The raising case is compared with the
+previous implementation, which formatted the stack trace on every caught
+exception even though it is only logged at debug level. Log records are
+discarded, so the numbers are what the decorator itself costs.
+
+Usage:
+    python -m benchmarks.bench_error_handling [--calls 1000000]
+"""
+import time
+import logging
+import argparse
+import functools
+import traceback
+from src.utils.error_handling import handle_errors, logger
+
+
+def legacy_handle_errors(log_exception=True):
+    """The previous handle_errors, without the dialog."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                error_msg = str(e)
+                error_type = type(e).__name__
+                stack_trace = traceback.format_exc()
+                if log_exception:
+                    logger.error("Error in %s: %s: %s", func.__name__, error_type, error_msg)
+                    logger.debug("Stack trace:\n%s", stack_trace)
+                return None
+        return wrapper
+    return decorator
+
+
+def work(value):
+    """Stand-in for a decorated storage method."""
+    return value + 1
+
+
+def failing_work(value):
+    """Stand-in for a decorated method that raises a few frames down."""
+    return {}[value]
+
+
+def per_call_ns(func, calls: int) -> float:
+    """Call ``func`` ``calls`` times and return nanoseconds per call."""
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000000, help="Calls per case (a tenth for raising calls)")
+    args = parser.parse_args()
+
+    # Discard the records: only the decorator's own cost is measured
+    app_logger = logging.getLogger("flashcards")
+    app_logger.handlers = [logging.NullHandler()]
+    app_logger.propagate = False
+    app_logger.setLevel(logging.INFO)
+
+    decorated = handle_errors(show_dialog=False)(work)
+    baseline = per_call_ns(work, args.calls)
+    print(f"{args.calls} calls per case\n")
+    print(f"{'plain call':<38} {baseline:8.0f} ns/call")
+    print(f"{'handle_errors':<38} {per_call_ns(decorated, args.calls):8.0f} ns/call")
+
+    failing_calls = max(1, args.calls // 10)
+    print(f"\nRaising calls ({failing_calls} per case)\n")
+    cases = [
+        ("previous handle_errors", legacy_handle_errors()(failing_work)),
+        ("handle_errors", handle_errors(show_dialog=False)(failing_work)),
+    ]
+    for level_name, level in (("INFO", logging.INFO), ("DEBUG", logging.DEBUG)):
+        app_logger.setLevel(level)
+        for name, func in cases:
+            label = f"{name}, {level_name} logging"
+            print(f"{label:<38} {per_call_ns(func, failing_calls):8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
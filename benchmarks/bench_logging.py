@@ -0,0 +1,99 @@
+# benchmarks/bench_logging.py
+"""
+Benchmark for the per-call overhead of logging.
+
+Compares a logger writing to a RotatingFileHandler directly (how
+``setup_logger`` used to be wired) with the queue-based pipeline, where the
+calling thread only enqueues the record and a QueueListener thread writes
+it. Each is measured for enabled and disabled (below the logger level)
+calls, with f-string and lazy %-style messages. For the queue the time is
+what the calling thread spends; the records are written afterwards.
+
+Usage:
+    python -m benchmarks.bench_logging [--calls 100000]
+"""
+import os
+import time
+import queue
+import shutil
+import logging
+import argparse
+import tempfile
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+def make_file_handler(path: str) -> RotatingFileHandler:
+    """Create the file handler configured by setup_logger."""
+    handler = RotatingFileHandler(path, maxBytes=5 * 1024 * 1024, backupCount=3)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    return handler
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """Create an isolated INFO logger with a single handler."""
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def run_calls(logger: logging.Logger, calls: int, level: int, lazy: bool):
+    """
+    Make log calls shaped like the storage query log.
+
+    Returns:
+        (mean, worst) microseconds per call
+    """
+    query = "SELECT * FROM study_sessions WHERE 1=1 AND deck_id = ? ORDER BY start_time DESC"
+    params = ["3b0403e0-959f-431b-8f04-eae592070157", 1792371300]
+    clock = time.perf_counter_ns
+    worst = 0
+    start = clock()
+    for _ in range(calls):
+        before = clock()
+        if lazy:
+            logger.log(level, "Executing query: %s with params: %s", query, params)
+        else:
+            logger.log(level, f"Executing query: {query} with params: {params}")
+        worst = max(worst, clock() - before)
+    return (clock() - start) / calls / 1000, worst / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100000, help="Log calls per case")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_logging_")
+    try:
+        direct_handler = make_file_handler(os.path.join(work_dir, "direct.log"))
+        direct = make_logger("direct", direct_handler)
+        queued_handler = make_file_handler(os.path.join(work_dir, "queued.log"))
+        log_queue = queue.SimpleQueue()
+        queued = make_logger("queued", QueueHandler(log_queue))
+
+        print(f"{args.calls} calls per case, microseconds per call (mean / worst)\n")
+        print(f"{'':<28} {'f-string':>18} {'%-style':>18}")
+        for name, logger in (("direct file handler", direct), ("queue handler", queued)):
+            for level_name, level in (("enabled", logging.INFO), ("disabled", logging.DEBUG)):
+                results = []
+                for lazy in (False, True):
+                    results.append(run_calls(logger, args.calls, level, lazy))
+                    # Write the queued records after the calls: in a tight loop the
+                    # writer thread would compete for the GIL with the measured calls
+                    listener = QueueListener(log_queue, queued_handler)
+                    listener.start()
+                    listener.stop()
+                cells = " ".join(f"{mean:8.2f} /{worst:8.0f}" for mean, worst in results)
+                print(f"{name + ', ' + level_name:<28} {cells}")
+
+        direct_handler.close()
+        queued_handler.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_models.py
+"""
+Memory benchmark for the data models.
+
+Loads synthetic card rows (shaped like the rows SQLiteStorage reads) into
+the original eagerly parsed ``@dataclass`` cards and into the slotted
+``src.data.models.Flashcard``, and reports the memory retained per card
+and the load time.
+
+Usage:
+    python -m benchmarks.bench_models [--cards 100000]
+"""
+import gc
+import time
+import uuid
+import argparse
+import datetime
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Optional
+from src.data.models import Flashcard
+
+
+@dataclass
+class LegacyFlashcard:
+    """The Flashcard model before it was slotted, parsing timestamps on load."""
+    id: str
+    question: str
+    answer: str
+    topic: str
+    created_at: datetime.datetime
+    last_reviewed: Optional[datetime.datetime] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LegacyFlashcard':
+        created_at = data['created_at']
+        if isinstance(created_at, str):
+            created_at = datetime.datetime.fromisoformat(created_at)
+
+        last_reviewed = data.get('last_reviewed')
+        if isinstance(last_reviewed, str) and last_reviewed:
+            last_reviewed = datetime.datetime.fromisoformat(last_reviewed)
+
+        return cls(
+            id=data['id'],
+            question=data['question'],
+            answer=data['answer'],
+            topic=data['topic'],
+            created_at=created_at,
+            last_reviewed=last_reviewed
+        )
+
+
+def make_rows(num_cards: int, num_topics: int = 20):
+    """Build card rows; every string is a separate object, as when read from SQLite."""
+    now = datetime.datetime.now()
+    return [
+        {
+            'id': str(uuid.uuid4()),
+            'question': f"What is the answer to question number {i}?",
+            'answer': f"This is the fairly typical length answer to question number {i}.",
+            'topic': f"Topic {i % num_topics}",
+            'created_at': (now - datetime.timedelta(minutes=i)).isoformat(),
+            'last_reviewed': (now - datetime.timedelta(seconds=i)).isoformat() if i % 2 else None
+        }
+        for i in range(num_cards)
+    ]
+
+
+def measure(model, num_cards: int, touch_timestamps: bool = False):
+    """
+    Load cards and measure what they retain once the rows are gone.
+
+    Returns:
+        (bytes per card, load milliseconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    rows = make_rows(num_cards)
+    start = time.perf_counter()
+    cards = [model.from_dict(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    if touch_timestamps:
+        for card in cards:
+            card.created_at, card.last_reviewed
+    del rows
+    gc.collect()
+
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del cards
+    return retained / num_cards, elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100000, help="Cards to load")
+    args = parser.parse_args()
+
+    print(f"{args.cards} cards (load times include tracemalloc overhead)\n")
+    cases = [
+        ("before: @dataclass, eager parsing", LegacyFlashcard, False),
+        ("after: slotted, timestamps unread", Flashcard, False),
+        ("after: slotted, timestamps read", Flashcard, True)
+    ]
+    for name, model, touch in cases:
+        per_card, load_ms = measure(model, args.cards, touch)
+        print(f"{name:<36} {per_card:8.1f} bytes/card  {load_ms:8.1f} ms load")
+
+
+if __name__ == "__main__":
+    main()
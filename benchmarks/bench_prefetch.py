@@ -0,0 +1,99 @@
+# benchmarks/bench_prefetch.py
+"""
+Benchmark for advancing through cards with and without prefetching.
+
+Times showing each card of a session in FlashcardWidget, including the
+layout and painting it causes, once laying out the text on the spot (as
+without prefetching) and once with faces rendered ahead of time by
+``render_face``, which is what CardPrefetcher does on a worker thread.
+Plain and rich-text cards are measured separately, as is the render time
+that moves off the GUI thread.
+
+Usage:
+    python -m benchmarks.bench_prefetch [--cards 200]
+"""
+import os
+import time
+import argparse
+import tempfile
+import statistics
+from PyQt6.QtWidgets import QApplication
+from src.core.prefetch import render_face
+from src.ui.theme import ThemeManager
+from src.ui.widgets.flashcard_widget import FlashcardWidget
+from benchmarks.bench_theme import BenchSettings
+
+
+def make_cards(count: int, rich: bool):
+    """Build cards with answers of varying length."""
+    cards = []
+    for i in range(count):
+        if rich:
+            question = f"<b>Question {i}</b>: what does <i>term {i}</i> mean?" + "<p>Some <code>context</code>.</p>" * (i % 5)
+            answer = f"<h3>Answer {i}</h3>" + "<p>An <b>explanation</b> of the idea.</p>" * (i % 30 + 5)
+        else:
+            question = f"Question {i}: what does term {i} mean? " + "Some context. " * (i % 5)
+            answer = f"Answer {i}: " + "An explanation of the idea. " * (i % 30 + 5)
+        cards.append((question, answer))
+    return cards
+
+
+def summarize(times):
+    """Get (median, p95) in milliseconds."""
+    times = sorted(times)
+    return statistics.median(times) * 1000, times[int(len(times) * 0.95)] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=200, help="Cards per case")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    with tempfile.TemporaryDirectory() as cache_dir:
+        ThemeManager(BenchSettings(), cache_dir=cache_dir).apply_theme()
+
+    widget = FlashcardWidget(animate_flips=False)
+    widget.resize(800, 500)
+    widget.show()
+    app.processEvents()
+    question_style, answer_style = widget.face_styles()
+
+    print(f"{args.cards} cards per case, ms per card shown (median / p95)\n")
+    for kind, rich in (("plain", False), ("rich text", True)):
+        cards = make_cards(args.cards, rich)
+
+        text_times = []
+        for question, answer in cards:
+            start = time.perf_counter()
+            widget.set_card(question, answer)
+            app.processEvents()
+            text_times.append(time.perf_counter() - start)
+
+        render_times = []
+        rendered = []
+        for question, answer in cards:
+            start = time.perf_counter()
+            rendered.append((render_face(question, question_style), render_face(answer, answer_style)))
+            render_times.append(time.perf_counter() - start)
+
+        image_times = []
+        for (question, answer), (question_image, answer_image) in zip(cards, rendered):
+            start = time.perf_counter()
+            widget.set_card(question, answer, question_image, answer_image)
+            app.processEvents()
+            image_times.append(time.perf_counter() - start)
+
+        for name, times in (("laid out when shown", text_times),
+                            ("prefetched", image_times),
+                            ("render both faces (worker)", render_times)):
+            median, p95 = summarize(times)
+            print(f"{kind + ', ' + name:<38} {median:7.3f} / {p95:7.3f}")
+
+    widget.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
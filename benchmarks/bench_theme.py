@@ -0,0 +1,100 @@
+# benchmarks/bench_theme.py
+"""
+Benchmark for compiling and switching themes.
+
+Measures building the stylesheet from the QSS sources (the path every theme
+switch took before compiled themes were cached), loading a compiled theme
+from the disk cache at startup, and switching themes with a warm cache.
+
+Usage:
+    python -m benchmarks.bench_theme [--widgets 300] [--repeat 20]
+"""
+import os
+import argparse
+import tempfile
+import statistics
+import time
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit
+from src.ui.theme import ThemeManager
+
+
+class BenchSettings:
+    """Minimal in-memory stand-in for Settings."""
+
+    def __init__(self):
+        self.data = {"theme": "light"}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+def build_window(num_widgets: int) -> QWidget:
+    """Build a window with a mix of styled widgets so switches have work to do."""
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    for i in range(num_widgets):
+        widget = (QPushButton, QLabel, QLineEdit)[i % 3](f"Widget {i}")
+        layout.addWidget(widget)
+    window.show()
+    return window
+
+
+def measure(func, repeat: int) -> float:
+    """Get the median time of ``repeat`` calls in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--widgets", type=int, default=300, help="Widgets in the test window")
+    parser.add_argument("--repeat", type=int, default=20, help="Measurements per case")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    window = build_window(args.widgets)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        settings = BenchSettings()
+        manager = ThemeManager(settings, cache_dir=cache_dir)
+        themes = iter(["light", "dark"] * args.repeat)
+
+        def compile_uncached():
+            manager.get_stylesheet("dark", use_cache=False)
+
+        def switch_uncached():
+            theme = next(themes)
+            app.setStyleSheet(manager.get_stylesheet(theme, use_cache=False)[1])
+
+        def load_from_disk():
+            ThemeManager(settings, cache_dir=cache_dir).get_stylesheet("dark")
+
+        def switch_cached():
+            settings.set("theme", next(themes))
+            manager.apply_theme()
+
+        # Populate the disk cache for both themes
+        manager.get_stylesheet("light")
+        manager.get_stylesheet("dark")
+
+        print(f"Window with {args.widgets} widgets, median of {args.repeat}\n")
+        print(f"{'compile stylesheet (no cache)':<36} {measure(compile_uncached, args.repeat):8.2f} ms")
+        print(f"{'load compiled stylesheet from disk':<36} {measure(load_from_disk, args.repeat):8.2f} ms")
+        print(f"{'theme switch, before (recompile)':<36} {measure(switch_uncached, args.repeat):8.2f} ms")
+        themes = iter(["light", "dark"] * args.repeat)
+        print(f"{'theme switch, after (cached)':<36} {measure(switch_cached, args.repeat):8.2f} ms")
+
+    window.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
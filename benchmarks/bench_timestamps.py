@@ -0,0 +1,174 @@
+# benchmarks/bench_timestamps.py
+"""
+Benchmark for date range queries on the study history.
+
+Builds a database in the version 0 schema (ISO text timestamps, no
+indexes) with a synthetic history, times the old string range queries on
+it, migrates a copy by opening it with ``SQLiteStorage`` and times the
+integer epoch range queries and the storage methods the History view uses.
+
+Usage:
+    python -m benchmarks.bench_timestamps [--sessions 200000] [--cards 200000] [--days 730]
+"""
+import os
+import time
+import uuid
+import random
+import shutil
+import sqlite3
+import argparse
+import datetime
+import tempfile
+from src.data.storage import SQLiteStorage, local_midnight
+
+LEGACY_SCHEMA = '''
+CREATE TABLE decks (
+    id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT,
+    created_at TEXT NOT NULL, last_studied TEXT
+);
+CREATE TABLE flashcards (
+    id TEXT PRIMARY KEY, deck_id TEXT NOT NULL, question TEXT NOT NULL,
+    answer TEXT NOT NULL, topic TEXT NOT NULL, created_at TEXT NOT NULL, last_reviewed TEXT,
+    FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+);
+CREATE TABLE study_sessions (
+    id TEXT PRIMARY KEY, deck_id TEXT NOT NULL, start_time TEXT NOT NULL, end_time TEXT,
+    cards_studied INTEGER DEFAULT 0, cards_correct INTEGER DEFAULT 0,
+    FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+);
+'''
+
+
+def build_legacy_db(path: str, num_sessions: int, num_cards: int, days: int, num_decks: int = 20):
+    """Write a version 0 database with ISO text timestamps spread over ``days`` days."""
+    rng = random.Random(42)
+    now = datetime.datetime.now()
+    span = days * 86400
+
+    def timestamp():
+        return now - datetime.timedelta(seconds=rng.random() * span)
+
+    deck_ids = [str(uuid.uuid4()) for _ in range(num_decks)]
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO decks VALUES (?, ?, ?, ?, ?)",
+        [(deck_id, f"Deck {i}", "", timestamp().isoformat(), now.isoformat())
+         for i, deck_id in enumerate(deck_ids)]
+    )
+    conn.executemany(
+        "INSERT INTO flashcards VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(str(uuid.uuid4()), rng.choice(deck_ids), f"Question {i}", f"Answer {i}", f"Topic {i % 50}",
+          timestamp().isoformat(), timestamp().isoformat() if i % 3 else None)
+         for i in range(num_cards)]
+    )
+    sessions = []
+    for _ in range(num_sessions):
+        start = timestamp()
+        studied = rng.randint(1, 40)
+        sessions.append((
+            str(uuid.uuid4()), rng.choice(deck_ids), start.isoformat(),
+            (start + datetime.timedelta(seconds=rng.randint(30, 1800))).isoformat(),
+            studied, rng.randint(0, studied)
+        ))
+    conn.executemany("INSERT INTO study_sessions VALUES (?, ?, ?, ?, ?, ?)", sessions)
+    conn.commit()
+    conn.close()
+    return deck_ids
+
+
+def timed(func, *args, repeat: int = 5):
+    """Run ``func`` ``repeat`` times and return (last result, best milliseconds)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def query(path: str, sql: str, params):
+    """Run a query on a fresh connection, as the storage layer does."""
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+def row_count(result) -> int:
+    """Get the number of matching rows from a COUNT(*) or a SELECT * result."""
+    if len(result) == 1 and len(result[0]) == 1:
+        return result[0][0]
+    return len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200000, help="Synthetic study sessions")
+    parser.add_argument("--cards", type=int, default=200000, help="Synthetic flashcards")
+    parser.add_argument("--days", type=int, default=730, help="Days of history")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="bench_timestamps_")
+    legacy_path = os.path.join(work_dir, "legacy.db")
+    migrated_path = os.path.join(work_dir, "migrated.db")
+    try:
+        deck_ids = build_legacy_db(legacy_path, args.sessions, args.cards, args.days)
+        shutil.copyfile(legacy_path, migrated_path)
+        print(f"{args.sessions} sessions, {args.cards} cards over {args.days} days\n")
+
+        end_date = datetime.date.today()
+        start_date = end_date - datetime.timedelta(days=30)
+        deck_id = deck_ids[0]
+        iso_range = (start_date.isoformat() + " 00:00:00", end_date.isoformat() + " 23:59:59")
+        epoch_range = (local_midnight(start_date), local_midnight(end_date + datetime.timedelta(days=1)))
+
+        cases = [
+            ("sessions in range",
+             "SELECT COUNT(*) FROM study_sessions WHERE start_time >= ? AND start_time <= ?",
+             "SELECT COUNT(*) FROM study_sessions WHERE start_time >= ? AND start_time < ?", ()),
+            ("deck sessions in range",
+             "SELECT * FROM study_sessions WHERE deck_id = ? AND start_time >= ? AND start_time <= ? "
+             "ORDER BY start_time DESC",
+             "SELECT * FROM study_sessions WHERE deck_id = ? AND start_time >= ? AND start_time < ? "
+             "ORDER BY start_time DESC, rowid DESC", (deck_id,)),
+            ("deck cards reviewed in range",
+             "SELECT COUNT(*) FROM flashcards WHERE deck_id = ? AND last_reviewed >= ? AND last_reviewed <= ?",
+             "SELECT COUNT(*) FROM flashcards WHERE deck_id = ? AND last_reviewed >= ? AND last_reviewed < ?",
+             (deck_id,)),
+        ]
+
+        legacy_times = []
+        for name, legacy_sql, _, prefix in cases:
+            legacy_result, legacy_ms = timed(query, legacy_path, legacy_sql, prefix + iso_range)
+            legacy_times.append((legacy_result, legacy_ms))
+
+        start = time.perf_counter()
+        storage = SQLiteStorage(migrated_path)
+        migrate_ms = (time.perf_counter() - start) * 1000
+        print(f"{'migration to schema version 1':<42} {migrate_ms:9.1f} ms\n")
+
+        # Rows are reported as well: isoformat() separates the time with 'T', so
+        # the old text comparison against '<end date> 23:59:59' missed the end date
+        print(f"{'query':<32} {'ISO text':>12} {'epoch+index':>12}")
+        for (name, _, epoch_sql, prefix), (legacy_result, legacy_ms) in zip(cases, legacy_times):
+            epoch_result, epoch_ms = timed(query, migrated_path, epoch_sql, prefix + epoch_range)
+            print(f"{name:<32} {legacy_ms:9.2f} ms {epoch_ms:9.2f} ms"
+                  f"  (rows {row_count(legacy_result)} / {row_count(epoch_result)})")
+
+        print()
+        methods = [
+            ("get_study_sessions (deck, 30d)", storage.get_study_sessions, deck_id, start_date, end_date),
+            ("get_session_rows (all, 30d)", storage.get_session_rows, None, start_date, end_date),
+            ("get_deck_stats (30d)", storage.get_deck_stats, deck_id, start_date, end_date),
+        ]
+        for name, method, *method_args in methods:
+            _, method_ms = timed(method, *method_args)
+            print(f"{name:<32} {method_ms:22.2f} ms")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
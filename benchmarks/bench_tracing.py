@@ -0,0 +1,70 @@
+# benchmarks/bench_tracing.py
+"""
+Benchmark for the overhead of the tracing hooks.
+
+Times a trivial function called plainly, through ``traced`` with tracing
+disabled and enabled, and a ``trace_span`` block, to show what an
+instrumented call costs on top of the work it does.
+
+Usage:
+    python -m benchmarks.bench_tracing [--calls 1000000]
+"""
+import time
+import argparse
+from src.utils import tracing
+from src.utils.tracing import traced, trace_span
+
+
+def work(value):
+    """Stand-in for an instrumented function."""
+    return value + 1
+
+
+traced_work = traced(category="bench")(work)
+
+
+def spanned_work(value):
+    """``work`` wrapped in a trace_span block."""
+    with trace_span("spanned_work", "bench"):
+        return value + 1
+
+
+def per_call_ns(func, calls: int) -> float:
+    """Call ``func`` ``calls`` times and return nanoseconds per call."""
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000000, help="Calls per case")
+    args = parser.parse_args()
+
+    baseline = per_call_ns(work, args.calls)
+    results = [("plain call", baseline)]
+
+    tracing.disable_tracing()
+    results.append(("traced, disabled", per_call_ns(traced_work, args.calls)))
+    results.append(("trace_span, disabled", per_call_ns(spanned_work, args.calls)))
+
+    tracing.enable_tracing()
+    results.append(("traced, enabled", per_call_ns(traced_work, args.calls)))
+    results.append(("trace_span, enabled", per_call_ns(spanned_work, args.calls)))
+    tracing.disable_tracing()
+
+    print(f"{args.calls} calls per case\n")
+    for name, ns in results:
+        print(f"{name:<24} {ns:8.0f} ns/call  (+{ns - baseline:6.0f} ns)")
+
+    start = time.perf_counter()
+    stats = tracing.recorder.stats()
+    stats_ms = (time.perf_counter() - start) * 1000
+    print(f"\nPercentiles over a full ring buffer ({len(tracing.recorder.spans)} spans): {stats_ms:.1f} ms")
+    for item in stats:
+        print(f"  {item.name:<22} p50 {item.p50 * 1e6:6.0f} ns  p95 {item.p95 * 1e6:6.0f} ns  p99 {item.p99 * 1e6:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,161 @@
 # src/api/client.py
-import httpx
 from typing import Optional
 from urllib.parse import urljoin
 import asyncio
+import math
 from src.api.models import FlashCardRequest, FlashCardResponse
+from src.api.decoding import decode_response, build_response
+from src.api.retry import RetryPolicy, CircuitBreaker, APIError, CircuitOpenError, parse_retry_after
+from src.data.cache import ResponseCache
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
+from src.utils.tracing import traced, trace_span
 
 class APIClient:
     """Client for communicating with the backend flashcard API."""
     
-    def __init__(self, base_url: str = "http://localhost:8000", timeout = 60.0):
+    def __init__(self, base_url: str = "http://localhost:8000", timeout = 60.0, cache: Optional[ResponseCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None, circuit_breaker: Optional[CircuitBreaker] = None):
         self.base_url = base_url
         self.logger = get_logger(__name__)
         # Longer timeout since generation can take time
         self.timeout = timeout
+        # Optional on-disk cache of previous generation responses
+        self.cache = cache
+        # Retry transient failures, but fail fast while the server is down
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
     
-    @handle_errors(show_dialog=False, log_exception=True)
-    async def generate_flashcards(self, topic: str, num_questions: int = 10, additional_notes: str = "") -> Optional[FlashCardResponse]:
+    @traced(category="api")
+    async def generate_flashcards(self, topic: str, num_questions: int = 10, additional_notes: str = "", use_cache: bool = True) -> Optional[FlashCardResponse]:
         """
         Generate flashcards for a topic using the API.
         
         Args:
             topic: The topic to generate flashcards for
             num_questions: Number of flashcards to generate (1-50)
+            additional_notes: Optional notes to steer the generation
+            use_cache: Whether a cached response for the same request may be returned
             
         Returns:
             FlashCardResponse object containing the generated flashcards
+            
+        Raises:
+            APIError: If the request failed after all retries or the circuit is open
         """
-        self.logger.info(f"Generating flashcards for topic: {topic}")
+        self.logger.info("Generating flashcards for topic: %s", topic)
         
         # Create request
         request = FlashCardRequest(topic=topic, num_questions=num_questions, additional_notes=additional_notes)
+        payload = request.to_dict()
         url = urljoin(self.base_url, "/generate_flashcards")
+        # Cached responses are only reused for the server that generated them
+        cache_payload = {**payload, 'base_url': self.base_url}
+        
+        # Serve repeated requests from the cache when allowed
+        if self.cache and use_cache:
+            cached = self.cache.get(cache_payload)
+            if cached:
+                self.logger.info("Serving flashcards for '%s' from cache", topic)
+                response = build_response(cached)
+                response.from_cache = True
+                return response
+        
+        # httpx is slow to import, so load it on the first request instead of at startup
+        import httpx
         
         # Make the API call
         async with httpx.AsyncClient() as client:
-            self.logger.debug(f"Making API request to {url}")
+            self.logger.debug("Making API request to %s", url)
             
-            response = await client.post(
-                url,
-                json=request.to_dict(),
-                timeout=self.timeout
-            )
+            response = await self._post_with_retry(client, url, payload)
+            
+            # Decode and validate the body straight into the response model
+            response = decode_response(response.content)
+            self.logger.info("Received response with %s cards", len(response.cards))
+            
+            # Remember the response for identical requests (refreshes bypassed entries too)
+            if self.cache and response.cards:
+                self.cache.put(cache_payload, response.to_dict())
+            
+            return response
+    
+    async def _post_with_retry(self, client, url: str, payload: dict):
+        """
+        POST to the API, retrying transient failures with exponential backoff.
+        
+        Transport failures (refused or dropped connections, connect timeouts)
+        and overload statuses (429/502/503/504) are retried; read timeouts are
+        not, since the server may still be working on the request and retrying
+        would multiply the wait. Every attempt reports its outcome to the
+        circuit breaker, including cancelled ones.
+        """
+        import httpx
+        
+        policy = self.retry_policy
+        attempt = 0
+        
+        while True:
+            if not self.circuit_breaker.allow_request():
+                # Nothing is left to wait for while a trial request is in flight
+                retry_in = math.ceil(self.circuit_breaker.retry_in())
+                wait = f"in {retry_in} seconds" if retry_in > 0 else "in a moment"
+                raise CircuitOpenError(
+                    f"The flashcard server is not responding. Please try again {wait}."
+                )
             
-            # Raise an exception for HTTP errors
-            response.raise_for_status()
+            retry_after = None
+            try:
+                # One span per attempt, so retries show up separately from the whole call
+                with trace_span("APIClient.post", "api"):
+                    response = await client.post(url, json=payload, timeout=self.timeout)
+            except httpx.TransportError as e:
+                self.circuit_breaker.record_failure()
+                if isinstance(e, httpx.TimeoutException) and not isinstance(e, httpx.ConnectTimeout):
+                    raise APIError(
+                        "The request to the flashcard server timed out. "
+                        "This might be due to network issues or high server load."
+                    ) from e
+                failure = f"Could not connect to the flashcard server ({type(e).__name__})"
+            except BaseException:
+                # Cancelled, or failed before reaching the server: says nothing about
+                # its health, but a half-open circuit must not wait for this trial
+                self.circuit_breaker.release_trial()
+                raise
+            else:
+                if response.is_success:
+                    self.circuit_breaker.record_success()
+                    return response
+                
+                if not policy.is_retryable_status(response.status_code):
+                    # The server is up and rejected the request - retrying won't help.
+                    # A rejection is no failure of the server, but no proof the
+                    # generation works either, so a trial request is only released.
+                    self.circuit_breaker.release_trial()
+                    raise APIError(
+                        f"The flashcard server rejected the request "
+                        f"({response.status_code} {response.reason_phrase})."
+                    )
+                
+                self.circuit_breaker.record_failure()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                failure = f"The flashcard server is busy ({response.status_code} {response.reason_phrase})"
             
-            # Parse response
-            data = response.json()
-            self.logger.info(f"Received response with {len(data.get('cards', []))} cards")
+            if attempt >= policy.max_retries:
+                raise APIError(f"{failure}. Gave up after {attempt + 1} attempts.")
             
-            # Convert to model
-            return FlashCardResponse.from_dict(data)
+            if retry_after is not None and retry_after > policy.max_retry_after:
+                raise APIError(f"{failure}. The server asked to retry in {retry_after:.0f} seconds.")
+            
+            delay = policy.compute_delay(attempt, retry_after)
+            attempt += 1
+            self.logger.warning(
+                "%s; retrying in %.1fs (attempt %s of %s)", failure, delay, attempt, policy.max_retries
+            )
+            await asyncio.sleep(delay)
     
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="api")
     async def test_connection(self) -> bool:
         """
         Test the connection to the API server.
@@ -65,9 +166,10 @@ class APIClient:
         try:
             url = urljoin(self.base_url, "/docs")  # FastAPI docs page is always available
             
+            import httpx
             async with httpx.AsyncClient() as client:
                 response = await client.get(url, timeout=5.0)
                 return response.status_code == 200
         except Exception as e:
-            self.logger.error(f"API connection test failed: {str(e)}")
+            self.logger.error("API connection test failed: %s", e)
             return False
\ No newline at end of file
@@ -0,0 +1,131 @@
+# src/api/decoding.py
+import json
+from typing import Any, Callable, Dict, List, Optional
+from src.api.models import FlashCardPair, FlashCardResponse
+from src.api.retry import APIError
+
+# Optional fast JSON libraries, used when installed (pip install .[fast])
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ResponseValidationError(APIError):
+    """Raised when an API response is not valid JSON or lacks required fields."""
+
+
+def build_response(data: Any) -> FlashCardResponse:
+    """
+    Validate decoded JSON and build a FlashCardResponse from it.
+
+    Raises:
+        ResponseValidationError: If a required field is missing or has the wrong type
+    """
+    if not isinstance(data, dict):
+        raise ResponseValidationError("Invalid response from the flashcard server: expected a JSON object")
+
+    topic = data.get('topic')
+    if not isinstance(topic, str):
+        raise ResponseValidationError("Invalid response from the flashcard server: missing 'topic'")
+
+    cards_data = data.get('cards', [])
+    if not isinstance(cards_data, list):
+        raise ResponseValidationError("Invalid response from the flashcard server: 'cards' must be a list")
+
+    source_info = data.get('source_info')
+    if source_info is not None and not isinstance(source_info, str):
+        raise ResponseValidationError("Invalid response from the flashcard server: 'source_info' must be a string")
+
+    cards = []
+    append = cards.append
+    for index, card in enumerate(cards_data):
+        try:
+            question = card['question']
+            answer = card['answer']
+        except (KeyError, TypeError):
+            raise ResponseValidationError(
+                f"Invalid response from the flashcard server: card {index} needs a question and an answer"
+            ) from None
+        if type(question) is not str or type(answer) is not str:
+            raise ResponseValidationError(
+                f"Invalid response from the flashcard server: card {index} has a non-text question or answer"
+            )
+        append(FlashCardPair(question, answer))
+
+    return FlashCardResponse(topic=topic, cards=cards, source_info=source_info)
+
+
+def _decode_stdlib(content: bytes) -> FlashCardResponse:
+    """Decode with the standard library json module."""
+    try:
+        data = json.loads(content)
+    except ValueError as e:
+        raise ResponseValidationError(f"Invalid JSON from the flashcard server: {e}") from e
+    return build_response(data)
+
+
+def _decode_orjson(content: bytes) -> FlashCardResponse:
+    """Decode with orjson, then validate in Python."""
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError as e:
+        raise ResponseValidationError(f"Invalid JSON from the flashcard server: {e}") from e
+    return build_response(data)
+
+
+if msgspec is not None:
+    class _ResponseStruct(msgspec.Struct):
+        """
+        The response fields ``build_response`` accepts, with the same rules.
+
+        ``cards`` defaults to an empty list and unknown keys, including the
+        client-only ``from_cache``, are ignored.
+        """
+        topic: str
+        cards: List[FlashCardPair] = []
+        source_info: Optional[str] = None
+
+    # Decodes and validates straight into the cards' dataclasses in a single pass
+    _msgspec_decoder = msgspec.json.Decoder(_ResponseStruct)
+
+
+def _decode_msgspec(content: bytes) -> FlashCardResponse:
+    """Decode and validate with msgspec."""
+    try:
+        data = _msgspec_decoder.decode(content)
+        return FlashCardResponse(topic=data.topic, cards=data.cards, source_info=data.source_info)
+    except msgspec.ValidationError as e:
+        raise ResponseValidationError(f"Invalid response from the flashcard server: {e}") from e
+    except msgspec.DecodeError as e:
+        raise ResponseValidationError(f"Invalid JSON from the flashcard server: {e}") from e
+
+
+# Available decoders, fastest first
+DECODERS: Dict[str, Callable[[bytes], FlashCardResponse]] = {}
+if msgspec is not None:
+    DECODERS['msgspec'] = _decode_msgspec
+if orjson is not None:
+    DECODERS['orjson'] = _decode_orjson
+DECODERS['json'] = _decode_stdlib
+
+DECODER_NAME = next(iter(DECODERS))
+_decode = DECODERS[DECODER_NAME]
+
+
+def decode_response(content: bytes) -> FlashCardResponse:
+    """
+    Decode a generate_flashcards response body into a FlashCardResponse.
+
+    Uses msgspec or orjson when installed and falls back to the standard
+    library otherwise; every path validates the required fields.
+
+    Raises:
+        ResponseValidationError: If the body is not a valid flashcard response
+    """
+    return _decode(content)
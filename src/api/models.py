@@ -44,6 +44,7 @@ class FlashCardResponse:
     topic: str
     cards: List[FlashCardPair]
     source_info: Optional[str] = None
+    from_cache: bool = field(default=False, compare=False)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FlashCardResponse':
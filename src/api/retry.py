@@ -0,0 +1,181 @@
+# src/api/retry.py
+import time
+import random
+import threading
+import email.utils
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from src.utils.logger import get_logger
+
+
+class APIError(Exception):
+    """Raised when a request to the flashcard API fails with a user-facing message."""
+
+
+class CircuitOpenError(APIError):
+    """Raised without contacting the server while the circuit breaker is open."""
+
+
+@dataclass
+class RetryPolicy:
+    """Configuration for retrying transient API failures."""
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    jitter: float = 0.5
+    max_retry_after: float = 120.0
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Check whether an HTTP status indicates a transient failure."""
+        return status_code in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+
+        # Randomize part of the delay so concurrent clients don't retry in lockstep
+        if self.jitter:
+            delay = delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+        # The server knows best when it will be ready again
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """
+    Fails fast once the backend has failed repeatedly.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are rejected for ``reset_timeout`` seconds. The first request
+    after that is let through as a trial: success closes the circuit again,
+    failure re-opens it. A trial that ends without telling anything about the
+    server (cancelled, or rejected as a bad request) is released so the next
+    request becomes the trial, and one that never reports back re-opens the
+    circuit after ``trial_timeout`` seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, trial_timeout: float = 120.0):
+        self.logger = get_logger("circuit_breaker")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trial_timeout = trial_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        # When the half-open trial request was let through, None while no trial is in flight
+        self._trial_started = None
+
+    @property
+    def state(self) -> str:
+        """Get the current circuit state."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the server right now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                if self._trial_started is None:
+                    # The previous trial was released without an outcome
+                    self._trial_started = now
+                    return True
+                if now - self._trial_started >= self.trial_timeout:
+                    self.logger.warning("Trial request never reported back; circuit open again")
+                    self._open(now)
+                return False
+
+            if now - self._opened_at >= self.reset_timeout:
+                # Let a single trial request through
+                self._state = self.HALF_OPEN
+                self._trial_started = now
+                self.logger.info("Circuit half-open, sending trial request")
+                return True
+
+            return False
+
+    def retry_in(self) -> float:
+        """Get the seconds remaining until the circuit allows a trial request (0 unless it is open)."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                self.logger.info("Circuit closed, API server is responding again")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_started = None
+
+    def release_trial(self) -> None:
+        """
+        Record a request that ended without showing whether the server works.
+
+        Used for cancelled requests and client errors: nothing is counted,
+        but a half-open circuit lets the next request through as the trial.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed request and open the circuit if the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.logger.warning(
+                        f"Circuit opened after {self._failures} consecutive failures; "
+                        f"failing fast for {self.reset_timeout:.0f}s"
+                    )
+                self._open(time.monotonic())
+
+    def _open(self, now: float) -> None:
+        """Open the circuit (called with the lock held)."""
+        self._state = self.OPEN
+        self._opened_at = now
+        self._trial_started = None
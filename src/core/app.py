@@ -1,9 +1,12 @@
 import os
 import sys
 from PyQt6.QtWidgets import QMainWindow, QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+from src.core.startup import StartupTimer
+from src.core.events import EventBus
 from src.ui.mainwindow import MainWindow
-from src.utils.logger import setup_logger, get_logger
+from src.utils.logger import setup_logger, get_logger, configure_log_levels, shutdown_logging
+from src.utils.tracing import tracing_enabled, export_chrome_trace
 from src.core.settings import Settings
 from src.data.storage import SQLiteStorage
 
@@ -12,22 +15,33 @@ class FlashCardApp:
     Main application controller class that initializes and connects all components
     of the flashcard application.
     """
-    def __init__(self):
+    def __init__(self, startup_timer=None):
+        # Time each startup phase
+        self.startup_timer = startup_timer or StartupTimer()
+        
         # Set up logging first so we can track initialization
         self.logger = setup_logger()
         self.logger.info("Initializing FlashCard Application")
+        self.startup_timer.mark("logging")
         
         # Load application settings
         self.settings = Settings()
+        configure_log_levels(self.settings)
         self.logger.info("Settings loaded")
+        self.startup_timer.mark("settings")
+        
+        # Storage writes are announced to the views through the event bus
+        self.event_bus = EventBus()
         
         # Initialize data storage
-        self.storage = SQLiteStorage()
+        self.storage = SQLiteStorage(event_bus=self.event_bus)
         self.logger.info("Database storage initialized")
+        self.startup_timer.mark("storage")
         
         # Create main application window
         self.main_window = MainWindow(self.settings, self.storage)
         self.logger.info("Main window created")
+        self.startup_timer.mark("main window")
         
         # Connect application-level signals
         self._connect_signals()
@@ -39,20 +53,51 @@ class FlashCardApp:
         
         # Connect the aboutToQuit signal to our cleanup method
         app.aboutToQuit.connect(self.cleanup)
+        
+        # Load data only once the window is on screen
+        self.main_window.first_painted.connect(self._on_first_paint)
     
     def show(self):
         """Show the main application window"""
         self.main_window.show()
         self.logger.info("Main window displayed")
+        self.startup_timer.mark("show")
+    
+    def _on_first_paint(self):
+        """Record the first paint and schedule the deferred data loading."""
+        self.startup_timer.mark("first paint")
+        # Let the paint finish before touching storage
+        QTimer.singleShot(0, self._finish_startup)
+    
+    def _finish_startup(self):
+        """Load view data and report startup timing."""
+        self.main_window.load_deferred_data()
+        self.startup_timer.mark("interactive")
+        self.startup_timer.report()
+        
+        for phase, taken, allowed in self.startup_timer.over_budget():
+            self.logger.warning("Startup phase '%s' took %.0f ms (budget %.0f ms)", phase, taken, allowed)
+        
+        if self.startup_timer.profiling:
+            self.startup_timer.import_profiler.uninstall()
+            self.startup_timer.write_report()
     
     def cleanup(self):
         """Perform cleanup operations before the application exits"""
         self.logger.info("Application shutting down, performing cleanup")
         
-        # Save settings
-        self.settings.save()
+        # Write any settings changes still waiting for the flush timer
+        self.settings.close()
         
         # Close any open resources
         # (This would be where you'd close network connections, etc.)
+        self.main_window.shutdown()
+        
+        # Keep the performance trace of this run
+        if tracing_enabled():
+            export_chrome_trace()
+        
+        self.logger.info("Cleanup completed")
         
-        self.logger.info("Cleanup completed")
\ No newline at end of file
+        # Write out the queued log records
+        shutdown_logging()
\ No newline at end of file
@@ -0,0 +1,256 @@
+# src/core/batch.py
+import os
+import sys
+import csv
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional, Callable
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from src.data.models import Flashcard, FlashcardDeck
+from src.utils.logger import get_logger
+
+logger = get_logger("batch")
+
+# The API accepts between 1 and 50 questions per topic
+MIN_CARDS = 1
+MAX_CARDS = 50
+
+
+@dataclass
+class BatchTopic:
+    """A single topic to generate in a batch run."""
+    topic: str
+    num_cards: int = 10
+    additional_notes: str = ""
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch generation run."""
+    total: int
+    succeeded: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)  # (topic, error)
+    cards_created: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+    @property
+    def topics_per_minute(self) -> float:
+        """Get completed topics per minute of wall-clock time."""
+        return len(self.succeeded) / self.elapsed * 60 if self.elapsed > 0 else 0.0
+
+    @property
+    def cards_per_second(self) -> float:
+        """Get created cards per second of wall-clock time."""
+        return self.cards_created / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self, max_failures: int = 10) -> str:
+        """Get a human-readable summary of the run."""
+        lines = [
+            f"Generated {len(self.succeeded)} of {self.total} decks "
+            f"({self.cards_created} cards) in {self.elapsed:.1f}s.",
+            f"Throughput: {self.topics_per_minute:.1f} topics/min, {self.cards_per_second:.1f} cards/s."
+        ]
+        if self.cancelled:
+            lines.append("The batch was cancelled before all topics were processed.")
+        if self.failed:
+            lines.append(f"\n{len(self.failed)} topic(s) failed:")
+            for topic, error in self.failed[:max_failures]:
+                lines.append(f"• {topic}: {error}")
+            if len(self.failed) > max_failures:
+                lines.append(f"... and {len(self.failed) - max_failures} more (see log)")
+        return "\n".join(lines)
+
+
+def _parse_num_cards(value, default: int) -> int:
+    """Parse a card count, falling back to the default and clamping to the API limits."""
+    try:
+        num_cards = int(str(value).strip())
+    except (TypeError, ValueError):
+        num_cards = default
+    return max(MIN_CARDS, min(MAX_CARDS, num_cards))
+
+
+def parse_topic_file(path: str, default_num_cards: int = 10) -> List[BatchTopic]:
+    """
+    Read topics from a text or CSV file.
+
+    Text files hold one topic per line. CSV files hold ``topic, num_cards,
+    notes`` columns, where the last two are optional and a header row is
+    detected automatically. Blank lines and lines starting with ``#`` are
+    skipped in both formats.
+    """
+    topics = []
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if os.path.splitext(path)[1].lower() == ".csv":
+            for row in csv.reader(f):
+                if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                    continue
+                # Skip a header row
+                if not topics and row[0].strip().lower() == "topic":
+                    continue
+
+                topics.append(BatchTopic(
+                    topic=row[0].strip(),
+                    num_cards=_parse_num_cards(row[1] if len(row) > 1 else None, default_num_cards),
+                    additional_notes=row[2].strip() if len(row) > 2 else ""
+                ))
+        else:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    topics.append(BatchTopic(topic=line, num_cards=_parse_num_cards(None, default_num_cards)))
+
+    logger.info("Parsed %s topics from %s", len(topics), path)
+    return topics
+
+
+class BatchGenerator:
+    """
+    Generates decks for many topics through the API with bounded concurrency.
+
+    Finished decks are written to storage in chunks through the bulk
+    ``save_decks`` path rather than one transaction per deck.
+    """
+
+    def __init__(self, api_client, storage, max_concurrency: int = 3, write_chunk_size: int = 25,
+                 progress_callback: Optional[Callable[[int, int], None]] = None):
+        self.api_client = api_client
+        self.storage = storage
+        self.max_concurrency = max(1, max_concurrency)
+        self.write_chunk_size = max(1, write_chunk_size)
+        self.progress_callback = progress_callback
+
+    async def run(self, topics: List[BatchTopic]) -> BatchReport:
+        """Generate a deck for every topic and return a report."""
+        report = BatchReport(total=len(topics))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pending_decks = []
+        done = 0
+        start = time.perf_counter()
+
+        async def generate(item: BatchTopic):
+            nonlocal done
+            async with semaphore:
+                try:
+                    response = await self.api_client.generate_flashcards(
+                        item.topic, item.num_cards, item.additional_notes
+                    )
+                    if not response or not response.cards:
+                        raise ValueError("No flashcards were generated")
+
+                    deck = FlashcardDeck.create(
+                        name=response.topic,
+                        description=f"Flashcards about {response.topic}"
+                    )
+                    for card_data in response.cards:
+                        deck.add_card(Flashcard.create(
+                            question=card_data.question,
+                            answer=card_data.answer,
+                            topic=response.topic
+                        ))
+
+                    pending_decks.append(deck)
+                    report.succeeded.append(item.topic)
+                    report.cards_created += deck.card_count
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("Batch generation failed for '%s': %s", item.topic, e)
+                    report.failed.append((item.topic, str(e)))
+
+            done += 1
+            if len(pending_decks) >= self.write_chunk_size:
+                self._flush(pending_decks)
+            if self.progress_callback:
+                self.progress_callback(done, report.total)
+
+        try:
+            await asyncio.gather(*(generate(item) for item in topics))
+        except asyncio.CancelledError:
+            report.cancelled = True
+        finally:
+            # Keep whatever was generated before a cancellation
+            self._flush(pending_decks)
+            report.elapsed = time.perf_counter() - start
+
+        logger.info(
+            "Batch finished: %s/%s topics, %s cards, %s failures in %.1fs",
+            len(report.succeeded), report.total, report.cards_created, len(report.failed), report.elapsed
+        )
+        return report
+
+    def _flush(self, pending_decks: List[FlashcardDeck]) -> None:
+        """Write buffered decks to storage in one transaction."""
+        if not pending_decks:
+            return
+        if not self.storage.save_decks(pending_decks):
+            logger.error("Failed to save %s batch-generated decks", len(pending_decks))
+        pending_decks.clear()
+
+
+# Worker signals for background processing
+class BatchWorkerSignals(QObject):
+    """Signals for communicating from the batch worker thread."""
+    progress = pyqtSignal(int, int)  # done, total
+    finished = pyqtSignal(object)  # BatchReport
+    error = pyqtSignal(str)
+
+
+class BatchGenerationWorker(QRunnable):
+    """Worker that runs a batch generation in a background thread."""
+
+    def __init__(self, api_client, storage, topics: List[BatchTopic], max_concurrency: int = 3):
+        super().__init__()
+        self.topics = topics
+        self.signals = BatchWorkerSignals()
+        self.generator = BatchGenerator(
+            api_client, storage, max_concurrency,
+            progress_callback=self.signals.progress.emit
+        )
+
+        self._loop = None
+        self._task = None
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Stop the batch; decks generated so far are kept."""
+        self._cancel_requested = True
+        loop, task = self._loop, self._task
+        if loop and task and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    @pyqtSlot()
+    def run(self):
+        """Main worker function that runs in background thread."""
+        loop = None
+        try:
+            # Create a new event loop for the thread
+            if sys.platform == 'win32':
+                loop = asyncio.ProactorEventLoop()
+            else:
+                loop = asyncio.new_event_loop()
+
+            asyncio.set_event_loop(loop)
+
+            self._task = loop.create_task(self.generator.run(self.topics))
+            self._loop = loop
+
+            # Cancellation may have been requested before the task existed
+            if self._cancel_requested:
+                self._task.cancel()
+
+            report = loop.run_until_complete(self._task)
+
+            self.signals.finished.emit(report)
+        except asyncio.CancelledError:
+            # Cancelled before the batch started, so nothing was generated
+            self.signals.finished.emit(BatchReport(total=len(self.topics), cancelled=True))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self._loop = None
+            if loop:
+                loop.close()
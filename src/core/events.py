@@ -0,0 +1,153 @@
+# src/core/events.py
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Type
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from src.data.models import Flashcard, StudySession
+from src.utils.logger import get_logger
+
+
+# ===== Events =====
+
+@dataclass
+class StorageEvent:
+    """Base class for events published after a storage write has been committed."""
+
+    def merge(self, other: 'StorageEvent') -> 'StorageEvent':
+        """Combine this event with a later event of the same type."""
+        return other
+
+
+@dataclass
+class DecksSaved(StorageEvent):
+    """Decks were created or updated (including their last_studied time)."""
+    deck_ids: List[str] = field(default_factory=list)
+
+    def merge(self, other: 'DecksSaved') -> 'DecksSaved':
+        return DecksSaved(list(dict.fromkeys(self.deck_ids + other.deck_ids)))
+
+
+@dataclass
+class DecksDeleted(StorageEvent):
+    """Decks were deleted together with their cards and sessions."""
+    deck_ids: List[str] = field(default_factory=list)
+
+    def merge(self, other: 'DecksDeleted') -> 'DecksDeleted':
+        return DecksDeleted(list(dict.fromkeys(self.deck_ids + other.deck_ids)))
+
+
+@dataclass
+class CardsSaved(StorageEvent):
+    """Cards were added or updated."""
+    cards: List[Flashcard] = field(default_factory=list)
+    deck_ids: List[str] = field(default_factory=list)
+
+    def merge(self, other: 'CardsSaved') -> 'CardsSaved':
+        # Keep the latest version of each card
+        cards = {card.id: card for card in self.cards}
+        cards.update((card.id, card) for card in other.cards)
+        return CardsSaved(list(cards.values()), list(dict.fromkeys(self.deck_ids + other.deck_ids)))
+
+
+@dataclass
+class CardsDeleted(StorageEvent):
+    """Cards were deleted."""
+    card_ids: List[str] = field(default_factory=list)
+
+    def merge(self, other: 'CardsDeleted') -> 'CardsDeleted':
+        return CardsDeleted(list(dict.fromkeys(self.card_ids + other.card_ids)))
+
+
+@dataclass
+class SessionsSaved(StorageEvent):
+    """Study sessions were started or completed."""
+    sessions: List[StudySession] = field(default_factory=list)
+
+    @property
+    def completed(self) -> List[StudySession]:
+        """Get the sessions that have finished."""
+        return [session for session in self.sessions if session.end_time]
+
+    def merge(self, other: 'SessionsSaved') -> 'SessionsSaved':
+        sessions = {session.id: session for session in self.sessions}
+        sessions.update((session.id, session) for session in other.sessions)
+        return SessionsSaved(list(sessions.values()))
+
+
+# ===== Bus =====
+
+class EventBus(QObject):
+    """
+    Delivers storage events to subscribers on the GUI thread.
+
+    Events may be published from any thread. They are collected for
+    ``coalesce_ms`` and consecutive events of the same type are merged, so a
+    burst of writes (e.g. a bulk insert of hundreds of cards) reaches each
+    subscriber as a single event. Events of different types are delivered in
+    the order they were published.
+    """
+
+    # Queued to the bus's thread to start the coalescing timer
+    _flush_requested = pyqtSignal()
+
+    def __init__(self, coalesce_ms: int = 50, parent=None):
+        super().__init__(parent)
+        self.logger = get_logger("events")
+
+        self._lock = threading.Lock()
+        self._pending: List[StorageEvent] = []  # in order of publication, runs of one type merged
+        self._scheduled = False
+        self._subscribers: Dict[Type[StorageEvent], List[Callable]] = defaultdict(list)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(coalesce_ms)
+        self._timer.timeout.connect(self.flush)
+        self._flush_requested.connect(self._timer.start, Qt.ConnectionType.QueuedConnection)
+
+    def subscribe(self, event_type: Type[StorageEvent], callback: Callable[[StorageEvent], None]) -> None:
+        """
+        Call ``callback`` with every event of ``event_type`` (or a subclass).
+
+        Subscribe to StorageEvent to receive every event.
+        """
+        self._subscribers[event_type].append(callback)
+
+    def unsubscribe(self, event_type: Type[StorageEvent], callback: Callable[[StorageEvent], None]) -> None:
+        """Stop delivering events of ``event_type`` to ``callback``."""
+        if callback in self._subscribers.get(event_type, []):
+            self._subscribers[event_type].remove(callback)
+
+    def publish(self, event: StorageEvent) -> None:
+        """Queue an event for delivery; safe to call from any thread."""
+        with self._lock:
+            # Only merge with the previous event, so a merged event never jumps
+            # ahead of an event of another type published in between
+            if self._pending and type(self._pending[-1]) is type(event):
+                self._pending[-1] = self._pending[-1].merge(event)
+            else:
+                self._pending.append(event)
+
+            schedule = not self._scheduled
+            self._scheduled = True
+
+        if schedule:
+            self._flush_requested.emit()
+
+    def flush(self) -> None:
+        """Deliver all pending events now."""
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+            self._scheduled = False
+
+        for event in pending:
+            for event_type, callbacks in list(self._subscribers.items()):
+                if not isinstance(event, event_type):
+                    continue
+                for callback in list(callbacks):
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        self.logger.error("Error delivering %s: %s", type(event).__name__, e, exc_info=True)
@@ -0,0 +1,131 @@
+# src/core/history_query.py
+import time
+import datetime
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import FrozenSet, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from src.utils.logger import get_logger
+
+# Parts of the history that a query can load
+STATISTICS = 'statistics'
+SESSIONS = 'sessions'
+INSIGHTS = 'insights'
+ALL_PARTS = frozenset({STATISTICS, SESSIONS, INSIGHTS})
+
+
+def analytics_available() -> bool:
+    """
+    Check whether NumPy is installed so analytics can be computed.
+
+    Only looks NumPy up: the analytics module, which imports it, is loaded
+    by the worker the first time the dashboard is computed, not at startup.
+    """
+    return find_spec("numpy") is not None
+
+
+@dataclass
+class HistoryQuery:
+    """The history filter to load, tagged with the generation that requested it."""
+    generation: int
+    deck_id: Optional[str]
+    start_date: datetime.date
+    end_date: datetime.date
+    parts: FrozenSet[str] = ALL_PARTS
+
+
+@dataclass
+class HistoryQueryResult:
+    """Data loaded for a HistoryQuery; parts that were not requested are left as None."""
+    query: HistoryQuery
+    statistics: Optional[List[Tuple]] = None  # (deck, stats dict)
+    sessions: Optional[List[Tuple]] = None  # rows from SQLiteStorage.get_session_rows
+    dashboard: Optional[object] = None  # analytics.Dashboard
+    elapsed: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+class HistoryQuerySignals(QObject):
+    """Signals for communicating from the history query worker thread."""
+    finished = pyqtSignal(object)  # HistoryQueryResult
+
+
+class HistoryQueryWorker(QRunnable):
+    """
+    Loads the study history for a filter in a background thread.
+
+    Cancelling only stops the remaining steps; a result already emitted is
+    recognised as stale by its generation and ignored by the view.
+    """
+
+    def __init__(self, storage, query: HistoryQuery):
+        super().__init__()
+        self.storage = storage
+        self.query = query
+        self.signals = HistoryQuerySignals()
+        self.logger = get_logger("history_query")
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Skip the steps that have not started yet; safe to call from any thread."""
+        self._cancel_requested = True
+
+    def load_statistics(self) -> List[Tuple]:
+        """Get (deck, stats) for the selected deck, or for every deck."""
+        decks = self.storage.get_all_decks() or []
+        if self.query.deck_id:
+            decks = [deck for deck in decks if deck.id == self.query.deck_id]
+
+        statistics = []
+        for deck in decks:
+            if self._cancel_requested:
+                break
+            stats = self.storage.get_deck_stats(deck.id, self.query.start_date, self.query.end_date)
+            if stats:
+                statistics.append((deck, stats))
+        return statistics
+
+    def load_sessions(self) -> List[Tuple]:
+        """Get the completed session rows for the session table."""
+        query = self.query
+        return self.storage.get_session_rows(query.deck_id, query.start_date, query.end_date) or []
+
+    def load_dashboard(self):
+        """Compute the insights dashboard, or None if NumPy is not installed."""
+        if not analytics_available():
+            return None
+        from src.data.analytics import StudyAnalytics
+        query = self.query
+        return StudyAnalytics(self.storage).dashboard(query.deck_id, query.start_date, query.end_date)
+
+    @pyqtSlot()
+    def run(self):
+        """Main worker function that runs in background thread."""
+        start = time.perf_counter()
+        query = self.query
+        result = HistoryQueryResult(query)
+
+        steps = [
+            (STATISTICS, 'statistics', self.load_statistics),
+            (SESSIONS, 'sessions', self.load_sessions),
+            (INSIGHTS, 'dashboard', self.load_dashboard)
+        ]
+
+        for part, attribute, load in steps:
+            if part not in query.parts:
+                continue
+            if self._cancel_requested:
+                self.logger.debug("History query %s cancelled", query.generation)
+                return
+            try:
+                setattr(result, attribute, load())
+            except Exception as e:
+                self.logger.error("Error loading history %s: %s", part, e, exc_info=True)
+                result.errors.append(f"{part}: {e}")
+
+        if self._cancel_requested:
+            self.logger.debug("History query %s cancelled", query.generation)
+            return
+
+        result.elapsed = time.perf_counter() - start
+        self.signals.finished.emit(result)
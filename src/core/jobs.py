@@ -0,0 +1,311 @@
+# src/core/jobs.py
+import os
+import sys
+import json
+import uuid
+import asyncio
+import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from src.utils.logger import get_logger
+from src.utils.error_handling import handle_errors
+
+
+@dataclass
+class GenerationJob:
+    """A queued request to generate a deck of flashcards for a topic."""
+    id: str
+    topic: str
+    num_cards: int
+    additional_notes: str = ""
+    use_cache: bool = True
+    status: str = "pending"  # pending, running, completed, failed, cancelled
+    created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+    @classmethod
+    def create(cls, topic: str, num_cards: int, additional_notes: str = "", use_cache: bool = True) -> 'GenerationJob':
+        """Factory method to create a new job with a generated ID."""
+        return cls(
+            id=str(uuid.uuid4()),
+            topic=topic,
+            num_cards=num_cards,
+            additional_notes=additional_notes,
+            use_cache=use_cache
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GenerationJob':
+        """Create a job from a dictionary (e.g., from the persisted queue)."""
+        return cls(
+            id=data['id'],
+            topic=data['topic'],
+            num_cards=data['num_cards'],
+            additional_notes=data.get('additional_notes', ""),
+            use_cache=data.get('use_cache', True),
+            created_at=datetime.datetime.fromisoformat(data['created_at'])
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert job to dictionary for persistence."""
+        return {
+            'id': self.id,
+            'topic': self.topic,
+            'num_cards': self.num_cards,
+            'additional_notes': self.additional_notes,
+            'use_cache': self.use_cache,
+            'created_at': self.created_at.isoformat()
+        }
+
+
+# Worker signals for background processing
+class WorkerSignals(QObject):
+    """Signals for communicating from worker thread."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+# Worker for background flashcard generation
+class GenerateFlashcardsWorker(QRunnable):
+    """Worker for generating flashcards in background thread."""
+
+    def __init__(self, api_client, topic, num_cards, additional_notes, use_cache=True):
+        super().__init__()
+        self.api_client = api_client
+        self.topic = topic
+        self.num_cards = num_cards
+        self.additional_notes = additional_notes
+        self.use_cache = use_cache
+        self.signals = WorkerSignals()
+
+        # Set from the worker thread once the request is running
+        self._loop = None
+        self._task = None
+        self._cancel_requested = False
+
+    def cancel(self):
+        """Abort the request; safe to call from any thread."""
+        self._cancel_requested = True
+        loop, task = self._loop, self._task
+        if loop and task and not loop.is_closed():
+            # Cancelling the task closes the underlying HTTP connection
+            loop.call_soon_threadsafe(task.cancel)
+
+    @pyqtSlot()
+    def run(self):
+        """Main worker function that runs in background thread."""
+        if self._cancel_requested:
+            self.signals.cancelled.emit()
+            return
+
+        loop = None
+        try:
+            # Create a new event loop for the thread
+            if sys.platform == 'win32':
+                loop = asyncio.ProactorEventLoop()
+            else:
+                loop = asyncio.new_event_loop()
+
+            asyncio.set_event_loop(loop)
+
+            # Call the API
+            self._task = loop.create_task(
+                self.api_client.generate_flashcards(
+                    self.topic,
+                    self.num_cards,
+                    self.additional_notes,
+                    use_cache=self.use_cache
+                )
+            )
+            self._loop = loop
+
+            # Cancellation may have been requested before the task existed
+            if self._cancel_requested:
+                self._task.cancel()
+
+            response = loop.run_until_complete(self._task)
+
+            # Emit response
+            self.signals.finished.emit(response)
+        except asyncio.CancelledError:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            self._loop = None
+            if loop:
+                loop.close()
+
+
+class GenerationJobManager(QObject):
+    """
+    Queues flashcard generation jobs and runs a limited number at a time.
+
+    Jobs that have not completed are persisted to ``~/.flashcards/jobs.json``
+    so they can be resumed after a restart.
+    """
+
+    # Signals for the view
+    queue_changed = pyqtSignal()
+    job_finished = pyqtSignal(object, object)  # job, FlashCardResponse
+    job_failed = pyqtSignal(object, str)  # job, error message
+    job_cancelled = pyqtSignal(object)  # job
+
+    def __init__(self, api_client, max_in_flight: int = 2, jobs_path: str = None, parent=None):
+        super().__init__(parent)
+        self.logger = get_logger("jobs")
+        self.api_client = api_client
+        self.max_in_flight = max(1, max_in_flight)
+
+        # Set default queue file path if not provided
+        if jobs_path is None:
+            jobs_dir = os.path.join(os.path.expanduser("~"), ".flashcards")
+            os.makedirs(jobs_dir, exist_ok=True)
+            jobs_path = os.path.join(jobs_dir, "jobs.json")
+        self.jobs_path = jobs_path
+
+        # Queue state
+        self.pending = deque()
+        self.running = {}  # job_id -> (job, worker)
+        self._shutting_down = False
+
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(self.max_in_flight)
+
+    # ===== Queue Operations =====
+
+    def submit(self, topic: str, num_cards: int, additional_notes: str = "", use_cache: bool = True) -> GenerationJob:
+        """Add a generation job to the queue and start it if a slot is free."""
+        job = GenerationJob.create(topic, num_cards, additional_notes, use_cache)
+        self.pending.append(job)
+        self.logger.info("Queued generation job for '%s' (%s pending)", topic, len(self.pending))
+
+        self._save_pending()
+        self._schedule()
+        self.queue_changed.emit()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a pending or running job."""
+        for job in self.pending:
+            if job.id == job_id:
+                self.pending.remove(job)
+                job.status = "cancelled"
+                self.logger.info("Cancelled pending job for '%s'", job.topic)
+                self._save_pending()
+                self.job_cancelled.emit(job)
+                self.queue_changed.emit()
+                return True
+
+        if job_id in self.running:
+            job, worker = self.running[job_id]
+            self.logger.info("Cancelling running job for '%s'", job.topic)
+            worker.cancel()
+            return True
+
+        return False
+
+    def jobs(self) -> List[GenerationJob]:
+        """Get all running and pending jobs, running first."""
+        return [job for job, _ in self.running.values()] + list(self.pending)
+
+    def is_busy(self) -> bool:
+        """Check whether any job is running or waiting to run."""
+        return bool(self.running or self.pending)
+
+    def set_api_client(self, api_client) -> None:
+        """Use a new API client for jobs started from now on."""
+        self.api_client = api_client
+
+    def set_max_in_flight(self, max_in_flight: int) -> None:
+        """Change how many jobs may run at the same time."""
+        self.max_in_flight = max(1, max_in_flight)
+        self.thread_pool.setMaxThreadCount(self.max_in_flight)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Start pending jobs while there are free slots."""
+        while self.pending and len(self.running) < self.max_in_flight and not self._shutting_down:
+            job = self.pending.popleft()
+            job.status = "running"
+
+            worker = GenerateFlashcardsWorker(
+                self.api_client, job.topic, job.num_cards, job.additional_notes, job.use_cache
+            )
+            worker.setAutoDelete(False)  # We keep the worker around to cancel it
+            worker.signals.finished.connect(lambda response, job=job: self._on_finished(job, response))
+            worker.signals.error.connect(lambda message, job=job: self._on_error(job, message))
+            worker.signals.cancelled.connect(lambda job=job: self._on_cancelled(job))
+
+            self.running[job.id] = (job, worker)
+            self.thread_pool.start(worker)
+            self.logger.info("Started generation job for '%s' with %s cards", job.topic, job.num_cards)
+
+    # ===== Worker Callbacks =====
+
+    def _complete(self, job: GenerationJob, status: str) -> bool:
+        """Remove a finished job from the running set and start the next one."""
+        if self.running.pop(job.id, None) is None or self._shutting_down:
+            return False
+
+        job.status = status
+        self._save_pending()
+        self._schedule()
+        self.queue_changed.emit()
+        return True
+
+    def _on_finished(self, job: GenerationJob, response) -> None:
+        if self._complete(job, "completed"):
+            self.job_finished.emit(job, response)
+
+    def _on_error(self, job: GenerationJob, message: str) -> None:
+        if self._complete(job, "failed"):
+            self.logger.error("Generation job for '%s' failed: %s", job.topic, message)
+            self.job_failed.emit(job, message)
+
+    def _on_cancelled(self, job: GenerationJob) -> None:
+        if self._complete(job, "cancelled"):
+            self.job_cancelled.emit(job)
+
+    # ===== Persistence =====
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def resume_pending(self) -> int:
+        """Re-queue jobs persisted by a previous run."""
+        if not os.path.exists(self.jobs_path):
+            return 0
+
+        with open(self.jobs_path, 'r') as f:
+            jobs = [GenerationJob.from_dict(data) for data in json.load(f)]
+
+        known_ids = {job.id for job in self.jobs()}
+        jobs = [job for job in jobs if job.id not in known_ids]
+        if not jobs:
+            return 0
+
+        self.pending.extend(jobs)
+        self.logger.info("Resuming %s generation jobs from previous session", len(jobs))
+        self._schedule()
+        self.queue_changed.emit()
+        return len(jobs)
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def _save_pending(self) -> bool:
+        """Persist running and pending jobs so they survive a restart."""
+        temp_path = f"{self.jobs_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump([job.to_dict() for job in self.jobs()], f, indent=4)
+
+        os.replace(temp_path, self.jobs_path)
+        return True
+
+    def shutdown(self) -> None:
+        """Persist unfinished jobs and abort running requests."""
+        self._save_pending()
+        self._shutting_down = True
+
+        for job, worker in self.running.values():
+            worker.cancel()
+        self.thread_pool.waitForDone(2000)
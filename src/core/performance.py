@@ -0,0 +1,146 @@
+# src/core/performance.py
+import os
+import sys
+import time
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from src.utils import tracing
+from src.utils.logger import get_logger
+
+# psutil gives accurate memory figures on every platform but is optional
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 10, 100)
+
+
+def latency_histogram(durations_ms: List[float], bounds=LATENCY_BUCKETS_MS) -> List[int]:
+    """Count durations per bucket: below bounds[0], between consecutive bounds, and from bounds[-1] up."""
+    counts = [0] * (len(bounds) + 1)
+    for duration in durations_ms:
+        counts[bisect.bisect_right(bounds, duration)] += 1
+    return counts
+
+
+def memory_usage() -> Tuple[Optional[int], Optional[int]]:
+    """
+    Get the resident memory of this process in bytes.
+
+    Returns:
+        (current, peak); either is None where it cannot be determined
+    """
+    current = peak = None
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        current = info.rss
+        peak = getattr(info, 'peak_wset', None)  # Windows only
+    else:
+        try:
+            # Linux: resident pages are the second field
+            with open("/proc/self/statm") as f:
+                current = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+
+    if peak is None and resource is not None:
+        peak = _peak_rss()
+    # The peak is sampled by the kernel and can trail the current figure
+    if peak is not None and current is not None:
+        peak = max(peak, current)
+    return current, peak
+
+
+def _peak_rss() -> int:
+    """Get the peak resident memory in bytes from getrusage."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class SpanRow:
+    """Latency statistics of one span name, with its latency histogram."""
+    stats: tracing.SpanStats
+    histogram: List[int]
+    lifetime_calls: int
+
+
+@dataclass
+class PerformanceSnapshot:
+    """Counters gathered for the performance dialog."""
+    tracing_enabled: bool = False
+    spans: Dict[str, List[SpanRow]] = field(default_factory=dict)  # category -> rows
+    calls: Dict[str, int] = field(default_factory=dict)  # category -> lifetime calls
+    cache: Optional[Dict] = None
+    database_bytes: Optional[int] = None
+    memory: Tuple[Optional[int], Optional[int]] = (None, None)
+    threads: int = 0
+    elapsed: float = 0.0
+
+
+class PerformanceSamplerSignals(QObject):
+    """Signals for communicating from the performance sampler thread."""
+    finished = pyqtSignal(object)  # PerformanceSnapshot, or None if collecting failed
+
+
+class PerformanceSampler(QRunnable):
+    """Gathers a PerformanceSnapshot in a background thread, off the event loop being measured."""
+
+    def __init__(self, storage, cache_provider: Optional[Callable] = None):
+        super().__init__()
+        self.storage = storage
+        self.cache_provider = cache_provider
+        self.signals = PerformanceSamplerSignals()
+        self.logger = get_logger("performance")
+
+    def collect(self) -> PerformanceSnapshot:
+        """Gather the current counters."""
+        start = time.perf_counter()
+        snapshot = PerformanceSnapshot(tracing_enabled=tracing.tracing_enabled())
+
+        totals = tracing.recorder.lifetime_totals()
+        for category, calls, _ in totals.values():
+            snapshot.calls[category] = snapshot.calls.get(category, 0) + calls
+
+        durations: Dict[str, List[float]] = {}
+        for span in tracing.recorder.recent():
+            durations.setdefault(span.name, []).append(span.duration / 1e6)
+        for stats in tracing.recorder.stats():
+            histogram = latency_histogram(durations.get(stats.name, []))
+            lifetime_calls = totals[stats.name][1] if stats.name in totals else stats.count
+            snapshot.spans.setdefault(stats.category, []).append(SpanRow(stats, histogram, lifetime_calls))
+
+        cache = self.cache_provider() if self.cache_provider else None
+        if cache is not None:
+            snapshot.cache = cache.stats()
+
+        db_path = getattr(self.storage, 'db_path', None)
+        if db_path and os.path.exists(db_path):
+            snapshot.database_bytes = os.path.getsize(db_path)
+
+        snapshot.memory = memory_usage()
+        snapshot.threads = threading.active_count()
+        snapshot.elapsed = time.perf_counter() - start
+        return snapshot
+
+    @pyqtSlot()
+    def run(self):
+        """Main worker function that runs in background thread."""
+        try:
+            snapshot = self.collect()
+        except Exception as e:
+            self.logger.error("Error collecting performance counters: %s", e, exc_info=True)
+            snapshot = None
+        # Always report back, so the dialog knows it can sample again
+        self.signals.finished.emit(snapshot)
@@ -0,0 +1,197 @@
+# src/core/prefetch.py
+"""
+Look-ahead rendering of flashcard faces.
+
+Laying out and painting a card's text (parsing rich text, wrapping lines,
+loading images) on the GUI thread is what makes advancing to a long card
+slow. While the current card is on screen, ``CardPrefetcher`` renders the
+faces of the next cards into images on a worker thread, with the font,
+colour and width of the labels that will show them, so showing a card
+only has to draw a finished image.
+"""
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Optional
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSizeF, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import (
+    QAbstractTextDocumentLayout, QColor, QFont, QImage, QPainter, QPalette,
+    QTextDocument, QTextOption
+)
+from src.utils.logger import get_logger
+
+# Cards after the current one rendered ahead of time
+DEFAULT_LOOKAHEAD = 3
+
+
+def cache_size(lookahead: int) -> int:
+    """
+    Get how many faces to keep for a lookahead.
+
+    One prefetch asks for 2 * lookahead + 2 faces; twice that keeps the
+    faces of the previous position too, for going back.
+    """
+    return 4 * (max(0, lookahead) + 1)
+
+
+class FaceStyle(NamedTuple):
+    """How a card face is drawn: the label's font, text colour and width."""
+    font: str  # QFont.toString()
+    color: str  # QColor.name()
+    width: int  # Device-independent pixels
+    device_pixel_ratio: float
+
+
+def render_face(text: str, style: FaceStyle) -> QImage:
+    """
+    Render card text the way a centred, word-wrapped QLabel shows it.
+
+    Only uses thread-safe QtGui classes, so it can run on a worker thread.
+    """
+    font = QFont()
+    font.fromString(style.font)
+
+    document = QTextDocument()
+    document.setDocumentMargin(0)
+    document.setDefaultFont(font)
+    option = QTextOption(Qt.AlignmentFlag.AlignHCenter)
+    option.setWrapMode(QTextOption.WrapMode.WordWrap)
+    document.setDefaultTextOption(option)
+    # Same rule QLabel uses for its default automatic text format
+    if Qt.mightBeRichText(text):
+        document.setHtml(text)
+    else:
+        document.setPlainText(text)
+    document.setTextWidth(style.width)
+
+    size = QSizeF(style.width, document.size().height()).toSize()
+    ratio = style.device_pixel_ratio
+    image = QImage(size * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(Qt.GlobalColor.transparent)
+
+    context = QAbstractTextDocumentLayout.PaintContext()
+    context.palette.setColor(QPalette.ColorRole.Text, QColor(style.color))
+    painter = QPainter(image)
+    document.documentLayout().draw(painter, context)
+    painter.end()
+    return image
+
+
+class CardRenderSignals(QObject):
+    """Signals for communicating from the card render worker thread."""
+    finished = pyqtSignal(object)  # The CardRenderWorker
+
+
+class CardRenderWorker(QRunnable):
+    """Renders card faces in a background thread."""
+
+    def __init__(self, faces: List[tuple]):
+        super().__init__()
+        self.faces = faces  # (text, FaceStyle) pairs
+        self.rendered = []  # (text, FaceStyle, QImage) triples
+        self.signals = CardRenderSignals()
+        self.logger = get_logger("prefetch")
+
+    @pyqtSlot()
+    def run(self):
+        """Main worker function that runs in background thread."""
+        for text, style in self.faces:
+            try:
+                self.rendered.append((text, style, render_face(text, style)))
+            except Exception as e:
+                self.logger.error("Error rendering card face: %s", e, exc_info=True)
+        self.signals.finished.emit(self)
+
+
+class CardPrefetcher(QObject):
+    """
+    Keeps rendered images of the faces of recently shown and upcoming cards.
+
+    ``prefetch`` queues faces for rendering on the thread pool and ``get``
+    returns a face's image if it is ready, keyed by text and style, so
+    edited cards, theme changes and resizes are simply cache misses. When
+    the cache is full the faces least urgent in the latest prefetch go first.
+    """
+
+    def __init__(self, max_entries: int = cache_size(DEFAULT_LOOKAHEAD), thread_pool: Optional[QThreadPool] = None,
+                 parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.logger = get_logger("prefetch")
+
+        # (text, style) -> QImage, least recently used first
+        self.images = OrderedDict()
+        # Faces queued or being rendered
+        self._pending = set()
+        # Faces of the latest prefetch, most urgent first
+        self._wanted = []
+        # Keeps workers' signal objects alive until they report back
+        self._workers = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, style: FaceStyle) -> Optional[QImage]:
+        """Get the rendered image of a face, or None if it is not ready."""
+        image = self.images.get((text, style))
+        if image is None:
+            self.misses += 1
+            return None
+        self.images.move_to_end((text, style))
+        self.hits += 1
+        return image
+
+    def prefetch(self, faces: Iterable[tuple]) -> int:
+        """
+        Render faces in the background unless they are ready or queued.
+
+        Args:
+            faces: (text, FaceStyle) pairs, most urgent first
+
+        Returns:
+            The number of faces queued
+        """
+        self._wanted = list(faces)
+        self._rank_wanted()
+        missing = [
+            key for key in self._wanted
+            if key not in self.images and key not in self._pending and key[0]
+        ]
+        if not missing:
+            return 0
+
+        self._pending.update(missing)
+        worker = CardRenderWorker(missing)
+        self._workers.add(worker)
+        worker.signals.finished.connect(self.on_rendered)
+        self.thread_pool.start(worker)
+        return len(missing)
+
+    def on_rendered(self, worker):
+        """Store images finished by a worker (runs in the GUI thread)."""
+        self._workers.discard(worker)
+        self._pending.difference_update(worker.faces)
+        for text, style, image in worker.rendered:
+            self.images[(text, style)] = image
+        self._rank_wanted()
+        self._evict()
+
+    def resize(self, max_entries: int):
+        """Change how many faces are kept, dropping the least recently used ones over the limit."""
+        self.max_entries = max_entries
+        self._evict()
+
+    def _rank_wanted(self):
+        """Mark the wanted faces most recently used, the most urgent last, so they are evicted last."""
+        for key in reversed(self._wanted):
+            if key in self.images:
+                self.images.move_to_end(key)
+
+    def _evict(self):
+        """Drop the least recently used faces over the limit."""
+        while len(self.images) > self.max_entries:
+            self.images.popitem(last=False)
+
+    def clear(self):
+        """Forget all rendered faces."""
+        self.images.clear()
+        self._wanted = []
@@ -1,13 +1,47 @@
 import os
 import json
+import threading
+from contextlib import contextmanager
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
 
+# Seconds to wait after the last change before writing the settings file
+FLUSH_DELAY = 1.0
+
+# When the settings file is fsynced: on every write, only on close, or never
+FSYNC_ALWAYS = "always"
+FSYNC_ON_CLOSE = "close"
+FSYNC_NEVER = "never"
+
 class Settings:
-    """Manages application settings with loading and saving capabilities."""
+    """
+    Manages application settings with loading and saving capabilities.
     
-    def __init__(self, settings_path=None):
+    Changes are kept in memory and written by a background timer once no
+    change has been made for ``flush_delay`` seconds, so a burst of
+    changes costs a single write; ``flush()`` and ``close()`` write
+    immediately. Callbacks registered with ``subscribe`` are told which
+    keys changed.
+    """
+    
+    def __init__(self, settings_path=None, flush_delay=FLUSH_DELAY, fsync_policy=FSYNC_ON_CLOSE):
         self.logger = get_logger("settings")
+        self.flush_delay = flush_delay
+        self.fsync_policy = fsync_policy
+        
+        # Guards data and the pending write against the flush timer thread
+        self._lock = threading.RLock()
+        self._flush_timer = None
+        self._dirty = False
+        # Serializes writes of the temporary file
+        self._write_lock = threading.Lock()
+        
+        # Keys changed inside the current batch, and how deeply batches are nested
+        self._batch_depth = 0
+        self._batch_changes = set()
+        
+        # (keys or None for every key, callback) pairs
+        self._subscribers = []
         
         # Set default settings file path if not provided
         if settings_path is None:
@@ -16,7 +50,7 @@ class Settings:
             settings_path = os.path.join(settings_dir, "settings.json")
         
         self.settings_path = settings_path
-        self.logger.debug(f"Settings path: {self.settings_path}")
+        self.logger.debug("Settings path: %s", self.settings_path)
         
         # Default settings
         self.defaults = {
@@ -24,12 +58,27 @@ class Settings:
             "theme": "light",
             "study_session_cards": 20,
             "card_font_size": 14,
+            "card_flip_animation": True,
+            "study_prefetch_cards": 3,
             "save_history": True,
-            "max_history_sessions": 100
+            "max_history_sessions": 100,
+            "cache_enabled": True,
+            "cache_ttl_hours": 168,
+            "cache_max_entries": 500,
+            "api_max_retries": 3,
+            "api_backoff_base": 1.0,
+            "api_backoff_max": 30.0,
+            "circuit_breaker_threshold": 5,
+            "circuit_breaker_reset": 30,
+            "max_concurrent_generations": 2,
+            "batch_max_concurrency": 3,
+            "log_level": "INFO",
+            "log_levels": {},
+            "stall_threshold_ms": 250
         }
         
         # Load settings or create default ones
-        self.data = self.load()
+        self.data = self.load() or self.defaults.copy()
     
     @handle_errors(show_dialog=False, log_exception=True)
     def load(self):
@@ -46,12 +95,29 @@ class Settings:
         else:
             self.logger.info("Settings file not found, using defaults")
             # Save the defaults right away
-            self.save()
-            return self.defaults.copy()
+            defaults = self.defaults.copy()
+            self._write(defaults, fsync=self.fsync_policy == FSYNC_ALWAYS)
+            return defaults
     
     @handle_errors(show_dialog=False, log_exception=True)
-    def save(self):
-        """Save current settings to file."""
+    def save(self, fsync=None):
+        """
+        Save current settings to file now.
+        
+        Args:
+            fsync (bool): Whether to fsync the file; defaults to the fsync policy
+        """
+        with self._lock:
+            self._cancel_flush()
+            self._dirty = False
+            data = self.data.copy()
+        if fsync is None:
+            fsync = self.fsync_policy == FSYNC_ALWAYS
+        with self._write_lock:
+            return self._write(data, fsync)
+    
+    def _write(self, data, fsync=False):
+        """Write settings to the file through a temporary file."""
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(self.settings_path), exist_ok=True)
         
@@ -59,16 +125,50 @@ class Settings:
         temp_path = f"{self.settings_path}.tmp"
         with open(temp_path, 'w') as f:
             self.logger.debug("Saving settings to file")
-            json.dump(self.data, f, indent=4)
+            json.dump(data, f, indent=4)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         
         # Rename the temp file to the actual settings file (safer against corruption)
-        if os.path.exists(self.settings_path):
-            os.replace(temp_path, self.settings_path)
-        else:
-            os.rename(temp_path, self.settings_path)
-            
+        os.replace(temp_path, self.settings_path)
+        
+        if fsync and hasattr(os, 'O_DIRECTORY'):
+            # Make the rename itself durable (POSIX only)
+            dir_fd = os.open(os.path.dirname(self.settings_path), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        
+        return True
+    
+    def flush(self):
+        """Write pending changes now instead of waiting for the flush timer."""
+        if self._dirty:
+            return self.save()
         return True
     
+    def close(self):
+        """Write pending changes before the application exits, fsynced unless the policy is never."""
+        with self._lock:
+            self._cancel_flush()
+        return self.save(fsync=self.fsync_policy != FSYNC_NEVER)
+    
+    def _schedule_flush(self):
+        """(Re)start the flush timer; called with the lock held."""
+        self._dirty = True
+        self._cancel_flush()
+        self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _cancel_flush(self):
+        """Stop a pending flush timer; called with the lock held."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
     def get(self, key, default=None):
         """Get a setting value by key."""
         value = self.data.get(key)
@@ -85,14 +185,79 @@ class Settings:
     
     @handle_errors(show_dialog=False, log_exception=True)
     def set(self, key, value):
-        """Set a setting value and save to file."""
-        self.data[key] = value
-        return self.save()
+        """Set a setting value; it is saved to file by the flush timer."""
+        with self.batch(), self._lock:
+            if key not in self.data or self.data[key] != value:
+                self.data[key] = value
+                self._batch_changes.add(key)
+        return True
+    
+    @handle_errors(show_dialog=False, log_exception=True)
+    def update(self, values):
+        """Set several setting values at once, with a single save and notification."""
+        with self.batch():
+            for key, value in values.items():
+                self.set(key, value)
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group changes so they are saved and notified once, when the outermost batch ends.
+        
+        Usage:
+            with settings.batch():
+                settings.set("theme", "dark")
+                settings.set("card_font_size", 16)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                changed = set()
+                if self._batch_depth == 0:
+                    changed, self._batch_changes = self._batch_changes, set()
+                    if changed:
+                        self._schedule_flush()
+            # Callbacks run outside the lock, in the thread that made the change
+            if changed:
+                self._notify(changed)
+    
+    def subscribe(self, keys, callback):
+        """
+        Call ``callback(changed_keys)`` whenever one of ``keys`` changes.
+        
+        Args:
+            keys: Setting keys of interest, or None for every change
+            callback: Called with the set of changed keys after each change or batch
+        """
+        self._subscribers.append((frozenset(keys) if keys is not None else None, callback))
+        return callback
+    
+    def unsubscribe(self, callback):
+        """Stop calling a subscribed callback."""
+        self._subscribers = [entry for entry in self._subscribers if entry[1] is not callback]
+    
+    def _notify(self, changed):
+        """Call the subscribers interested in the changed keys."""
+        for keys, callback in list(self._subscribers):
+            if keys is None or not keys.isdisjoint(changed):
+                try:
+                    callback(changed)
+                except Exception as e:
+                    self.logger.error("Error in settings subscriber %s: %s", callback, e, exc_info=True)
     
     @handle_errors(dialog_title="Settings Reset", log_exception=True)
     def reset(self):
         """Reset settings to defaults."""
-        self.data = self.defaults.copy()
+        with self.batch(), self._lock:
+            changed = {key for key in set(self.data) | set(self.defaults)
+                       if self.data.get(key) != self.defaults.get(key)}
+            self.data = self.defaults.copy()
+            self._batch_changes |= changed
         return self.save()
     
     @handle_errors(show_dialog=False, log_exception=True)
@@ -104,4 +269,4 @@ class Settings:
             with open(self.settings_path, 'r') as src:
                 with open(backup_path, 'w') as dst:
                     dst.write(src.read())
-            self.logger.info(f"Created backup of corrupt settings at {backup_path}")
\ No newline at end of file
+            self.logger.info("Created backup of corrupt settings at %s", backup_path)
\ No newline at end of file
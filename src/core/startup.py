@@ -0,0 +1,206 @@
+# src/core/startup.py
+import os
+import sys
+import json
+import time
+import builtins
+from typing import Dict, List, Optional, Tuple
+from src.utils.logger import get_logger
+
+# Set to a non-empty value (other than 0) to profile startup, or pass --profile-startup
+PROFILE_ENV_VAR = "FLASHCARDS_PROFILE_STARTUP"
+PROFILE_FLAG = "--profile-startup"
+
+# Override with e.g. FLASHCARDS_STARTUP_BUDGETS="main window=800,storage=100"
+BUDGET_ENV_VAR = "FLASHCARDS_STARTUP_BUDGETS"
+
+# Default per-phase budgets in milliseconds
+DEFAULT_BUDGETS_MS = {
+    "settings": 100,
+    "storage": 250,
+    "main window": 1500,
+    "show": 500,
+    "interactive": 1000
+}
+
+
+def profiling_requested(argv: Optional[List[str]] = None) -> bool:
+    """Check whether startup profiling was requested on the command line or environment."""
+    if argv is None:
+        argv = sys.argv
+    if PROFILE_FLAG in argv:
+        return True
+    return os.environ.get(PROFILE_ENV_VAR, "") not in ("", "0")
+
+
+def get_profile_path() -> str:
+    """Get the path of the startup profile report."""
+    log_dir = os.path.join(os.path.expanduser("~"), ".flashcards", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.join(log_dir, "startup_profile.json")
+
+
+def load_budgets() -> Dict[str, float]:
+    """Get the startup budgets, with any overrides from the environment applied."""
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    for item in os.environ.get(BUDGET_ENV_VAR, "").split(","):
+        phase, _, value = item.partition("=")
+        try:
+            budgets[phase.strip()] = float(value)
+        except ValueError:
+            continue
+    return budgets
+
+
+class ImportProfiler:
+    """
+    Records how long each module takes to import while installed.
+
+    Works like ``python -X importtime``: ``cumulative`` includes the
+    imports a module triggers, ``self`` excludes them.
+    """
+
+    def __init__(self):
+        self.imports: Dict[str, Dict[str, float]] = {}
+        self._original_import = None
+        self._stack = []  # child time accumulated by each import in progress
+
+    def install(self) -> None:
+        """Start timing imports."""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only first-time absolute imports are interesting
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.imports[name] = {'cumulative': elapsed, 'self': elapsed - children}
+
+    def slowest(self, count: int = 25) -> List[Tuple[str, float, float]]:
+        """Get the slowest imports as (module, cumulative seconds, self seconds)."""
+        ranked = sorted(self.imports.items(), key=lambda item: item[1]['cumulative'], reverse=True)
+        return [(name, times['cumulative'], times['self']) for name, times in ranked[:count]]
+
+
+class StartupTimer:
+    """
+    Records how long each phase of application startup takes.
+
+    Phases are marked in order with ``mark``; ``report`` logs the time spent
+    in each phase and the total time since the timer was created, including
+    time to first paint and time to interactive.
+    """
+
+    def __init__(self, import_profiler: Optional[ImportProfiler] = None):
+        self.logger = get_logger("startup")
+        self.start_time = time.perf_counter()
+        self._last_time = self.start_time
+        self.import_profiler = import_profiler
+
+        # (phase name, seconds spent in phase, seconds since start)
+        self.phases: List[Tuple[str, float, float]] = []
+
+    def mark(self, phase: str) -> float:
+        """
+        Mark the end of a startup phase.
+
+        Args:
+            phase: Name of the phase that just finished
+
+        Returns:
+            Seconds since startup began
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_time, now - self.start_time))
+        self._last_time = now
+        self.logger.debug("Startup phase '%s' done at %.1f ms", phase, (now - self.start_time) * 1000)
+        return now - self.start_time
+
+    def elapsed(self, phase: str) -> Optional[float]:
+        """Get the seconds from startup to the end of a phase, if it was marked."""
+        for name, _, since_start in self.phases:
+            if name == phase:
+                return since_start
+        return None
+
+    def report(self) -> str:
+        """Log and return a summary of all marked phases."""
+        lines = ["Startup timing:"]
+        for name, duration, since_start in self.phases:
+            lines.append(f"  {name:<20} {duration * 1000:8.1f} ms  (at {since_start * 1000:8.1f} ms)")
+
+        summary = "\n".join(lines)
+        self.logger.info(summary)
+        return summary
+
+    @property
+    def profiling(self) -> bool:
+        """Check whether a detailed startup profile is being recorded."""
+        return self.import_profiler is not None
+
+    def over_budget(self, budgets: Optional[Dict[str, float]] = None) -> List[Tuple[str, float, float]]:
+        """
+        Get the phases that took longer than their budget.
+
+        Args:
+            budgets: Milliseconds allowed per phase; defaults to ``load_budgets()``
+
+        Returns:
+            List of (phase, milliseconds taken, milliseconds allowed)
+        """
+        if budgets is None:
+            budgets = load_budgets()
+        return [
+            (name, duration * 1000, budgets[name])
+            for name, duration, _ in self.phases
+            if name in budgets and duration * 1000 > budgets[name]
+        ]
+
+    def write_report(self, path: Optional[str] = None) -> str:
+        """
+        Write the phase timings and import times to a JSON file.
+
+        Returns:
+            Path of the written report
+        """
+        if path is None:
+            path = get_profile_path()
+
+        report = {
+            'phases': [
+                {'phase': name, 'duration_ms': duration * 1000, 'at_ms': since_start * 1000}
+                for name, duration, since_start in self.phases
+            ],
+            'over_budget': [
+                {'phase': name, 'duration_ms': taken, 'budget_ms': allowed}
+                for name, taken, allowed in self.over_budget()
+            ]
+        }
+        if self.import_profiler:
+            report['imports'] = [
+                {'module': name, 'cumulative_ms': cumulative * 1000, 'self_ms': own * 1000}
+                for name, cumulative, own in self.import_profiler.slowest(count=len(self.import_profiler.imports))
+            ]
+
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=4)
+
+        self.logger.info("Startup profile written to %s", path)
+        return path
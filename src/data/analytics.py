@@ -0,0 +1,420 @@
+# src/data/analytics.py
+import time
+import datetime
+import itertools
+from operator import itemgetter
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from src.utils.logger import get_logger
+
+# NumPy is an optional dependency (pip install .[analytics])
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SECONDS_PER_DAY = 86400
+
+# Lower edges (in days since the card's previous review) of the retention curve buckets
+RETENTION_BINS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+# Days in the rolling accuracy window
+ROLLING_WINDOW_DAYS = 7
+
+
+# ===== Columnar data =====
+
+def _encode(values, count: int) -> Tuple['np.ndarray', list]:
+    """
+    Encode values as dense integer codes in order of first appearance.
+
+    Returns:
+        (code of each value, distinct values indexed by code)
+    """
+    # Position of each value's first appearance, then ranked into 0..n-1;
+    # the dict keeps the distinct values in the same first-appearance order
+    first_seen = {}
+    positions = np.fromiter(map(first_seen.setdefault, values, itertools.count()), dtype=np.int64, count=count)
+    codes = np.unique(positions, return_inverse=True)[1].astype(np.int32)
+    return codes, list(first_seen)
+
+
+@dataclass
+class ReviewColumns:
+    """Card reviews stored column by column, oldest first."""
+    timestamps: 'np.ndarray'  # float64 POSIX seconds
+    correct: 'np.ndarray'  # bool
+    card_index: 'np.ndarray'  # int32 index into a card ID table
+    topic_index: 'np.ndarray'  # int32 index into ``topics``
+    topics: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple]) -> 'ReviewColumns':
+        """
+        Build columns from storage rows.
+
+        Args:
+            rows: (reviewed at POSIX timestamp, correct, card id, topic) tuples as
+                returned by ``SQLiteStorage.get_review_rows``
+        """
+        count = len(rows)
+        card_index, _ = _encode(map(itemgetter(2), rows), count)
+        topic_index, topics = _encode(map(itemgetter(3), rows), count)
+
+        return cls(
+            timestamps=np.fromiter(map(itemgetter(0), rows), dtype=np.float64, count=count),
+            correct=np.fromiter(map(itemgetter(1), rows), dtype=bool, count=count),
+            card_index=card_index,
+            topic_index=topic_index,
+            topics=topics
+        )
+
+
+@dataclass
+class DailyStatsColumns:
+    """Per-day completed session totals stored column by column, oldest first."""
+    days: 'np.ndarray'  # int64 days since 1970-01-01
+    sessions: 'np.ndarray'  # int64
+    studied: 'np.ndarray'  # int64
+    correct: 'np.ndarray'  # int64
+    seconds: 'np.ndarray'  # float64
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple]) -> 'DailyStatsColumns':
+        """
+        Build columns from storage rows.
+
+        Args:
+            rows: (day, sessions, cards studied, cards correct, seconds spent) tuples
+                as returned by ``SQLiteStorage.get_daily_stats``
+        """
+        count = len(rows)
+        epoch = datetime.date(1970, 1, 1).toordinal()
+        return cls(
+            days=np.fromiter((row[0].toordinal() - epoch for row in rows), dtype=np.int64, count=count),
+            sessions=np.fromiter((row[1] or 0 for row in rows), dtype=np.int64, count=count),
+            studied=np.fromiter((row[2] or 0 for row in rows), dtype=np.int64, count=count),
+            correct=np.fromiter((row[3] or 0 for row in rows), dtype=np.int64, count=count),
+            seconds=np.fromiter((row[4] or 0.0 for row in rows), dtype=np.float64, count=count)
+        )
+
+
+# ===== Vectorized computations =====
+
+def local_day_numbers(timestamps: 'np.ndarray') -> 'np.ndarray':
+    """
+    Convert POSIX timestamps to local calendar days (days since 1970-01-01).
+
+    The UTC offset is looked up once per distinct UTC day rather than once
+    per timestamp, so daylight saving changes are respected cheaply.
+    """
+    if len(timestamps) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    utc_days = np.floor_divide(timestamps, SECONDS_PER_DAY).astype(np.int64)
+    unique_days, inverse = np.unique(utc_days, return_inverse=True)
+    offsets = np.array(
+        [time.localtime(day * SECONDS_PER_DAY + SECONDS_PER_DAY // 2).tm_gmtoff for day in unique_days.tolist()],
+        dtype=np.float64
+    )
+    return np.floor_divide(timestamps + offsets[inverse], SECONDS_PER_DAY).astype(np.int64)
+
+
+def _ratio(numerator: 'np.ndarray', denominator: 'np.ndarray') -> 'np.ndarray':
+    """Element-wise ratio, NaN where the denominator is zero."""
+    result = np.full(len(denominator), np.nan)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def group_accuracy(group_index: 'np.ndarray', correct: 'np.ndarray', size: int = 0) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Count reviews and accuracy per group.
+
+    Args:
+        group_index: Non-negative group of each review
+        correct: Outcome of each review
+        size: Minimum number of groups to return
+
+    Returns:
+        (reviews per group, accuracy per group as 0..1 or NaN)
+    """
+    counts = np.bincount(group_index, minlength=size)
+    hits = np.bincount(group_index, weights=correct, minlength=size)
+    return counts, _ratio(hits, counts)
+
+
+def daily_accuracy(days: 'np.ndarray', correct: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    Count reviews and accuracy for every calendar day from the first review to the last.
+
+    Days without reviews are included with a count of 0 so the result can be
+    used directly for rolling windows.
+
+    Returns:
+        (day numbers, reviews per day, correct reviews per day)
+    """
+    if len(days) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    first = days.min()
+    offset = days - first
+    counts = np.bincount(offset)
+    hits = np.bincount(offset, weights=correct, minlength=len(counts))
+    return first + np.arange(len(counts)), counts, hits
+
+
+def weekly_accuracy(days: 'np.ndarray', correct: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    Count reviews and accuracy per Monday-based week, for weeks with reviews.
+
+    Returns:
+        (day number of each week's Monday, reviews per week, accuracy per week)
+    """
+    # 1970-01-01 was a Thursday, so shift by 3 days to start weeks on Monday
+    weeks = np.floor_divide(days + 3, 7)
+    if len(weeks) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+    first = weeks.min()
+    counts, accuracy = group_accuracy(weeks - first, correct)
+    present = np.flatnonzero(counts)
+    return (first + present) * 7 - 3, counts[present], accuracy[present]
+
+
+def rolling_sum(values: 'np.ndarray', window: int) -> 'np.ndarray':
+    """Sum of each value and the ``window - 1`` values before it (shorter at the start)."""
+    cumulative = np.concatenate(([0], np.cumsum(values)))
+    ends = np.arange(1, len(values) + 1)
+    return cumulative[ends] - cumulative[np.maximum(ends - window, 0)]
+
+
+def rolling_accuracy(counts: 'np.ndarray', hits: 'np.ndarray', window: int = ROLLING_WINDOW_DAYS) -> 'np.ndarray':
+    """Accuracy over a trailing window of days, weighted by the reviews on each day."""
+    return _ratio(rolling_sum(hits, window), rolling_sum(counts, window))
+
+
+def study_streaks(study_days: 'np.ndarray', today: int) -> Tuple[int, int]:
+    """
+    Find the current and longest runs of consecutive study days.
+
+    Args:
+        study_days: Sorted, distinct day numbers with at least one review
+        today: Day number of today; a streak is still current if the last
+            study day was today or yesterday
+
+    Returns:
+        (current streak, longest streak) in days
+    """
+    if len(study_days) == 0:
+        return 0, 0
+
+    breaks = np.flatnonzero(np.diff(study_days) != 1)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(study_days) - 1]))
+    lengths = ends - starts + 1
+
+    current = int(lengths[-1]) if today - study_days[-1] <= 1 else 0
+    return current, int(lengths.max())
+
+
+def retention_curve(
+    card_index: 'np.ndarray',
+    timestamps: 'np.ndarray',
+    correct: 'np.ndarray',
+    bins: Sequence[float] = RETENTION_BINS
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Measure recall against the time since a card was last reviewed.
+
+    Every review that follows an earlier review of the same card is placed
+    in a bucket by the days elapsed since that earlier review.
+
+    Returns:
+        (reviews per bucket, accuracy per bucket)
+    """
+    order = np.lexsort((timestamps, card_index))
+    cards = card_index[order]
+    repeat = cards[1:] == cards[:-1]
+
+    sorted_times = timestamps[order]
+    intervals = (sorted_times[1:] - sorted_times[:-1])[repeat] / SECONDS_PER_DAY
+    outcomes = correct[order][1:][repeat]
+
+    buckets = np.digitize(intervals, bins) - 1
+    return group_accuracy(buckets, outcomes, size=len(bins))
+
+
+def retention_labels(bins: Sequence[float] = RETENTION_BINS) -> List[str]:
+    """Get a readable label for each retention bucket, e.g. "<1d", "2-3d", "64d+"."""
+    labels = []
+    for i, low in enumerate(bins):
+        if i == len(bins) - 1:
+            labels.append(f"{low:g}d+")
+        elif low == 0:
+            labels.append(f"<{bins[1]:g}d")
+        elif bins[i + 1] - low == 1:
+            labels.append(f"{low:g}d")
+        else:
+            labels.append(f"{low:g}-{bins[i + 1] - 1:g}d")
+    return labels
+
+
+# ===== Dashboard =====
+
+@dataclass
+class Dashboard:
+    """Summary of study performance for the history dashboard."""
+    total_reviews: int = 0
+    accuracy: float = float('nan')
+    recent_accuracy: float = float('nan')  # over the ROLLING_WINDOW_DAYS days up to the last review
+    current_streak: int = 0
+    longest_streak: int = 0
+    session_count: int = 0
+    study_seconds: float = 0.0
+
+    # Per day, from the first review to the last
+    days: List[datetime.date] = field(default_factory=list)
+    daily_reviews: List[int] = field(default_factory=list)
+    daily_accuracy: List[float] = field(default_factory=list)
+    rolling_accuracy: List[float] = field(default_factory=list)
+
+    # Per week with reviews, keyed by the week's Monday
+    weeks: List[datetime.date] = field(default_factory=list)
+    weekly_reviews: List[int] = field(default_factory=list)
+    weekly_accuracy: List[float] = field(default_factory=list)
+
+    # Recall by days since the previous review of the same card
+    retention_labels: List[str] = field(default_factory=list)
+    retention_reviews: List[int] = field(default_factory=list)
+    retention_accuracy: List[float] = field(default_factory=list)
+
+    # Per topic, most reviewed first
+    topics: List[str] = field(default_factory=list)
+    topic_reviews: List[int] = field(default_factory=list)
+    topic_accuracy: List[float] = field(default_factory=list)
+
+
+def _day_to_date(day: int) -> datetime.date:
+    return datetime.date(1970, 1, 1) + datetime.timedelta(days=int(day))
+
+
+def compute_dashboard(
+    reviews: ReviewColumns,
+    daily_stats: Optional[DailyStatsColumns] = None,
+    today: Optional[datetime.date] = None,
+    window: int = ROLLING_WINDOW_DAYS
+) -> Dashboard:
+    """Compute every dashboard statistic from columnar review data and daily session totals."""
+    dashboard = Dashboard(retention_labels=retention_labels())
+
+    if daily_stats is not None and len(daily_stats):
+        dashboard.session_count = int(daily_stats.sessions.sum())
+        dashboard.study_seconds = float(daily_stats.seconds.sum())
+
+    if not len(reviews):
+        dashboard.retention_reviews = [0] * len(RETENTION_BINS)
+        dashboard.retention_accuracy = [float('nan')] * len(RETENTION_BINS)
+        return dashboard
+
+    if today is None:
+        today = datetime.date.today()
+    today_number = (today - datetime.date(1970, 1, 1)).days
+
+    days = local_day_numbers(reviews.timestamps)
+    correct = reviews.correct
+
+    dashboard.total_reviews = len(reviews)
+    dashboard.accuracy = float(correct.mean())
+
+    # Daily series and rolling accuracy
+    day_numbers, counts, hits = daily_accuracy(days, correct)
+    rolling = rolling_accuracy(counts, hits, window)
+    dashboard.days = [_day_to_date(day) for day in day_numbers.tolist()]
+    dashboard.daily_reviews = counts.tolist()
+    dashboard.daily_accuracy = _ratio(hits, counts).tolist()
+    dashboard.rolling_accuracy = rolling.tolist()
+    dashboard.recent_accuracy = float(rolling[-1])
+
+    # Streaks
+    dashboard.current_streak, dashboard.longest_streak = study_streaks(day_numbers[counts > 0], today_number)
+
+    # Weekly series
+    week_starts, week_counts, week_accuracy = weekly_accuracy(days, correct)
+    dashboard.weeks = [_day_to_date(day) for day in week_starts.tolist()]
+    dashboard.weekly_reviews = week_counts.tolist()
+    dashboard.weekly_accuracy = week_accuracy.tolist()
+
+    # Retention curve
+    retention_counts, retention = retention_curve(reviews.card_index, reviews.timestamps, correct)
+    dashboard.retention_reviews = retention_counts.tolist()
+    dashboard.retention_accuracy = retention.tolist()
+
+    # Topic breakdown
+    topic_counts, topic_accuracy = group_accuracy(reviews.topic_index, correct, size=len(reviews.topics))
+    ranked = np.argsort(-topic_counts, kind='stable')
+    dashboard.topics = [reviews.topics[i] for i in ranked.tolist()]
+    dashboard.topic_reviews = topic_counts[ranked].tolist()
+    dashboard.topic_accuracy = topic_accuracy[ranked].tolist()
+
+    return dashboard
+
+
+class StudyAnalytics:
+    """Loads study history from storage and computes dashboard statistics."""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.logger = get_logger("analytics")
+
+    def load_reviews(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> ReviewColumns:
+        """Load card reviews into columns."""
+        return ReviewColumns.from_rows(self.storage.get_review_rows(deck_id, start_date, end_date) or [])
+
+    def load_daily_stats(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> DailyStatsColumns:
+        """Load per-day completed session totals from the daily rollup into columns."""
+        return DailyStatsColumns.from_rows(self.storage.get_daily_stats(deck_id, start_date, end_date) or [])
+
+    def dashboard(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> Optional[Dashboard]:
+        """
+        Compute the dashboard for a deck (or all decks) and date range.
+
+        Returns:
+            Dashboard, or None if NumPy is not installed
+        """
+        if np is None:
+            return None
+
+        start = time.perf_counter()
+        reviews = self.load_reviews(deck_id, start_date, end_date)
+        daily_stats = self.load_daily_stats(deck_id, start_date, end_date)
+        loaded = time.perf_counter()
+        dashboard = compute_dashboard(reviews, daily_stats)
+
+        self.logger.debug(
+            f"Dashboard for {len(reviews)} reviews and {len(daily_stats)} days of sessions: "
+            f"load {(loaded - start) * 1000:.1f} ms, compute {(time.perf_counter() - loaded) * 1000:.1f} ms"
+        )
+        return dashboard
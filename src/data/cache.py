@@ -0,0 +1,241 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+from contextlib import contextmanager
+from src.utils.logger import get_logger
+from src.utils.error_handling import handle_errors
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache for flashcard generation responses.
+
+    Entries are keyed on a hash of the normalized request payload, including
+    the ``base_url`` of the server that answered it, and stored
+    in a small SQLite database under ``~/.flashcards/cache``. Entries expire
+    after ``ttl_seconds`` and the least recently used ones are evicted once
+    the cache grows beyond ``max_entries`` or ``max_bytes``.
+    """
+
+    def __init__(self, db_path: str = None, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 500, max_bytes: int = 20 * 1024 * 1024):
+        self.logger = get_logger("cache")
+
+        # Set default cache path if not provided
+        if db_path is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".flashcards", "cache")
+            os.makedirs(cache_dir, exist_ok=True)
+            db_path = os.path.join(cache_dir, "responses.db")
+
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Hit/miss counters for this process (shared between worker threads)
+        self._lock = threading.Lock()
+        self._metrics = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'expired': 0,
+            'evictions': 0
+        }
+
+        self.logger.debug("Response cache path: %s", self.db_path)
+        self._init_db()
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager for cache database connections."""
+        connection = None
+        try:
+            connection = sqlite3.connect(self.db_path)
+            yield connection
+        finally:
+            if connection:
+                connection.close()
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def _init_db(self) -> None:
+        """Create the cache table if it doesn't exist."""
+        with self._get_connection() as conn:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                request TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                hits INTEGER DEFAULT 0
+            )
+            ''')
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_response_cache_accessed ON response_cache (last_accessed)"
+            )
+            conn.commit()
+
+    # ===== Keys =====
+
+    @staticmethod
+    def normalize_request(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a request payload so equivalent requests share a key."""
+        def clean(text):
+            # Collapse whitespace and ignore case differences
+            return " ".join(str(text or "").split()).casefold()
+
+        # Responses from different servers never match; scheme and host are case-insensitive
+        url = urlsplit(str(payload.get('base_url') or "").strip())
+        base_url = urlunsplit((url.scheme.lower(), url.netloc.lower(), url.path.rstrip('/'), url.query, ""))
+
+        return {
+            'base_url': base_url,
+            'topic': clean(payload.get('topic')),
+            'num_questions': int(payload.get('num_questions') or 0),
+            'additional_notes': clean(payload.get('additional_notes'))
+        }
+
+    @classmethod
+    def make_key(cls, payload: Dict[str, Any]) -> str:
+        """Build the content address for a request payload."""
+        normalized = json.dumps(cls.normalize_request(payload), sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    # ===== Cache Operations =====
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def get(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a request payload, or None on a miss."""
+        key = self.make_key(payload)
+        now = time.time()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT response, created_at FROM response_cache WHERE key = ?", (key,))
+            row = cursor.fetchone()
+
+            if row is None:
+                self._count('misses')
+                return None
+
+            response_json, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                # Stale entry - drop it and treat as a miss
+                cursor.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                conn.commit()
+                self._count('expired')
+                self._count('misses')
+                return None
+
+            cursor.execute(
+                "UPDATE response_cache SET last_accessed = ?, hits = hits + 1 WHERE key = ?",
+                (now, key)
+            )
+            conn.commit()
+
+        self._count('hits')
+        self.logger.debug("Cache hit for key %s (hit rate %.0f%%)", key[:12], self.hit_rate * 100)
+        return json.loads(response_json)
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def put(self, payload: Dict[str, Any], response: Dict[str, Any]) -> bool:
+        """Store a response for a request payload and evict entries over the limits."""
+        key = self.make_key(payload)
+        request_json = json.dumps(self.normalize_request(payload), sort_keys=True)
+        response_json = json.dumps(response)
+        size = len(request_json) + len(response_json)
+        now = time.time()
+
+        if self.max_bytes and size > self.max_bytes:
+            self.logger.debug("Response of %s bytes exceeds cache size limit; not caching", size)
+            return False
+
+        with self._get_connection() as conn:
+            conn.execute('''
+            INSERT OR REPLACE INTO response_cache (key, request, response, size, created_at, last_accessed, hits)
+            VALUES (?, ?, ?, ?, ?, ?, 0)
+            ''', (key, request_json, response_json, size, now, now))
+            self._evict(conn, now)
+            conn.commit()
+
+        self._count('stores')
+        return True
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def invalidate(self, payload: Dict[str, Any]) -> bool:
+        """Remove the cached response for a request payload."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM response_cache WHERE key = ?", (self.make_key(payload),))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def clear(self) -> bool:
+        """Remove every cached response."""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM response_cache")
+            conn.commit()
+        self.logger.info("Response cache cleared")
+        return True
+
+    def _evict(self, conn, now: float) -> None:
+        """Drop expired entries, then least recently used ones beyond the size limits."""
+        cursor = conn.cursor()
+
+        if self.ttl_seconds:
+            cursor.execute("DELETE FROM response_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            if cursor.rowcount > 0:
+                self._count('expired', cursor.rowcount)
+
+        # Walk entries from most to least recently used and keep what fits
+        cursor.execute("SELECT key, size FROM response_cache ORDER BY last_accessed DESC")
+        kept_entries = 0
+        kept_bytes = 0
+        stale_keys = []
+        for key, size in cursor.fetchall():
+            if ((self.max_entries and kept_entries >= self.max_entries) or
+                    (self.max_bytes and kept_bytes + size > self.max_bytes)):
+                stale_keys.append((key,))
+                continue
+            kept_entries += 1
+            kept_bytes += size
+
+        if stale_keys:
+            cursor.executemany("DELETE FROM response_cache WHERE key = ?", stale_keys)
+            self._count('evictions', len(stale_keys))
+            self.logger.debug("Evicted %s cached responses", len(stale_keys))
+
+    # ===== Metrics =====
+
+    def _count(self, metric: str, amount: int = 1) -> None:
+        """Increment a cache metric counter."""
+        with self._lock:
+            self._metrics[metric] += amount
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache in this process."""
+        with self._lock:
+            lookups = self._metrics['hits'] + self._metrics['misses']
+            return self._metrics['hits'] / lookups if lookups else 0.0
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    def stats(self) -> Dict[str, Any]:
+        """Get cache metrics together with the current on-disk footprint."""
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT COUNT(*), SUM(size) FROM response_cache").fetchone()
+
+        with self._lock:
+            stats = dict(self._metrics)
+
+        stats['entries'] = row[0] if row else 0
+        stats['bytes'] = (row[1] or 0) if row else 0
+        stats['hit_rate'] = self.hit_rate
+        return stats
@@ -1,17 +1,112 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Any, Union
 import datetime
+import sys
 import uuid
 
-@dataclass
+# A timestamp as stored (epoch seconds), as written by older versions (ISO string) or already parsed
+Timestamp = Union[datetime.datetime, int, str]
+
+
+class LazyTimestamp:
+    """
+    Descriptor for a timestamp attribute that is parsed on first access.
+    
+    The value is kept in the slot named after the attribute with a leading
+    underscore, as given (epoch seconds from the database, an ISO string or a
+    datetime). It is converted to a local datetime the first time the
+    attribute is read, so timestamps that are never displayed are never converted.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+    
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if isinstance(value, (int, float)):
+            value = datetime.datetime.fromtimestamp(value)
+            setattr(obj, self.slot, value)
+        elif isinstance(value, str):
+            value = datetime.datetime.fromisoformat(value) if value else None
+            setattr(obj, self.slot, value)
+        return value
+    
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+
+def _to_epoch(value: Optional[Timestamp]) -> Optional[int]:
+    """Get a timestamp as whole epoch seconds for storage, without converting stored values."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return int(value.timestamp())
+
+
+def _model_eq(self, other) -> bool:
+    """
+    Compare two models field by field, with timestamps as epoch seconds.
+    
+    Timestamps are compared at the precision they are stored with, however
+    each side holds them (parsed or not), so a model equals its reload.
+    """
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    for f in fields(self):
+        mine, theirs = getattr(self, f.name), getattr(other, f.name)
+        if f.name.startswith('_'):
+            mine, theirs = _to_epoch(mine), _to_epoch(theirs)
+        if mine != theirs:
+            return False
+    return True
+
+
+def _model_repr(self) -> str:
+    """Show a model with its public attributes, timestamps parsed, like the generated dataclass repr."""
+    values = ", ".join(
+        f"{name}={getattr(self, name)!r}" for name in (f.name.lstrip('_') for f in fields(self))
+    )
+    return f"{self.__class__.__qualname__}({values})"
+
+
+@dataclass(slots=True)
 class Flashcard:
     """Represents a single flashcard with question, answer, and metadata."""
     id: str
     question: str
     answer: str
     topic: str
-    created_at: datetime.datetime
-    last_reviewed: Optional[datetime.datetime] = None
+    _created_at: Timestamp
+    _last_reviewed: Optional[Timestamp] = None
+    
+    created_at = LazyTimestamp()
+    last_reviewed = LazyTimestamp()
+    
+    # Used instead of the generated methods, which would show and compare the raw timestamps
+    __eq__ = _model_eq
+    __repr__ = _model_repr
+    
+    def __init__(
+        self,
+        id: str,
+        question: str,
+        answer: str,
+        topic: str,
+        created_at: Timestamp,
+        last_reviewed: Optional[Timestamp] = None
+    ):
+        self.id = id
+        self.question = question
+        self.answer = answer
+        # Many cards share a topic, so keep one copy of each topic string
+        self.topic = sys.intern(topic)
+        self._created_at = created_at
+        self._last_reviewed = last_reviewed
     
     @classmethod
     def create(cls, question: str, answer: str, topic: str) -> 'Flashcard':
@@ -27,22 +122,14 @@ class Flashcard:
     @classmethod
     def from_dict(cls, data: Dict) -> 'Flashcard':
         """Create a flashcard from a dictionary (e.g., from database)."""
-        # Convert string timestamps to datetime objects if needed
-        created_at = data['created_at']
-        if isinstance(created_at, str):
-            created_at = datetime.datetime.fromisoformat(created_at)
-            
-        last_reviewed = data.get('last_reviewed')
-        if isinstance(last_reviewed, str) and last_reviewed:
-            last_reviewed = datetime.datetime.fromisoformat(last_reviewed)
-        
+        # Timestamps are parsed when first accessed
         return cls(
             id=data['id'],
             question=data['question'],
             answer=data['answer'],
             topic=data['topic'],
-            created_at=created_at,
-            last_reviewed=last_reviewed
+            created_at=data['created_at'],
+            last_reviewed=data.get('last_reviewed')
         )
     
     def to_dict(self) -> Dict:
@@ -52,8 +139,8 @@ class Flashcard:
             'question': self.question,
             'answer': self.answer,
             'topic': self.topic,
-            'created_at': self.created_at.isoformat(),
-            'last_reviewed': self.last_reviewed.isoformat() if self.last_reviewed else None
+            'created_at': _to_epoch(self._created_at),
+            'last_reviewed': _to_epoch(self._last_reviewed)
         }
     
     def mark_reviewed(self) -> None:
@@ -61,15 +148,38 @@ class Flashcard:
         self.last_reviewed = datetime.datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class FlashcardDeck:
     """Represents a collection of flashcards with metadata."""
     id: str
     name: str
     description: str
-    created_at: datetime.datetime
+    _created_at: Timestamp
     cards: List[Flashcard] = field(default_factory=list)
-    last_studied: Optional[datetime.datetime] = None
+    _last_studied: Optional[Timestamp] = None
+    
+    created_at = LazyTimestamp()
+    last_studied = LazyTimestamp()
+    
+    # Used instead of the generated methods, which would show and compare the raw timestamps
+    __eq__ = _model_eq
+    __repr__ = _model_repr
+    
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        description: str,
+        created_at: Timestamp,
+        cards: List[Flashcard] = None,
+        last_studied: Optional[Timestamp] = None
+    ):
+        self.id = id
+        self.name = name
+        self.description = description
+        self._created_at = created_at
+        self.cards = cards if cards is not None else []
+        self._last_studied = last_studied
     
     @classmethod
     def create(cls, name: str, description: str, cards: List[Flashcard] = None) -> 'FlashcardDeck':
@@ -85,22 +195,14 @@ class FlashcardDeck:
     @classmethod
     def from_dict(cls, data: Dict, cards: List[Flashcard] = None) -> 'FlashcardDeck':
         """Create a deck from a dictionary (e.g., from database)."""
-        # Convert string timestamps to datetime objects if needed
-        created_at = data['created_at']
-        if isinstance(created_at, str):
-            created_at = datetime.datetime.fromisoformat(created_at)
-            
-        last_studied = data.get('last_studied')
-        if isinstance(last_studied, str) and last_studied:
-            last_studied = datetime.datetime.fromisoformat(last_studied)
-        
+        # Timestamps are parsed when first accessed
         return cls(
             id=data['id'],
             name=data['name'],
             description=data['description'],
-            created_at=created_at,
+            created_at=data['created_at'],
             cards=cards or [],
-            last_studied=last_studied
+            last_studied=data.get('last_studied')
         )
     
     def to_dict(self) -> Dict:
@@ -109,8 +211,8 @@ class FlashcardDeck:
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'created_at': self.created_at.isoformat(),
-            'last_studied': self.last_studied.isoformat() if self.last_studied else None,
+            'created_at': _to_epoch(self._created_at),
+            'last_studied': _to_epoch(self._last_studied),
         }
     
     def add_card(self, card: Flashcard) -> None:
@@ -135,16 +237,39 @@ class FlashcardDeck:
         return len(self.cards)
 
 
-@dataclass
+@dataclass(slots=True)
 class StudySession:
     """Represents a flashcard study session with performance metrics."""
     id: str
     deck_id: str
-    start_time: datetime.datetime
-    end_time: Optional[datetime.datetime] = None
+    _start_time: Timestamp
+    _end_time: Optional[Timestamp] = None
     cards_studied: int = 0
     cards_correct: int = 0
     
+    start_time = LazyTimestamp()
+    end_time = LazyTimestamp()
+    
+    # Used instead of the generated methods, which would show and compare the raw timestamps
+    __eq__ = _model_eq
+    __repr__ = _model_repr
+    
+    def __init__(
+        self,
+        id: str,
+        deck_id: str,
+        start_time: Timestamp,
+        end_time: Optional[Timestamp] = None,
+        cards_studied: int = 0,
+        cards_correct: int = 0
+    ):
+        self.id = id
+        self.deck_id = deck_id
+        self._start_time = start_time
+        self._end_time = end_time
+        self.cards_studied = cards_studied
+        self.cards_correct = cards_correct
+    
     @classmethod
     def create(cls, deck_id: str) -> 'StudySession':
         """Factory method to start a new study session."""
@@ -157,20 +282,12 @@ class StudySession:
     @classmethod
     def from_dict(cls, data: Dict) -> 'StudySession':
         """Create a study session from a dictionary (e.g., from database)."""
-        # Convert string timestamps to datetime objects if needed
-        start_time = data['start_time']
-        if isinstance(start_time, str):
-            start_time = datetime.datetime.fromisoformat(start_time)
-            
-        end_time = data.get('end_time')
-        if isinstance(end_time, str) and end_time:
-            end_time = datetime.datetime.fromisoformat(end_time)
-        
+        # Timestamps are parsed when first accessed
         return cls(
             id=data['id'],
             deck_id=data['deck_id'],
-            start_time=start_time,
-            end_time=end_time,
+            start_time=data['start_time'],
+            end_time=data.get('end_time'),
             cards_studied=data.get('cards_studied', 0),
             cards_correct=data.get('cards_correct', 0)
         )
@@ -180,8 +297,8 @@ class StudySession:
         return {
             'id': self.id,
             'deck_id': self.deck_id,
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'start_time': _to_epoch(self._start_time),
+            'end_time': _to_epoch(self._end_time),
             'cards_studied': self.cards_studied,
             'cards_correct': self.cards_correct
         }
@@ -1,18 +1,41 @@
 import os
 import sqlite3
+import threading
 from typing import List, Dict, Optional, Any, Tuple
 import datetime  # <-- Import datetime
 from contextlib import contextmanager
 from src.data.models import Flashcard, FlashcardDeck, StudySession #
+from src.core.events import DecksSaved, DecksDeleted, CardsSaved, CardsDeleted, SessionsSaved
 from src.utils.logger import get_logger                 #
 from src.utils.error_handling import handle_errors      #
+from src.utils.tracing import traced
+
+# Bumped whenever the schema changes; stored in PRAGMA user_version.
+# Version 1 stores timestamps as integer seconds since the Unix epoch (was ISO text).
+SCHEMA_VERSION = 1
+
+# Timestamp columns converted from ISO text by the version 1 migration
+TIMESTAMP_COLUMNS = {
+    'decks': ('created_at', 'last_studied'),
+    'flashcards': ('created_at', 'last_reviewed'),
+    'study_sessions': ('start_time', 'end_time')
+}
+
+
+def local_midnight(date: datetime.date) -> int:
+    """Get the epoch seconds of the start of a local calendar day."""
+    return int(datetime.datetime.combine(date, datetime.time.min).timestamp())
+
 
 class SQLiteStorage:                                    #
     """SQLite storage implementation for the flashcard application."""
 
-    def __init__(self, db_path: str = None):            #
+    def __init__(self, db_path: str = None, event_bus=None): #
         self.logger = get_logger("storage")
 
+        # Optional EventBus that is told about every committed write
+        self.event_bus = event_bus
+
         # Set default database path if not provided
         if db_path is None:
             data_dir = os.path.join(os.path.expanduser("~"), ".flashcards", "data")
@@ -20,7 +43,12 @@ class SQLiteStorage:                                    #
             db_path = os.path.join(data_dir, "flashcards.db")
 
         self.db_path = db_path
-        self.logger.debug(f"Database path: {self.db_path}")
+        self.logger.debug("Database path: %s", self.db_path)
+
+        # Per-table change counters, bumped after every committed write so
+        # views can tell whether anything changed since they last rendered
+        self._versions_lock = threading.Lock()
+        self._versions = {'decks': 0, 'flashcards': 0, 'study_sessions': 0, 'card_reviews': 0, 'daily_stats': 0}
 
         # Initialize database schema
         self._init_db()
@@ -40,20 +68,54 @@ class SQLiteStorage:                                    #
             if connection:
                 connection.close()
 
+    def data_versions(self) -> Dict[str, int]:
+        """Get a snapshot of the change counter of every table."""
+        with self._versions_lock:
+            return dict(self._versions)
+
+    def _bump_versions(self, *tables: str) -> None:
+        """Record that the given tables were modified."""
+        with self._versions_lock:
+            for table in tables:
+                self._versions[table] += 1
+
+    def _publish(self, *events) -> None:
+        """Publish events for a committed write if an event bus is attached."""
+        if self.event_bus:
+            for event in events:
+                self.event_bus.publish(event)
+
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def _init_db(self) -> None:                         #
-        """Initialize the database schema if it doesn't exist."""
+        """Initialize the database schema if it doesn't exist, migrating older databases."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Create decks table
+            cursor.execute("PRAGMA user_version")
+            version = cursor.fetchone()[0]
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'decks'")
+            migrate = version < SCHEMA_VERSION and cursor.fetchone() is not None
+
+            if migrate:
+                # Tables are rebuilt, so foreign keys must not fire (or be rewritten) meanwhile
+                conn.execute("PRAGMA foreign_keys = OFF")
+                conn.execute("PRAGMA legacy_alter_table = ON")
+            cursor.execute("BEGIN")
+
+            if migrate:
+                self.logger.info("Migrating database from schema version %s to %s", version, SCHEMA_VERSION)
+                for table in TIMESTAMP_COLUMNS:
+                    cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+
+            # Create decks table (timestamps are integer epoch seconds)
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS decks (
                 id TEXT PRIMARY KEY,
                 name TEXT NOT NULL,
                 description TEXT,
-                created_at TEXT NOT NULL,
-                last_studied TEXT
+                created_at INTEGER NOT NULL,
+                last_studied INTEGER
             )
             ''')
 
@@ -65,8 +127,8 @@ class SQLiteStorage:                                    #
                 question TEXT NOT NULL,
                 answer TEXT NOT NULL,
                 topic TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                last_reviewed TEXT,
+                created_at INTEGER NOT NULL,
+                last_reviewed INTEGER,
                 FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
             )
             ''')
@@ -76,25 +138,99 @@ class SQLiteStorage:                                    #
             CREATE TABLE IF NOT EXISTS study_sessions (
                 id TEXT PRIMARY KEY,
                 deck_id TEXT NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
+                start_time INTEGER NOT NULL,
+                end_time INTEGER,
                 cards_studied INTEGER DEFAULT 0,
                 cards_correct INTEGER DEFAULT 0,
                 FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
             )
             ''')
 
+            if migrate:
+                self._copy_legacy_tables(cursor)
+
+            # Indexes for per-deck lookups and date range filters
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_created_at ON decks(created_at)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_flashcards_deck ON flashcards(deck_id, created_at)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_flashcards_last_reviewed ON flashcards(deck_id, last_reviewed)"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_study_sessions_start ON study_sessions(start_time)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_study_sessions_deck ON study_sessions(deck_id, start_time)"
+            )
+
+            # Create card reviews table (one row per card marked during study).
+            # The topic is copied so reviews of deleted cards still count per topic.
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS card_reviews (
+                id INTEGER PRIMARY KEY,
+                card_id TEXT NOT NULL,
+                deck_id TEXT NOT NULL,
+                session_id TEXT,
+                topic TEXT NOT NULL,
+                reviewed_at REAL NOT NULL,
+                correct INTEGER NOT NULL,
+                FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+            )
+            ''')
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_card_reviews_reviewed_at ON card_reviews(reviewed_at)"
+            )
+
+            # Create daily statistics rollup (completed sessions per deck per local day,
+            # keyed by the day the session started), maintained by save_study_session
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_stats'")
+            daily_stats_exists = cursor.fetchone() is not None
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                deck_id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                sessions INTEGER NOT NULL DEFAULT 0,
+                cards_studied INTEGER NOT NULL DEFAULT 0,
+                cards_correct INTEGER NOT NULL DEFAULT 0,
+                seconds_spent REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (deck_id, day),
+                FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+            )
+            ''')
+            if not daily_stats_exists or migrate:
+                # Backfill from the sessions recorded before the rollup existed
+                # (or before their durations were whole seconds)
+                self._rebuild_daily_stats(cursor)
+
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
             self.logger.info("Database initialized")
 
+    def _copy_legacy_tables(self, cursor) -> None:
+        """Copy the renamed version 0 tables into the new ones, converting ISO timestamps to epochs."""
+        for table, timestamp_columns in TIMESTAMP_COLUMNS.items():
+            cursor.execute(f"PRAGMA table_info({table}_legacy)")
+            columns = [row[1] for row in cursor.fetchall()]
+            # ISO text was written from naive local datetimes; 'utc' converts from local time.
+            # Fractions are cut off first: SQLite rounds them to milliseconds, which
+            # can carry into the next second, while epochs are truncated elsewhere.
+            values = [
+                f"CASE WHEN typeof({column}) = 'text' THEN CAST(strftime('%s', substr({column}, 1, 19), 'utc') AS INTEGER) "
+                f"ELSE {column} END" if column in timestamp_columns else column
+                for column in columns
+            ]
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) SELECT {', '.join(values)} FROM {table}_legacy"
+            )
+            self.logger.info("Migrated %s rows of %s", cursor.rowcount, table)
+            cursor.execute(f"DROP TABLE {table}_legacy")
+
     # ===== Deck Operations =====
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def get_all_decks(self) -> List[FlashcardDeck]:     #
         """Get all flashcard decks (without cards)."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM decks ORDER BY created_at DESC")
+            cursor.execute("SELECT * FROM decks ORDER BY created_at DESC, rowid DESC")
             rows = cursor.fetchall()
 
             decks = []
@@ -107,6 +243,7 @@ class SQLiteStorage:                                    #
             return decks
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def get_deck(self, deck_id: str) -> Optional[FlashcardDeck]: #
         """Get a specific deck by ID, including its cards."""
         with self._get_connection() as conn:
@@ -121,7 +258,8 @@ class SQLiteStorage:                                    #
             deck_dict = dict(row)
 
             # Now get all cards for this deck
-            cursor.execute("SELECT * FROM flashcards WHERE deck_id = ? ORDER BY created_at", (deck_id,))
+            # Cards created in the same second keep their insertion order
+            cursor.execute("SELECT * FROM flashcards WHERE deck_id = ? ORDER BY created_at, rowid", (deck_id,))
             card_rows = cursor.fetchall()
 
             cards = [Flashcard.from_dict(dict(card_row)) for card_row in card_rows]
@@ -130,6 +268,7 @@ class SQLiteStorage:                                    #
             return FlashcardDeck.from_dict(deck_dict, cards)
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def save_deck(self, deck: FlashcardDeck) -> bool:   #
         """Save a deck and its cards to the database."""
         with self._get_connection() as conn:
@@ -150,7 +289,7 @@ class SQLiteStorage:                                    #
                 ''', (
                     deck_dict['name'],
                     deck_dict['description'],
-                    deck_dict['last_studied'], # Model ensures correct format (ISO string or None)
+                    deck_dict['last_studied'], # Model ensures correct format (epoch seconds or None)
                     deck_dict['id']
                 ))
             else:
@@ -162,8 +301,8 @@ class SQLiteStorage:                                    #
                     deck_dict['id'],
                     deck_dict['name'],
                     deck_dict['description'],
-                    deck_dict['created_at'], # Model ensures correct format (ISO string)
-                    deck_dict['last_studied'] # Model ensures correct format (ISO string or None)
+                    deck_dict['created_at'], # Model ensures correct format (epoch seconds)
+                    deck_dict['last_studied'] # Model ensures correct format (epoch seconds or None)
                 ))
 
             # Save cards (use the dedicated save_card method)
@@ -172,9 +311,72 @@ class SQLiteStorage:                                    #
                 self.save_card(card, deck.id, conn)
 
             conn.commit()
+            self._bump_versions('decks', 'flashcards')
+            self._publish(DecksSaved([deck.id]), CardsSaved(list(deck.cards), [deck.id]))
+            return True
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def save_decks(self, decks: List[FlashcardDeck]) -> bool:
+        """Save many decks and their cards in a single transaction (bulk path)."""
+        deck_rows = []
+        card_rows = []
+        for deck in decks:
+            deck_dict = deck.to_dict()
+            deck_rows.append((
+                deck_dict['id'],
+                deck_dict['name'],
+                deck_dict['description'],
+                deck_dict['created_at'],
+                deck_dict['last_studied']
+            ))
+            for card in deck.cards:
+                card_dict = card.to_dict()
+                card_rows.append((
+                    card_dict['id'],
+                    deck.id,
+                    card_dict['question'],
+                    card_dict['answer'],
+                    card_dict['topic'],
+                    card_dict['created_at'],
+                    card_dict['last_reviewed']
+                ))
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Upsert so existing decks/cards are updated rather than duplicated
+            cursor.executemany('''
+            INSERT INTO decks (id, name, description, created_at, last_studied)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                name = excluded.name,
+                description = excluded.description,
+                last_studied = excluded.last_studied
+            ''', deck_rows)
+
+            cursor.executemany('''
+            INSERT INTO flashcards (id, deck_id, question, answer, topic, created_at, last_reviewed)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                question = excluded.question,
+                answer = excluded.answer,
+                topic = excluded.topic,
+                last_reviewed = excluded.last_reviewed
+            ''', card_rows)
+
+            conn.commit()
+            self._bump_versions('decks', 'flashcards')
+            # One event per table for the whole batch
+            self._publish(
+                DecksSaved([deck.id for deck in decks]),
+                CardsSaved([card for deck in decks for card in deck.cards], [deck.id for deck in decks])
+            )
+            self.logger.info("Bulk saved %s decks with %s cards", len(deck_rows), len(card_rows))
             return True
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def delete_deck(self, deck_id: str) -> bool:        #
         """Delete a deck and all its cards (and related sessions due to CASCADE)."""
         with self._get_connection() as conn:
@@ -182,11 +384,15 @@ class SQLiteStorage:                                    #
             # CASCADE constraint should handle deleting cards and sessions
             cursor.execute("DELETE FROM decks WHERE id = ?", (deck_id,))
             conn.commit()
+            self._bump_versions('decks', 'flashcards', 'study_sessions', 'card_reviews', 'daily_stats')
+            if cursor.rowcount > 0:
+                self._publish(DecksDeleted([deck_id]))
             return cursor.rowcount > 0
 
     # ===== Card Operations =====
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def save_card(self, card: Flashcard, deck_id: str, connection=None) -> bool: #
         """Save a card to the database. Uses provided connection if available."""
         close_conn = False
@@ -216,7 +422,7 @@ class SQLiteStorage:                                    #
                 ''', (
                     card_dict['question'],
                     card_dict['answer'],
-                    card_dict['last_reviewed'], # Model ensures correct format (ISO string or None)
+                    card_dict['last_reviewed'], # Model ensures correct format (epoch seconds or None)
                     card_dict['topic'],
                     card_dict['id']
                 ))
@@ -231,13 +437,15 @@ class SQLiteStorage:                                    #
                     card_dict['question'],
                     card_dict['answer'],
                     card_dict['topic'],
-                    card_dict['created_at'], # Model ensures correct format (ISO string)
-                    card_dict['last_reviewed'] # Model ensures correct format (ISO string or None)
+                    card_dict['created_at'], # Model ensures correct format (epoch seconds)
+                    card_dict['last_reviewed'] # Model ensures correct format (epoch seconds or None)
                 ))
 
             # Only commit if we created our own connection within this call
             if close_conn:
                 conn.commit()
+                self._bump_versions('flashcards')
+                self._publish(CardsSaved([card], [deck_id]))
 
             return True
         finally:
@@ -246,25 +454,95 @@ class SQLiteStorage:                                    #
                 conn.close()
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def delete_card(self, card_id: str) -> bool:        #
         """Delete a card from the database."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM flashcards WHERE id = ?", (card_id,))
             conn.commit()
+            self._bump_versions('flashcards')
+            if cursor.rowcount > 0:
+                self._publish(CardsDeleted([card_id]))
             return cursor.rowcount > 0
 
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def save_review(
+        self,
+        card: Flashcard,
+        deck_id: str,
+        correct: bool,
+        session_id: Optional[str] = None
+    ) -> bool:
+        """Save a reviewed card and record the review outcome in one transaction."""
+        with self._get_connection() as conn:
+            self.save_card(card, deck_id, connection=conn)
+
+            reviewed_at = card.last_reviewed or datetime.datetime.now()
+            conn.execute('''
+            INSERT INTO card_reviews (card_id, deck_id, session_id, topic, reviewed_at, correct)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ''', (card.id, deck_id, session_id, card.topic, reviewed_at.timestamp(), int(correct)))
+
+            conn.commit()
+            self._bump_versions('flashcards', 'card_reviews')
+            self._publish(CardsSaved([card], [deck_id]))
+            return True
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def get_review_rows(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> List[Tuple]:
+        """
+        Get card reviews as plain rows for analytics.
+
+        Returns:
+            List of (reviewed at POSIX timestamp, correct, card id, topic), oldest first
+        """
+        with self._get_connection() as conn:
+            conn.row_factory = None  # Plain tuples are much cheaper for large result sets
+            cursor = conn.cursor()
+
+            query = "SELECT reviewed_at, correct, card_id, topic FROM card_reviews WHERE 1 = 1"
+            params = []
+
+            if deck_id:
+                query += " AND deck_id = ?"
+                params.append(deck_id)
+            if start_date:
+                query += " AND reviewed_at >= ?"
+                params.append(local_midnight(start_date))
+            if end_date:
+                query += " AND reviewed_at < ?"
+                params.append(local_midnight(end_date + datetime.timedelta(days=1)))
+
+            query += " ORDER BY reviewed_at"
+
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+
     # ===== Study Session Operations =====
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def save_study_session(self, session: StudySession) -> bool: #
         """Save a study session to the database."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if session already exists
-            cursor.execute("SELECT 1 FROM study_sessions WHERE id = ?", (session.id,))
-            exists = cursor.fetchone() is not None
+            # Check if session already exists, keeping the saved version so its
+            # contribution to daily_stats can be replaced
+            cursor.execute(
+                "SELECT deck_id, start_time, end_time, cards_studied, cards_correct FROM study_sessions WHERE id = ?",
+                (session.id,)
+            )
+            previous = cursor.fetchone()
+            exists = previous is not None
 
             session_dict = session.to_dict() # Use the model's conversion method
 
@@ -275,7 +553,7 @@ class SQLiteStorage:                                    #
                 SET end_time = ?, cards_studied = ?, cards_correct = ?
                 WHERE id = ?
                 ''', (
-                    session_dict['end_time'], # Model ensures correct format (ISO string or None)
+                    session_dict['end_time'], # Model ensures correct format (epoch seconds or None)
                     session_dict['cards_studied'],
                     session_dict['cards_correct'],
                     session_dict['id']
@@ -288,26 +566,162 @@ class SQLiteStorage:                                    #
                 ''', (
                     session_dict['id'],
                     session_dict['deck_id'],
-                    session_dict['start_time'], # Model ensures correct format (ISO string)
-                    session_dict['end_time'], # Model ensures correct format (ISO string or None)
+                    session_dict['start_time'], # Model ensures correct format (epoch seconds)
+                    session_dict['end_time'], # Model ensures correct format (epoch seconds or None)
                     session_dict['cards_studied'],
                     session_dict['cards_correct']
                 ))
 
+            # Keep the daily rollup in step with the completed sessions
+            if previous and previous['end_time'] is not None:
+                self._add_to_daily_stats(
+                    cursor,
+                    previous['deck_id'],
+                    previous['start_time'],
+                    previous['end_time'],
+                    previous['cards_studied'] or 0,
+                    previous['cards_correct'] or 0,
+                    sign=-1
+                )
+            if session_dict['end_time'] is not None:
+                self._add_to_daily_stats(
+                    cursor, session.deck_id, session_dict['start_time'], session_dict['end_time'],
+                    session.cards_studied, session.cards_correct
+                )
+
             # If session is complete, update the deck's last_studied timestamp
-            if session.end_time:
-                # Make sure end_time is formatted correctly for update
-                last_studied_ts = session.end_time.isoformat() if session.end_time else None
-                if last_studied_ts: # Only update if end_time is valid
-                    cursor.execute(
-                        "UPDATE decks SET last_studied = ? WHERE id = ?",
-                        (last_studied_ts, session.deck_id)
-                    )
+            if session_dict['end_time'] is not None:
+                cursor.execute(
+                    "UPDATE decks SET last_studied = ? WHERE id = ?",
+                    (session_dict['end_time'], session.deck_id)
+                )
 
             conn.commit()
+            self._bump_versions('study_sessions', 'daily_stats')
+            self._publish(SessionsSaved([session]))
+            if session.end_time:
+                # Completing a session also updates the deck's last_studied
+                self._bump_versions('decks')
+                self._publish(DecksSaved([session.deck_id]))
             return True
 
+    def _add_to_daily_stats(
+        self,
+        cursor,
+        deck_id: str,
+        start_time: int,
+        end_time: int,
+        cards_studied: int,
+        cards_correct: int,
+        sign: int = 1
+    ) -> None:
+        """
+        Add a completed session to (or with sign=-1, remove it from) the daily rollup.
+
+        Args:
+            start_time, end_time: Epoch seconds as stored in study_sessions
+        """
+        day = datetime.date.fromtimestamp(start_time).isoformat()
+        cursor.execute('''
+        INSERT INTO daily_stats (deck_id, day, sessions, cards_studied, cards_correct, seconds_spent)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (deck_id, day) DO UPDATE SET
+            sessions = sessions + excluded.sessions,
+            cards_studied = cards_studied + excluded.cards_studied,
+            cards_correct = cards_correct + excluded.cards_correct,
+            seconds_spent = seconds_spent + excluded.seconds_spent
+        ''', (
+            deck_id,
+            day,
+            sign,
+            sign * cards_studied,
+            sign * cards_correct,
+            sign * (end_time - start_time)
+        ))
+        if sign < 0:
+            cursor.execute(
+                "DELETE FROM daily_stats WHERE deck_id = ? AND day = ? AND sessions <= 0",
+                (deck_id, day)
+            )
+
+    def _rebuild_daily_stats(self, cursor) -> None:
+        """Recompute the daily rollup from the study_sessions table."""
+        cursor.execute("DELETE FROM daily_stats")
+        # Sessions are grouped by the local day on which they started
+        cursor.execute('''
+        INSERT INTO daily_stats (deck_id, day, sessions, cards_studied, cards_correct, seconds_spent)
+        SELECT deck_id, date(start_time, 'unixepoch', 'localtime'), COUNT(*),
+               COALESCE(SUM(cards_studied), 0), COALESCE(SUM(cards_correct), 0),
+               COALESCE(SUM(end_time - start_time), 0)
+        FROM study_sessions
+        WHERE end_time IS NOT NULL
+        GROUP BY deck_id, date(start_time, 'unixepoch', 'localtime')
+        ''')
+
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def rebuild_daily_stats(self) -> int:
+        """
+        Recompute the daily statistics rollup from all completed sessions.
+
+        Returns:
+            Number of per-deck daily rows written
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._rebuild_daily_stats(cursor)
+            cursor.execute("SELECT COUNT(*) FROM daily_stats")
+            row_count = cursor.fetchone()[0]
+            conn.commit()
+            self._bump_versions('daily_stats')
+            self.logger.info("Rebuilt daily statistics: %s rows", row_count)
+            return row_count
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def get_daily_stats(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> List[Tuple]:
+        """
+        Get completed session totals per day from the daily rollup.
+
+        Returns:
+            List of (day, sessions, cards studied, cards correct, seconds spent),
+            summed over all decks unless ``deck_id`` is given, oldest first
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = '''
+            SELECT day, SUM(sessions), SUM(cards_studied), SUM(cards_correct), SUM(seconds_spent)
+            FROM daily_stats
+            WHERE 1 = 1
+            '''
+            params = []
+
+            if deck_id:
+                query += " AND deck_id = ?"
+                params.append(deck_id)
+            if start_date:
+                query += " AND day >= ?"
+                params.append(start_date.isoformat())
+            if end_date:
+                query += " AND day <= ?"
+                params.append(end_date.isoformat())
+
+            query += " GROUP BY day ORDER BY day"
+
+            cursor.execute(query, tuple(params))
+            return [
+                (datetime.date.fromisoformat(row[0]), row[1], row[2], row[3], row[4])
+                for row in cursor.fetchall()
+            ]
+
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def get_study_sessions(                       # MODIFIED: Added date params
         self,
         deck_id: Optional[str] = None,
@@ -327,28 +741,73 @@ class SQLiteStorage:                                    #
                 query += " AND deck_id = ?"
                 params.append(deck_id)
 
-            # Add date filter using full timestamp strings for comparison
+            # Add date filter on epoch seconds (index range scan)
             if start_date:
-                # Compare against the beginning of the start_date (inclusive)
-                start_dt_str = start_date.isoformat() + " 00:00:00"
+                # From the beginning of the start_date (inclusive)
                 query += " AND start_time >= ?"
-                params.append(start_dt_str)
+                params.append(local_midnight(start_date))
             if end_date:
-                # Compare against the end of the end_date (inclusive)
-                end_dt_str = end_date.isoformat() + " 23:59:59"
-                query += " AND start_time <= ?"
-                params.append(end_dt_str)
+                # Up to the end of the end_date (inclusive)
+                query += " AND start_time < ?"
+                params.append(local_midnight(end_date + datetime.timedelta(days=1)))
 
-            query += " ORDER BY start_time DESC"
+            query += " ORDER BY start_time DESC, rowid DESC"
 
-            self.logger.debug(f"Executing query: {query} with params: {params}")
+            self.logger.debug("Executing query: %s with params: %s", query, params)
             cursor.execute(query, tuple(params))
             rows = cursor.fetchall()
 
             return [StudySession.from_dict(dict(row)) for row in rows]
 
+    @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
+    def get_session_rows(
+        self,
+        deck_id: Optional[str] = None,
+        start_date: Optional[datetime.date] = None,
+        end_date: Optional[datetime.date] = None
+    ) -> List[Tuple]:
+        """
+        Get completed study sessions as lightweight rows for the history table.
+
+        Deck names are joined in the same query instead of loading each deck.
+
+        Returns:
+            List of (id, deck name, start time, end time, cards studied, cards correct),
+            newest first, with times as epoch seconds
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = '''
+            SELECT s.id, COALESCE(d.name, 'Unknown Deck'), s.start_time, s.end_time,
+                   s.cards_studied, s.cards_correct
+            FROM study_sessions s
+            LEFT JOIN decks d ON d.id = s.deck_id
+            WHERE s.end_time IS NOT NULL
+            '''
+            params = []
+
+            if deck_id:
+                query += " AND s.deck_id = ?"
+                params.append(deck_id)
+            if start_date:
+                query += " AND s.start_time >= ?"
+                params.append(local_midnight(start_date))
+            if end_date:
+                query += " AND s.start_time < ?"
+                params.append(local_midnight(end_date + datetime.timedelta(days=1)))
+
+            query += " ORDER BY s.start_time DESC, s.rowid DESC"
+
+            conn.row_factory = None  # Plain tuples
+            cursor = conn.cursor()
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+
     # ADDED: Method to get a single session by ID
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def get_study_session(self, session_id: str) -> Optional[StudySession]: #
         """Get a single study session by its ID."""
         with self._get_connection() as conn:
@@ -360,6 +819,7 @@ class SQLiteStorage:                                    #
             return None
 
     @handle_errors(show_dialog=False, log_exception=True)
+    @traced(category="storage")
     def get_deck_stats(                           # MODIFIED: Added date params
         self,
         deck_id: str,
@@ -377,38 +837,34 @@ class SQLiteStorage:                                    #
             total_cards = total_cards_row[0] if total_cards_row else 0 # Then access data
 
             # Get cards reviewed (filter by date if provided)
-            # Assuming last_reviewed is also stored as a full timestamp string (ISO format)
+            # last_reviewed is stored as epoch seconds
             reviewed_query = "SELECT COUNT(*) FROM flashcards WHERE deck_id = ? AND last_reviewed IS NOT NULL"
             reviewed_params = [deck_id]
             if start_date:
-                 start_dt_str = start_date.isoformat() + " 00:00:00"
                  reviewed_query += " AND last_reviewed >= ?"
-                 reviewed_params.append(start_dt_str)
+                 reviewed_params.append(local_midnight(start_date))
             if end_date:
-                 end_dt_str = end_date.isoformat() + " 23:59:59"
-                 reviewed_query += " AND last_reviewed <= ?"
-                 reviewed_params.append(end_dt_str)
+                 reviewed_query += " AND last_reviewed < ?"
+                 reviewed_params.append(local_midnight(end_date + datetime.timedelta(days=1)))
             cursor.execute(reviewed_query, tuple(reviewed_params))
             reviewed_cards_row = cursor.fetchone() # Fetch the row first
             reviewed_cards = reviewed_cards_row[0] if reviewed_cards_row else 0 # Then access data
             # --- END CORRECTION ---
 
 
-            # Get study sessions stats (filter by date if provided)
+            # Get study sessions stats from the daily rollup (filter by date if provided)
             session_query = '''
-            SELECT COUNT(*), SUM(cards_studied), SUM(cards_correct)
-            FROM study_sessions
-            WHERE deck_id = ? AND end_time IS NOT NULL
+            SELECT SUM(sessions), SUM(cards_studied), SUM(cards_correct)
+            FROM daily_stats
+            WHERE deck_id = ?
             '''
             session_params = [deck_id]
             if start_date:
-                start_dt_str = start_date.isoformat() + " 00:00:00"
-                session_query += " AND start_time >= ?"
-                session_params.append(start_dt_str)
+                session_query += " AND day >= ?"
+                session_params.append(start_date.isoformat())
             if end_date:
-                end_dt_str = end_date.isoformat() + " 23:59:59"
-                session_query += " AND start_time <= ?"
-                session_params.append(end_dt_str)
+                session_query += " AND day <= ?"
+                session_params.append(end_date.isoformat())
 
             cursor.execute(session_query, tuple(session_params))
 
@@ -417,7 +873,7 @@ class SQLiteStorage:                                    #
             total_studied = 0
             total_correct = 0
             accuracy = 0.0
-            # Check if row exists and COUNT(*) is not None before accessing aggregates
+            # Check if row exists and the session total is not None before accessing aggregates
             if row and row[0] is not None and row[0] > 0:
                 session_count = row[0]
                 # SUM can return None if no matching rows or all values are NULL
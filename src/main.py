@@ -1,14 +1,29 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from src.core.app import FlashCardApp
+from src.core.startup import StartupTimer, ImportProfiler, profiling_requested
+from src.utils.tracing import tracing_requested, enable_tracing
 
 def main():
 
+    # start timing before the heavy imports so they show up in the profile
+    import_profiler = None
+    if profiling_requested(sys.argv):
+        import_profiler = ImportProfiler()
+        import_profiler.install()
+    startup_timer = StartupTimer(import_profiler)
+
+    # record performance spans from the start; the trace is exported on exit
+    if tracing_requested(sys.argv):
+        enable_tracing()
+
+    from PyQt6.QtWidgets import QApplication
+    from src.core.app import FlashCardApp
+    startup_timer.mark("imports")
+
     # create the QApplication instance (the beating heart of the app)
     q_app = QApplication(sys.argv)
 
     # create the mainwindow
-    app = FlashCardApp()
+    app = FlashCardApp(startup_timer)
     app.show()
 
     # run the app until its closed 
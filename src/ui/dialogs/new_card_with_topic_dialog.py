@@ -118,7 +118,7 @@ class NewCardWithTopicDialog(QDialog):
                 break
 
         if not deck_id:
-            self.logger.error(f"Could not find deck_id for topic: {topic_name}")
+            self.logger.error("Could not find deck_id for topic: %s", topic_name)
             QMessageBox.critical(
                 self,
                 "Database Error",
@@ -0,0 +1,317 @@
+# src/ui/dialogs/performance_dialog.py
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QGroupBox,
+    QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox,
+    QPushButton, QDialogButtonBox, QFileDialog, QSplitter, QPlainTextEdit
+)
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+
+from src.core.performance import PerformanceSampler, LATENCY_BUCKETS_MS
+from src.utils import tracing
+from src.utils.logger import get_logger
+from src.utils.error_handling import handle_errors
+
+class PerformanceDialog(QDialog):
+    """
+    Dialog showing live performance counters.
+
+    Timings come from the tracing spans (see ``src.utils.tracing``), the
+    event-loop latency and stalls from an EventLoopWatchdog. The other
+    counters are gathered by a PerformanceSampler on the thread pool, so
+    refreshing does not block the event loop it reports on.
+    """
+
+    REFRESH_INTERVAL_MS = 1000
+
+    # Span categories and the tabs that show them
+    SPAN_TABS = [("storage", "Database"), ("api", "API"), ("ui", "Views")]
+
+    def __init__(self, storage, watchdog=None, cache_provider=None, parent=None):
+        super().__init__(parent)
+        self.storage = storage
+        self.watchdog = watchdog
+        self.cache_provider = cache_provider
+        self.logger = get_logger("performance_dialog")
+        self._sampler = None
+
+        self.setWindowTitle("Performance")
+        self.setMinimumSize(760, 560)
+        self.setObjectName("performanceDialog")  # For CSS styling
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.setup_ui()
+
+    @handle_errors(dialog_title="UI Error")
+    def setup_ui(self):
+        """Set up the user interface."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+
+        # Headline counters
+        overview_group = QGroupBox("Overview")
+        overview_layout = QGridLayout(overview_group)
+
+        self.metric_labels = {}
+        metrics = [
+            ("loop", "Event loop latency:"),
+            ("stalls", "Event loop stalls:"),
+            ("memory", "Memory (current / peak):"),
+            ("threads", "Threads:"),
+            ("database", "Database queries:"),
+            ("database_size", "Database size:"),
+            ("cache", "Response cache hit rate:"),
+            ("cache_size", "Response cache size:"),
+            ("api", "API requests:")
+        ]
+        for index, (key, title) in enumerate(metrics):
+            row, column = divmod(index, 2)
+            value_label = QLabel("-")
+            value_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            overview_layout.addWidget(QLabel(title), row, column * 2)
+            overview_layout.addWidget(value_label, row, column * 2 + 1)
+            self.metric_labels[key] = value_label
+
+        layout.addWidget(overview_group)
+
+        # Tracing controls
+        controls_layout = QHBoxLayout()
+        self.tracing_checkbox = QCheckBox("Record timings")
+        self.tracing_checkbox.setToolTip("Record a span for every storage method, API call and view refresh")
+        self.tracing_checkbox.setChecked(tracing.tracing_enabled())
+        self.tracing_checkbox.toggled.connect(self.set_tracing)
+        controls_layout.addWidget(self.tracing_checkbox)
+        controls_layout.addStretch()
+
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset_timings)
+        controls_layout.addWidget(reset_button)
+
+        export_button = QPushButton("Export Trace...")
+        export_button.clicked.connect(self.export_trace)
+        controls_layout.addWidget(export_button)
+        layout.addLayout(controls_layout)
+
+        # Per-span latency tables
+        self.span_tabs = QTabWidget()
+        self.span_tables = {}
+        headers = ["Name", "Calls", "p50", "p95", "p99", "Max"] + self.histogram_headers()
+        for category, title in self.SPAN_TABS:
+            table = QTableWidget(0, len(headers))
+            table.setHorizontalHeaderLabels(headers)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            table.verticalHeader().setVisible(False)
+            table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            self.span_tabs.addTab(table, title)
+            self.span_tables[category] = table
+
+        # Stalls caught by the watchdog, with the GUI thread stack of the selected one
+        stalls_splitter = QSplitter(Qt.Orientation.Vertical)
+        self.stalls_table = QTableWidget(0, 3)
+        self.stalls_table.setHorizontalHeaderLabels(["Time", "Duration", "Blocking function"])
+        self.stalls_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.stalls_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.stalls_table.verticalHeader().setVisible(False)
+        self.stalls_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.stalls_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.stalls_table.itemSelectionChanged.connect(self.show_stall_stack)
+        stalls_splitter.addWidget(self.stalls_table)
+
+        self.stall_stack = QPlainTextEdit()
+        self.stall_stack.setReadOnly(True)
+        self.stall_stack.setPlaceholderText("Select a stall to see where the GUI thread was")
+        stalls_splitter.addWidget(self.stall_stack)
+        self.span_tabs.addTab(stalls_splitter, "Stalls")
+        self._stall_reports = []
+        self._stall_signature = []
+
+        layout.addWidget(self.span_tabs, 1)
+
+        self.status_label = QLabel()
+        self.status_label.setObjectName("performanceStatus")
+        layout.addWidget(self.status_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    @staticmethod
+    def histogram_headers():
+        """Get the column titles of the latency histogram buckets."""
+        bounds = LATENCY_BUCKETS_MS
+        headers = [f"<{bounds[0]} ms"]
+        headers += [f"{low}-{high} ms" for low, high in zip(bounds, bounds[1:])]
+        headers.append(f"≥{bounds[-1]} ms")
+        return headers
+
+    @staticmethod
+    def format_ms(value):
+        """Format milliseconds with a precision suited to their size."""
+        return f"{value:.2f} ms" if value < 10 else f"{value:.0f} ms"
+
+    @staticmethod
+    def format_bytes(value):
+        """Format a byte count, or N/A if it is unknown."""
+        if value is None:
+            return "N/A"
+        for unit in ("B", "KB", "MB"):
+            if value < 1024:
+                return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+            value /= 1024
+        return f"{value:.1f} GB"
+
+    def showEvent(self, event):
+        """Start refreshing while the dialog is visible."""
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        """Stop refreshing while the dialog is hidden."""
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """Update the event-loop counters and request a new snapshot of the others."""
+        self.show_loop_latency()
+
+        # Skip this tick if the previous snapshot is still being gathered
+        if self._sampler is not None:
+            return
+        self._sampler = PerformanceSampler(self.storage, self.cache_provider)
+        self._sampler.signals.finished.connect(self.on_snapshot)
+        QThreadPool.globalInstance().start(self._sampler)
+
+    def show_loop_latency(self):
+        """Display the event-loop latency measured by the monitor."""
+        if self.watchdog is None:
+            self.metric_labels["loop"].setText("N/A")
+            self.metric_labels["stalls"].setText("N/A")
+            return
+
+        loop = self.watchdog.snapshot()
+        self.metric_labels["loop"].setText(
+            f"{loop['current']:.0f} ms now, {loop['p95']:.0f} ms p95, {loop['max']:.0f} ms max (last minute)"
+        )
+        self.metric_labels["stalls"].setText(
+            f"{loop['stalls']} over {self.watchdog.stall_threshold_ms} ms (worst {loop['worst']:.0f} ms)"
+        )
+        self.show_stalls(self.watchdog.recent_reports())
+
+    def show_stalls(self, reports):
+        """Display the recent stall reports, newest first, keeping the selection."""
+        # Reports are updated in place when a stall ends
+        signature = [(id(report), report.ongoing) for report in reports]
+        if signature == self._stall_signature:
+            return
+        selected = self.selected_stall()
+        self._stall_reports = reports
+        self._stall_signature = signature
+
+        self.stalls_table.setRowCount(len(reports))
+        for row, report in enumerate(reports):
+            duration = "ongoing" if report.ongoing else self.format_ms(report.duration_ms)
+            values = [report.started.strftime("%H:%M:%S"), duration, report.function]
+            for column, value in enumerate(values):
+                self.stalls_table.setItem(row, column, QTableWidgetItem(value))
+            if report is selected:
+                self.stalls_table.selectRow(row)
+
+    def selected_stall(self):
+        """Get the StallReport of the selected row, or None."""
+        rows = self.stalls_table.selectionModel().selectedRows()
+        if rows and rows[0].row() < len(self._stall_reports):
+            return self._stall_reports[rows[0].row()]
+        return None
+
+    def show_stall_stack(self):
+        """Show the GUI thread stack captured for the selected stall."""
+        report = self.selected_stall()
+        if report is None:
+            self.stall_stack.clear()
+            return
+        self.stall_stack.setPlainText(
+            f"Blocked in {report.function}\n\nGUI thread stack (most recent call last):\n  "
+            + "\n  ".join(report.stack)
+        )
+
+    def on_snapshot(self, snapshot):
+        """Display a gathered PerformanceSnapshot; a failed one is retried on the next refresh."""
+        self._sampler = None
+        if snapshot is None or not self.isVisible():
+            return
+
+        current, peak = snapshot.memory
+        self.metric_labels["memory"].setText(f"{self.format_bytes(current)} / {self.format_bytes(peak)}")
+        self.metric_labels["threads"].setText(str(snapshot.threads))
+        self.metric_labels["database"].setText(str(snapshot.calls.get("storage", 0)))
+        self.metric_labels["database_size"].setText(self.format_bytes(snapshot.database_bytes))
+        self.metric_labels["api"].setText(str(snapshot.calls.get("api", 0)))
+
+        cache = snapshot.cache
+        if cache is None:
+            self.metric_labels["cache"].setText("Disabled")
+            self.metric_labels["cache_size"].setText("N/A")
+        else:
+            self.metric_labels["cache"].setText(
+                f"{cache['hit_rate'] * 100:.0f}% ({cache['hits']} hits, {cache['misses']} misses)"
+            )
+            self.metric_labels["cache_size"].setText(
+                f"{cache['entries']} entries, {self.format_bytes(cache['bytes'])}"
+            )
+
+        for category, table in self.span_tables.items():
+            self.fill_span_table(table, snapshot.spans.get(category, []))
+
+        if snapshot.tracing_enabled:
+            self.status_label.setText(f"Timings of the last {tracing.recorder.spans.maxlen} spans")
+        else:
+            self.status_label.setText("Timing is off; check \"Record timings\" to measure calls")
+
+    def fill_span_table(self, table, rows):
+        """Replace the rows of a span latency table."""
+        table.setRowCount(len(rows))
+        for row, span_row in enumerate(rows):
+            stats = span_row.stats
+            values = [
+                stats.name,
+                str(span_row.lifetime_calls),
+                self.format_ms(stats.p50),
+                self.format_ms(stats.p95),
+                self.format_ms(stats.p99),
+                self.format_ms(stats.max)
+            ] + [str(count) for count in span_row.histogram]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row, column, item)
+
+    def set_tracing(self, enabled):
+        """Turn span recording on or off."""
+        if enabled:
+            tracing.enable_tracing()
+        else:
+            tracing.disable_tracing()
+        self.refresh()
+
+    def reset_timings(self, checked=None):
+        """Forget the recorded spans and the event-loop stall count."""
+        tracing.recorder.clear()
+        if self.watchdog is not None:
+            self.watchdog.reset()
+        self.refresh()
+
+    @handle_errors(dialog_title="Export Error")
+    def export_trace(self, checked=None):
+        """Save the recorded spans as a Chrome trace file."""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", tracing.get_trace_path(), "Chrome trace (*.json)"
+        )
+        if not path:
+            return
+        if tracing.export_chrome_trace(path):
+            self.status_label.setText(f"Trace written to {path}")
@@ -141,14 +141,16 @@ class SettingsDialog(QDialog):
         theme = self.theme_combo.currentData()
         font_size = self.font_size_combo.currentData()
         
-        # Save to settings
-        self.settings.set("api_url", api_url)
-        self.settings.set("api_timeout", api_timeout)
-        self.settings.set("study_session_cards", cards_per_session)
-        self.settings.set("shuffle_cards", shuffle_cards)
-        self.settings.set("auto_flip", auto_flip)
-        self.settings.set("theme", theme)
-        self.settings.set("font_size", font_size)
+        # Save to settings as one change
+        self.settings.update({
+            "api_url": api_url,
+            "api_timeout": api_timeout,
+            "study_session_cards": cards_per_session,
+            "shuffle_cards": shuffle_cards,
+            "auto_flip": auto_flip,
+            "theme": theme,
+            "font_size": font_size
+        })
         
         self.logger.info("Settings applied")
         
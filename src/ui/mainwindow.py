@@ -11,14 +11,19 @@ from src.ui.views.study_view import StudyView
 from src.ui.views.history_view import HistoryView
 from src.ui.dialogs.settings_dialog import SettingsDialog
 from src.ui.dialogs.about_dialog import AboutDialog
+from src.ui.dialogs.performance_dialog import PerformanceDialog
+from src.utils.watchdog import EventLoopWatchdog
 from src.ui.theme import ThemeManager
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, configure_log_levels
 from src.utils.error_handling import handle_errors
-from src.api.client import APIClient
+from src.utils.tracing import traced
 
 class MainWindow(QMainWindow):
     """Main application window with tabs, menus, and central widget."""
 
+    # Emitted once the window has painted for the first time
+    first_painted = pyqtSignal()
+
     def __init__(self, settings, storage):
         super().__init__()
 
@@ -26,14 +31,31 @@ class MainWindow(QMainWindow):
         self.storage = storage
         self.logger = get_logger("mainwindow")
 
+        # Views are built when their tab is first activated
+        self.home_view = None
+        self.study_view = None
+        self.history_view = None
+        self._tab_views = {}  # placeholder container -> (view attribute, factory)
+        self._first_paint_done = False
+        self._data_loaded = False
+
+        # Reports event-loop stalls; started once the window has painted
+        self.watchdog = EventLoopWatchdog(stall_threshold_ms=self.settings.get("stall_threshold_ms", 250))
+        self.performance_dialog = None
+
         # Initialize theme manager
-        self.theme_manager = ThemeManager(self.settings)
+        self.theme_manager = ThemeManager.shared(self.settings)
+
+        # React only to the settings the window depends on; views subscribe to their own keys
+        self.settings.subscribe(("theme",), self.on_theme_setting_changed)
+        self.settings.subscribe(("log_level", "log_levels"), self.on_log_settings_changed)
+        self.settings.subscribe(("stall_threshold_ms",), self.on_stall_threshold_changed)
 
         # Get screen information for responsive sizing
         self.screen_geometry = QApplication.primaryScreen().geometry()
         self.screen_width = self.screen_geometry.width()
         self.screen_height = self.screen_geometry.height()
-        self.logger.info(f"Screen dimensions: {self.screen_width}x{self.screen_height}")
+        self.logger.info("Screen dimensions: %sx%s", self.screen_width, self.screen_height)
 
         # Setup UI components
         self.setup_ui()
@@ -69,15 +91,13 @@ class MainWindow(QMainWindow):
         self.tab_widget.setMovable(True)  # Allow tab reordering
         self.tab_widget.setObjectName("mainTabs")
         
-        # Create views
-        self.home_view = HomeView(self.settings, self.storage)
-        self.study_view = StudyView(self.settings, self.storage)
-        self.history_view = HistoryView(self.settings, self.storage)
+        # Add placeholder tabs; each view is built on first activation
+        self.add_lazy_tab("Create Cards", "home_view", self.create_home_view)
+        self.add_lazy_tab("Study", "study_view", self.create_study_view)
+        self.add_lazy_tab("History", "history_view", self.create_history_view)
 
-        # Add tabs (QTabWidget takes ownership of the view widgets)
-        self.tab_widget.addTab(self.home_view, "Create Cards")
-        self.tab_widget.addTab(self.study_view, "Study")
-        self.tab_widget.addTab(self.history_view, "History")
+        # The first tab is visible immediately
+        self.ensure_view(0)
 
         # Add tab widget to layout (layout handles parenting now)
         self.main_layout.addWidget(self.tab_widget)
@@ -94,6 +114,74 @@ class MainWindow(QMainWindow):
         # Connect signals
         self.connect_signals()
 
+    def add_lazy_tab(self, title, attribute, factory):
+        """Add a tab whose view is created by ``factory`` when it is first shown."""
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self._tab_views[container] = (attribute, factory)
+        self.tab_widget.addTab(container, title)
+
+    def ensure_view(self, index):
+        """Get the view for a tab, building it if this is its first activation."""
+        container = self.tab_widget.widget(index)
+        if container not in self._tab_views:
+            return container
+
+        attribute, factory = self._tab_views[container]
+        view = getattr(self, attribute)
+        if view is None:
+            self.logger.debug("Building view for tab %s", self.tab_widget.tabText(index))
+            view = factory()
+            setattr(self, attribute, view)
+            container.layout().addWidget(view)
+
+            # Bring the new view up to date with the window state
+            view.handle_resize(self.width(), self.height())
+            if self._data_loaded:
+                view.load_data()
+        return view
+
+    def create_home_view(self):
+        """Build the Create Cards view."""
+        view = HomeView(self.settings, self.storage)
+        view.deck_created.connect(self.on_deck_created)
+        return view
+
+    def create_study_view(self):
+        """Build the Study view."""
+        view = StudyView(self.settings, self.storage)
+        view.study_completed.connect(self.on_study_completed)
+        return view
+
+    def create_history_view(self):
+        """Build the History view."""
+        return HistoryView(self.settings, self.storage)
+
+    def views(self):
+        """Get the views that have been built so far."""
+        return [view for view in (self.home_view, self.study_view, self.history_view) if view is not None]
+
+    def paintEvent(self, event):
+        """Report the first paint so deferred loading can start."""
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            self.watchdog.start()
+            self.first_painted.emit()
+
+    @traced(category="ui")
+    def load_deferred_data(self):
+        """Load view data from storage once the window is on screen."""
+        if self._data_loaded:
+            return
+        self._data_loaded = True
+
+        for view in self.views():
+            view.load_data()
+
     def setup_responsive_layout(self):
         """Configure responsive behavior based on screen size."""
         # Set initial window size based on screen dimensions
@@ -123,8 +211,8 @@ class MainWindow(QMainWindow):
         self.menuBar().setNativeMenuBar(False)
 
         # Log the responsive setup
-        self.logger.info(f"Responsive layout configured: window size {width}x{height}, "
-                         f"minimum size {min_width}x{min_height}")
+        self.logger.info("Responsive layout configured: window size %sx%s, minimum size %sx%s",
+                         width, height, min_width, min_height)
 
     def resizeEvent(self, event):
         """Handle window resize events for responsive adjustments."""
@@ -150,9 +238,8 @@ class MainWindow(QMainWindow):
         # self.tab_widget.setFixedHeight(content_height) # Potential conflict
 
         # Let child views know about the resize
-        for i in range(self.tab_widget.count()):
-            view = self.tab_widget.widget(i)
-            if view and hasattr(view, 'handle_resize'):
+        for view in self.views():
+            if hasattr(view, 'handle_resize'):
                  # Pass the size of the tab widget's content area if possible,
                  # otherwise pass the window's content height.
                 tab_content_rect = self.tab_widget.rect() # Might need adjustment for tab bar
@@ -168,9 +255,8 @@ class MainWindow(QMainWindow):
         self.logger.info("Window maximized - optimizing layout")
 
         # Notify views of maximized state
-        for i in range(self.tab_widget.count()):
-            view = self.tab_widget.widget(i)
-            if view and hasattr(view, 'handle_maximized'):
+        for view in self.views():
+            if hasattr(view, 'handle_maximized'):
                 view.handle_maximized()
 
     def showNormal(self):
@@ -182,9 +268,8 @@ class MainWindow(QMainWindow):
         self.logger.info("Window restored - reverting to normal layout")
 
         # Notify views of normal state
-        for i in range(self.tab_widget.count()):
-            view = self.tab_widget.widget(i)
-            if view and hasattr(view, 'handle_normal'):
+        for view in self.views():
+            if hasattr(view, 'handle_normal'):
                 view.handle_normal()
 
     @handle_errors(dialog_title="UI Error")
@@ -207,6 +292,12 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.show_settings)
         file_menu.addAction(settings_action)
 
+        # Rebuild statistics action
+        rebuild_stats_action = QAction("Rebuild Statistics", self)
+        rebuild_stats_action.setStatusTip("Recompute the daily study statistics from all sessions")
+        rebuild_stats_action.triggered.connect(self.rebuild_statistics)
+        file_menu.addAction(rebuild_stats_action)
+
         file_menu.addSeparator()
 
         # Full screen toggle
@@ -257,6 +348,11 @@ class MainWindow(QMainWindow):
         # Help menu
         help_menu = self.menuBar().addMenu("&Help")
 
+        # Performance dashboard
+        performance_action = QAction("Performance", self)
+        performance_action.triggered.connect(self.show_performance)
+        help_menu.addAction(performance_action)
+
         # About action
         about_action = QAction("About", self)
         about_action.triggered.connect(self.show_about)
@@ -271,13 +367,7 @@ class MainWindow(QMainWindow):
 
     def connect_signals(self):
         """Connect signals between components."""
-        # Connect home view signals
-        if hasattr(self, 'home_view') and self.home_view:
-             self.home_view.deck_created.connect(self.on_deck_created)
-
-        # Connect study view signals
-        if hasattr(self, 'study_view') and self.study_view:
-             self.study_view.study_completed.connect(self.on_study_completed)
+        # View signals are connected as each view is built
 
         # Connect tab changed signal
         if hasattr(self, 'tab_widget') and self.tab_widget:
@@ -285,20 +375,24 @@ class MainWindow(QMainWindow):
 
 
     def settings_changed(self):
-        """Handle settings being changed (called from SettingsDialog or here)."""
-        self.logger.info("Applying updated settings")
+        """
+        Report applied settings (called from SettingsDialog).
+        The window and views have already reacted to the changed keys they subscribe to.
+        """
+        self.logger.info("Settings updated")
+        self.status_bar.showMessage("Settings updated", 3000)
 
-        # Apply theme
+    def on_theme_setting_changed(self, changed):
+        """Apply a new theme once, application-wide."""
         self.theme_manager.apply_theme()
 
-        # Notify views of settings changes if they need it
-        for i in range(self.tab_widget.count()):
-             view = self.tab_widget.widget(i)
-             if view and hasattr(view, 'update_settings'):
-                  view.update_settings()
+    def on_log_settings_changed(self, changed):
+        """Apply changed log levels."""
+        configure_log_levels(self.settings)
 
-        # Update status bar
-        self.status_bar.showMessage("Settings updated", 3000)
+    def on_stall_threshold_changed(self, changed):
+        """Apply a changed event-loop stall threshold."""
+        self.watchdog.set_stall_threshold(self.settings.get("stall_threshold_ms", 250))
 
     @handle_errors(dialog_title="Theme Error")
     def change_theme(self, theme_name):
@@ -317,11 +411,36 @@ class MainWindow(QMainWindow):
             self.settings_changed()
         # Note: Apply button in dialog already calls self.settings_changed
 
+    @handle_errors(dialog_title="Statistics Error")
+    def rebuild_statistics(self, checked=None):
+        """Recompute the daily statistics rollup and refresh the history."""
+        row_count = self.storage.rebuild_daily_stats()
+        if row_count is None:
+            self.status_bar.showMessage("Failed to rebuild statistics", 5000)
+            return
+
+        if self.history_view and self.history_view.isVisible():
+            self.history_view.refresh_if_stale()
+        self.status_bar.showMessage(f"Statistics rebuilt ({row_count} daily entries)", 3000)
+
     def show_about(self):
         """Show the about dialog."""
         dialog = AboutDialog(self)
         dialog.exec()
 
+    def show_performance(self, checked=None):
+        """Show the performance dialog (non-modal, so it stays live while the app is used)."""
+        if self.performance_dialog is None:
+            self.performance_dialog = PerformanceDialog(
+                self.storage,
+                watchdog=self.watchdog,
+                cache_provider=lambda: getattr(self.home_view, 'response_cache', None),
+                parent=self
+            )
+        self.performance_dialog.show()
+        self.performance_dialog.raise_()
+        self.performance_dialog.activateWindow()
+
     def on_new_deck(self):
         """Handle new deck action."""
         # Switch to home tab
@@ -335,7 +454,7 @@ class MainWindow(QMainWindow):
 
     def on_deck_created(self, deck_id):
         """Handle deck created signal from home view."""
-        self.logger.info(f"Deck created: {deck_id}")
+        self.logger.info("Deck created: %s", deck_id)
         self.status_bar.showMessage("New deck created", 3000)
 
         # Switch to study tab
@@ -344,13 +463,13 @@ class MainWindow(QMainWindow):
 
         # Refresh study view deck list and select the new deck
         if hasattr(self, 'study_view') and self.study_view:
-             self.study_view.refresh_decks()
+             self.study_view.refresh_if_stale()
              self.study_view.select_deck(deck_id)
 
 
     def on_study_completed(self, deck_id, cards_studied, cards_correct):
         """Handle study session completed signal."""
-        self.logger.info(f"Study session completed: {deck_id}, {cards_studied}/{cards_correct}")
+        self.logger.info("Study session completed: %s, %s/%s", deck_id, cards_studied, cards_correct)
 
         # Update status bar
         if cards_studied > 0:
@@ -359,38 +478,43 @@ class MainWindow(QMainWindow):
         else:
             self.status_bar.showMessage("Study session completed", 3000)
 
+    @traced(category="ui")
     def on_tab_changed(self, index):
         """Handle tab changed event."""
         if not hasattr(self, 'tab_widget') or not self.tab_widget:
              return # Guard against calls during setup/teardown
 
         tab_name = self.tab_widget.tabText(index)
-        view = self.tab_widget.widget(index) # Get the widget for the current index
+        view = self.ensure_view(index) # Build the view on first activation
 
         if not view:
-             self.logger.warning(f"Tab changed to index {index} ({tab_name}), but view widget is None.")
+             self.logger.warning("Tab changed to index %s (%s), but view widget is None.", index, tab_name)
              return
 
-        self.logger.debug(f"Tab changed to: {tab_name} (index {index})")
+        self.logger.debug("Tab changed to: %s (index %s)", tab_name, index)
 
-        # Refresh the view when switching to it
+        # Refresh the view when switching to it, if its data changed since it was last shown
         try:
-             if index == 1:  # Study tab
-                  if hasattr(view, 'refresh_decks'):
-                       view.refresh_decks()
-             elif index == 2:  # History tab
-                  if hasattr(view, 'refresh_history'):
-                       view.refresh_history()
+             if hasattr(view, 'refresh_if_stale'):
+                  view.refresh_if_stale()
         except RuntimeError as e:
              # Catch specific Qt runtime errors that might indicate deleted objects
-             self.logger.error(f"Error refreshing tab {tab_name}: {e}")
+             self.logger.error("Error refreshing tab %s: %s", tab_name, e)
              QMessageBox.critical(self, "Error", f"Failed to load the {tab_name} tab.\nThe view might have been closed unexpectedly. Please restart the application.")
         except Exception as e:
              # Catch any other unexpected errors
-             self.logger.error(f"Unexpected error refreshing tab {tab_name}: {e}", exc_info=True)
+             self.logger.error("Unexpected error refreshing tab %s: %s", tab_name, e, exc_info=True)
              QMessageBox.critical(self, "Error", f"An unexpected error occurred loading the {tab_name} tab.")
 
 
+    def shutdown(self):
+        """Stop background work owned by the window and views before the application exits."""
+        self.watchdog.stop()
+        if hasattr(self, 'home_view') and self.home_view:
+            self.home_view.shutdown()
+        if hasattr(self, 'history_view') and self.history_view:
+            self.history_view.shutdown()
+
     def closeEvent(self, event):
         """Handle window close event."""
         # Ask for confirmation before closing
@@ -0,0 +1,187 @@
+# src/ui/models/session_table_model.py
+import datetime
+from array import array
+from typing import List, Optional, Tuple
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+
+
+class SessionTableModel(QAbstractTableModel):
+    """
+    Table model for completed study sessions.
+
+    Session data is kept column by column in compact arrays and formatted
+    on demand in ``data()``. Rows are exposed in batches through
+    ``canFetchMore``/``fetchMore`` so views only lay out what is scrolled
+    into view, and sorting reorders a row index instead of the data.
+    """
+
+    HEADERS = ["Date", "Time", "Deck", "Duration", "Cards Studied", "Accuracy"]
+    DATE_COLUMN, TIME_COLUMN, DECK_COLUMN, DURATION_COLUMN, STUDIED_COLUMN, ACCURACY_COLUMN = range(6)
+
+    # Rows made visible per fetchMore call
+    FETCH_BATCH_SIZE = 200
+
+    # Accuracy thresholds and their background colors
+    GOOD_ACCURACY = 80
+    FAIR_ACCURACY = 60
+    GOOD_COLOR = QColor(200, 255, 200)  # Light green
+    FAIR_COLOR = QColor(255, 255, 200)  # Light yellow
+    POOR_COLOR = QColor(255, 200, 200)  # Light red
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._clear_columns()
+
+    def _clear_columns(self):
+        """Reset the column store."""
+        self._ids: List[str] = []
+        self._deck_names: List[str] = []
+        self._start_times = array('d')  # POSIX timestamps
+        self._durations = array('d')  # seconds, -1 when unknown
+        self._studied = array('l')
+        self._correct = array('l')
+        self._order = array('l')  # row -> index into the columns
+        self._fetched = 0
+
+    def set_sessions(self, rows: List[Tuple]) -> None:
+        """
+        Replace the model contents.
+
+        Args:
+            rows: (id, deck name, start time, end time, cards studied, cards correct)
+                tuples as returned by ``SQLiteStorage.get_session_rows``, with
+                times in epoch seconds
+        """
+        self.beginResetModel()
+        self._clear_columns()
+
+        deck_names = {}  # Share one string per deck name
+        for session_id, deck_name, start_time, end_time, studied, correct in rows:
+            self._ids.append(session_id)
+            self._deck_names.append(deck_names.setdefault(deck_name, deck_name))
+            self._start_times.append(start_time)
+            self._durations.append(end_time - start_time if end_time is not None else -1.0)
+            self._studied.append(studied or 0)
+            self._correct.append(correct or 0)
+
+        self._order = array('l', range(len(self._ids)))
+        self._fetched = min(len(self._ids), self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def session_id(self, row: int) -> Optional[str]:
+        """Get the ID of the session shown in a row."""
+        if 0 <= row < self._fetched:
+            return self._ids[self._order[row]]
+        return None
+
+    def total_count(self) -> int:
+        """Get the number of sessions in the model, including rows not fetched yet."""
+        return len(self._ids)
+
+    # ===== Lazy fetching =====
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetched < len(self._ids)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH_SIZE, len(self._ids) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    # ===== Model interface =====
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def _accuracy(self, i: int) -> Optional[float]:
+        """Get the accuracy of the session at column index ``i``, or None if no cards were studied."""
+        studied = self._studied[i]
+        return self._correct[i] / studied * 100 if studied > 0 else None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+
+        i = self._order[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.DATE_COLUMN:
+                return datetime.datetime.fromtimestamp(self._start_times[i]).strftime("%Y-%m-%d")
+            elif column == self.TIME_COLUMN:
+                return datetime.datetime.fromtimestamp(self._start_times[i]).strftime("%H:%M")
+            elif column == self.DECK_COLUMN:
+                return self._deck_names[i]
+            elif column == self.DURATION_COLUMN:
+                duration = self._durations[i]
+                if duration < 0:
+                    return "N/A"
+                return f"{int(duration // 60)}m {int(duration % 60)}s"
+            elif column == self.STUDIED_COLUMN:
+                return str(self._studied[i])
+            elif column == self.ACCURACY_COLUMN:
+                accuracy = self._accuracy(i)
+                return f"{accuracy:.1f}%" if accuracy is not None else "N/A"
+
+        elif role == Qt.ItemDataRole.BackgroundRole and column == self.ACCURACY_COLUMN:
+            # Color code by accuracy
+            accuracy = self._accuracy(i)
+            if accuracy is None:
+                return None
+            if accuracy >= self.GOOD_ACCURACY:
+                return self.GOOD_COLOR
+            elif accuracy >= self.FAIR_ACCURACY:
+                return self.FAIR_COLOR
+            return self.POOR_COLOR
+
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._ids[i]
+
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder) -> None:
+        """Sort rows by a column without moving the underlying data."""
+        keys = {
+            self.DATE_COLUMN: self._start_times.__getitem__,
+            # Time of day, ignoring the date
+            self.TIME_COLUMN: lambda i: datetime.datetime.fromtimestamp(self._start_times[i]).time(),
+            self.DECK_COLUMN: lambda i: self._deck_names[i].casefold(),
+            self.DURATION_COLUMN: self._durations.__getitem__,
+            self.STUDIED_COLUMN: self._studied.__getitem__,
+            # Sessions without an accuracy sort below 0%
+            self.ACCURACY_COLUMN: lambda i: (self._accuracy(i) is not None, self._accuracy(i) or 0.0)
+        }
+        key = keys.get(column)
+        if key is None:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_sessions = [self._order[index.row()] for index in persistent]
+
+        self._order = array('l', sorted(
+            range(len(self._ids)), key=key, reverse=order == Qt.SortOrder.DescendingOrder
+        ))
+
+        # Keep selections pointing at the same sessions
+        if persistent:
+            rows = {i: row for row, i in enumerate(self._order)}
+            self.changePersistentIndexList(persistent, [
+                self.index(rows[i], index.column()) if rows[i] < self._fetched else QModelIndex()
+                for i, index in zip(persistent_sessions, persistent)
+            ])
+        self.layoutChanged.emit()
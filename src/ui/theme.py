@@ -2,15 +2,33 @@
 import os
 import json
 import re
+import time
+import hashlib
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QFile, QTextStream, QIODevice
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
 
+# Matches ${theme.name} and ${var.name} references in QSS files
+VARIABLE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Bump when the compiled output format changes to invalidate disk caches
+COMPILER_VERSION = 1
+
+
 class ThemeManager:
-    """Manages application themes (light/dark) and applies styles."""
+    """
+    Manages application themes (light/dark) and applies styles.
     
-    def __init__(self, settings):
+    Compiled stylesheets are cached in memory and under
+    ``~/.flashcards/cache/themes``, keyed by theme name and the modification
+    times of the source files, so they are only rebuilt when a QSS file or
+    ``variables.json`` changes.
+    """
+    
+    _shared = None
+    
+    def __init__(self, settings, cache_dir=None):
         self.settings = settings
         self.logger = get_logger(__name__)
         
@@ -20,9 +38,33 @@ class ThemeManager:
             "assets", "styles"
         )
         
+        # Set default cache directory if not provided
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".flashcards", "cache", "themes")
+        self.cache_dir = cache_dir
+        
+        # theme name -> (cache key, compiled stylesheet)
+        self._compiled = {}
+        self._applied_key = None
+        
         # Load variables
+        self._loaded_variables_mtime = self._variables_mtime()
         self.variables = self._load_variables()
     
+    @classmethod
+    def shared(cls, settings):
+        """Get the application-wide theme manager, creating it on first use."""
+        if cls._shared is None or cls._shared.settings is not settings:
+            cls._shared = cls(settings)
+        return cls._shared
+    
+    def _variables_mtime(self):
+        """Get the modification time of variables.json, or None if it is missing."""
+        try:
+            return os.stat(os.path.join(self.styles_dir, "variables.json")).st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_variables(self):
         """Load theme variables from JSON file."""
         variables_path = os.path.join(self.styles_dir, "variables.json")
@@ -32,7 +74,7 @@ class ThemeManager:
                 with open(variables_path, "r") as f:
                     return json.load(f)
             except Exception as e:
-                self.logger.error(f"Error loading theme variables: {e}")
+                self.logger.error("Error loading theme variables: %s", e)
         
         # Fallback variables
         return {
@@ -63,7 +105,7 @@ class ThemeManager:
                 with open(file_path, "r") as f:
                     return f.read()
             except Exception as e:
-                self.logger.error(f"Error loading stylesheet {file_path}: {e}")
+                self.logger.error("Error loading stylesheet %s: %s", file_path, e)
         return ""
     
     def get_current_theme(self):
@@ -78,12 +120,93 @@ class ThemeManager:
         self.settings.set("theme", theme_name)
         self.apply_theme()
     
-    @handle_errors(show_dialog=False, log_exception=True)
-    def apply_theme(self):
-        """Apply the current theme to the application."""
-        theme_name = self.get_current_theme()
-        self.logger.info(f"Applying theme: {theme_name}")
+    def _source_files(self, theme_name):
+        """Get the stylesheet files that make up a theme, in order."""
+        return [
+            os.path.join(self.styles_dir, "main.qss"),
+            os.path.join(self.styles_dir, f"{theme_name}_theme.qss"),
+            os.path.join(self.styles_dir, "components", "buttons.qss"),
+            os.path.join(self.styles_dir, "components", "cards.qss"),
+            os.path.join(self.styles_dir, "components", "dialogs.qss"),
+            os.path.join(self.styles_dir, "components", "forms.qss"),
+            os.path.join(self.styles_dir, "components", "study_view.qss")
+        ]
+    
+    def _cache_key(self, theme_name):
+        """Get a key that changes whenever any source of the theme changes."""
+        parts = [str(COMPILER_VERSION), theme_name]
+        for path in self._source_files(theme_name) + [os.path.join(self.styles_dir, "variables.json")]:
+            try:
+                stat = os.stat(path)
+                parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+            except OSError:
+                parts.append(f"{path}:missing")
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    
+    def _cache_path(self, theme_name):
+        """Get the on-disk location of a compiled theme."""
+        return os.path.join(self.cache_dir, f"{theme_name}.qss")
+    
+    def _read_cached(self, theme_name, key):
+        """Read a compiled theme from disk if it matches the cache key."""
+        try:
+            with open(self._cache_path(theme_name), "r", encoding="utf-8") as f:
+                if f.readline().strip() != f"/* cache-key: {key} */":
+                    return None
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_cached(self, theme_name, key, qss):
+        """Persist a compiled theme so the next startup can reuse it."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{self._cache_path(theme_name)}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(f"/* cache-key: {key} */\n")
+                f.write(qss)
+            os.replace(temp_path, self._cache_path(theme_name))
+        except OSError as e:
+            self.logger.warning("Could not write theme cache: %s", e)
+    
+    def get_stylesheet(self, theme_name, use_cache=True):
+        """
+        Get the compiled stylesheet for a theme.
+        
+        Args:
+            theme_name: Name of the theme to compile
+            use_cache: Whether to reuse a previously compiled stylesheet
+            
+        Returns:
+            Tuple of (cache key, stylesheet, source) where source is one of
+            "memory", "disk" or "compiled"
+        """
+        key = self._cache_key(theme_name)
+        
+        if use_cache:
+            cached = self._compiled.get(theme_name)
+            if cached and cached[0] == key:
+                return key, cached[1], "memory"
+            
+            qss = self._read_cached(theme_name, key)
+            if qss is not None:
+                self._compiled[theme_name] = (key, qss)
+                return key, qss, "disk"
         
+        # Pick up edits to variables.json made while the app is running
+        variables_mtime = self._variables_mtime()
+        if variables_mtime != self._loaded_variables_mtime:
+            self.variables = self._load_variables()
+            self._loaded_variables_mtime = variables_mtime
+        
+        qss = self.compile_theme(theme_name)
+        self._compiled[theme_name] = (key, qss)
+        if use_cache:
+            self._write_cached(theme_name, key, qss)
+        return key, qss, "compiled"
+    
+    def compile_theme(self, theme_name):
+        """Build the complete stylesheet for a theme with all variables substituted."""
         # Load main stylesheet
         main_qss = self._load_stylesheet(os.path.join(self.styles_dir, "main.qss"))
         
@@ -100,39 +223,44 @@ class ThemeManager:
         # Combine all stylesheets
         combined_qss = main_qss + theme_qss + buttons_qss + cards_qss + dialogs_qss + forms_qss + study_view_qss
         
-        # Create variable substitution map
+        # Create variable substitution map, keyed by the name inside ${...}
         var_map = {}
-        # Add current theme variables both as theme-specific and generic var references
-        if theme_name in self.variables:
-            for var_name, var_value in self.variables[theme_name].items():
-                var_map[f"${{{theme_name}.{var_name}}}"] = var_value
-                var_map[f"${{var.{var_name}}}"] = var_value
-        
         # Add other theme variables as well to make sure all are replaced
         other_theme = "dark" if theme_name == "light" else "light"
         if other_theme in self.variables:
             for var_name, var_value in self.variables[other_theme].items():
-                var_map[f"${{{other_theme}.{var_name}}}"] = var_value
-        
-        # Replace all variables in the stylesheet
-        for var_pattern, value in var_map.items():
-            combined_qss = combined_qss.replace(var_pattern, value)
-        
-        # Find any remaining unreplaced variables using regex
-        remaining_vars = re.findall(r'\${[^}]+}', combined_qss)
-        if remaining_vars:
-            self.logger.warning(f"Found unreplaced variables in stylesheet: {remaining_vars}")
-            # Replace any remaining variable references with safe defaults to prevent parse errors
-            for var in remaining_vars:
-                self.logger.warning(f"Replacing unreplaced variable {var} with fallback")
-                if "background" in var.lower():
-                    combined_qss = combined_qss.replace(var, "#f5f5f5" if theme_name == "light" else "#2d2d2d")
-                elif "foreground" in var.lower() or "color" in var.lower():
-                    combined_qss = combined_qss.replace(var, "#333333" if theme_name == "light" else "#e0e0e0")
-                elif "border" in var.lower():
-                    combined_qss = combined_qss.replace(var, "#d0d0d0" if theme_name == "light" else "#555555")
-                else:
-                    combined_qss = combined_qss.replace(var, "#cccccc")  # Neutral gray fallback
+                var_map[f"{other_theme}.{var_name}"] = var_value
+        
+        # Add current theme variables both as theme-specific and generic var references
+        if theme_name in self.variables:
+            for var_name, var_value in self.variables[theme_name].items():
+                var_map[f"{theme_name}.{var_name}"] = var_value
+                var_map[f"var.{var_name}"] = var_value
+        
+        unreplaced = []
+        
+        def substitute(match):
+            name = match.group(1)
+            value = var_map.get(name)
+            if value is not None:
+                return value
+            
+            # Replace unknown variable references with safe defaults to prevent parse errors
+            unreplaced.append(match.group(0))
+            lowered = name.lower()
+            if "background" in lowered:
+                return "#f5f5f5" if theme_name == "light" else "#2d2d2d"
+            elif "foreground" in lowered or "color" in lowered:
+                return "#333333" if theme_name == "light" else "#e0e0e0"
+            elif "border" in lowered:
+                return "#d0d0d0" if theme_name == "light" else "#555555"
+            return "#cccccc"  # Neutral gray fallback
+        
+        # Replace all variables in a single pass over the stylesheet
+        combined_qss = VARIABLE_PATTERN.sub(substitute, combined_qss)
+        if unreplaced:
+            self.logger.warning("Replaced unknown stylesheet variables with fallbacks: %s",
+                                sorted(set(unreplaced)))
         
         # Additional clean-up to catch any syntax errors
         # Check for unmatched braces - a common cause of parse errors
@@ -142,15 +270,32 @@ class ThemeManager:
             while combined_qss.count('{') > combined_qss.count('}'):
                 combined_qss += '}'
         
+        return combined_qss
+    
+    @handle_errors(show_dialog=False, log_exception=True)
+    def apply_theme(self):
+        """Apply the current theme to the application."""
+        theme_name = self.get_current_theme()
+        start = time.perf_counter()
+        
+        key, combined_qss, source = self.get_stylesheet(theme_name)
+        
+        # Re-applying an identical stylesheet would still repolish every widget
+        if key == self._applied_key:
+            self.logger.debug("Theme %s already applied", theme_name)
+            return
+        
         # Apply the stylesheet
         app = QApplication.instance()
         if app:
             try:
                 app.setStyleSheet(combined_qss)
-                self.logger.debug("Applied theme stylesheet to application")
+                self._applied_key = key
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self.logger.info("Applied theme: %s in %.1f ms (stylesheet from %s)", theme_name, elapsed_ms, source)
             except Exception as e:
                 # If there's still an error, log it and fall back to a minimal stylesheet
-                self.logger.error(f"Failed to apply full stylesheet: {e}")
+                self.logger.error("Failed to apply full stylesheet: %s", e)
                 # Apply a minimal working stylesheet as fallback
                 fallback_qss = f"""
                 QWidget {{ 
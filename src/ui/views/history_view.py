@@ -2,21 +2,46 @@ from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, 
     QTableWidget, QTableWidgetItem, QComboBox,
     QGroupBox, QSplitter, QFrame, QHeaderView,
-    QPushButton, QDateEdit, QSizePolicy, QWidget
+    QPushButton, QDateEdit, QSizePolicy, QWidget,
+    QTableView, QAbstractItemView, QGridLayout, QTabWidget,
+    QMessageBox
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QTimer, QThreadPool
 from PyQt6.QtGui import QColor
 from src.ui.widgets.card_list_widget import CardListWidget
+from src.ui.models.session_table_model import SessionTableModel
+from src.core.history_query import (
+    HistoryQuery, HistoryQueryWorker, ALL_PARTS, STATISTICS, SESSIONS, INSIGHTS, analytics_available
+)
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
+from src.utils.tracing import traced
 from src.ui.views.responsive_view import ResponsiveView
 
 class HistoryView(ResponsiveView):
     """View for displaying study history and statistics with responsive layout."""
     
+    # Statistics use decks, cards and the daily rollup; the session table uses decks and
+    # sessions; the insights dashboard uses card reviews and the daily rollup
+    data_tables = ('decks', 'flashcards', 'study_sessions', 'card_reviews', 'daily_stats')
+    
+    # Filter changes are applied once they have stopped for this long
+    FILTER_DEBOUNCE_MS = 300
+    
     def __init__(self, settings, storage, parent=None):
         super().__init__(settings, storage, parent)
         
+        # History is loaded by background queries; only the result of the latest
+        # generation is shown, and parts owed by superseded queries carry over
+        self._query_generation = 0
+        self._query_worker = None
+        self._pending_parts = frozenset()
+        
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.apply_filters)
+        
         # Setup UI
         self.setup_ui()
         
@@ -105,6 +130,55 @@ class HistoryView(ResponsiveView):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.setSpacing(16)
 
+        # Insights dashboard
+        insights_frame = QFrame()
+        insights_frame.setProperty("class", "card")
+        insights_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        insights_layout = self.keep_reference(QVBoxLayout(insights_frame))
+        insights_layout.setContentsMargins(16, 16, 16, 16)
+        insights_layout.setSpacing(16)
+
+        insights_title = QLabel("Insights")
+        insights_title.setProperty("class", "h2")
+        insights_title.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        insights_layout.addWidget(insights_title)
+
+        if analytics_available():
+            # Headline metrics
+            metrics_layout = self.keep_reference(QGridLayout())
+            metrics_layout.setHorizontalSpacing(24)
+            self.metric_labels = {}
+            metrics = [
+                ("reviews", "Reviews"), ("accuracy", "Accuracy"), ("recent_accuracy", "7-Day Accuracy"),
+                ("current_streak", "Current Streak"), ("longest_streak", "Longest Streak"), ("study_time", "Study Time")
+            ]
+            for i, (key, caption) in enumerate(metrics):
+                caption_label = QLabel(caption)
+                caption_label.setProperty("class", "form-label")
+                value_label = QLabel("-")
+                value_label.setProperty("class", "h3")
+                metrics_layout.addWidget(caption_label, (i // 3) * 2, i % 3)
+                metrics_layout.addWidget(value_label, (i // 3) * 2 + 1, i % 3)
+                self.metric_labels[key] = value_label
+            insights_layout.addLayout(metrics_layout)
+
+            # Breakdowns
+            self.insights_tabs = QTabWidget()
+            self.weekly_table = self.create_insights_table(["Week Of", "Reviews", "Accuracy"])
+            self.retention_table = self.create_insights_table(["Since Last Review", "Reviews", "Recall"])
+            self.topics_table = self.create_insights_table(["Topic", "Reviews", "Accuracy"])
+            self.insights_tabs.addTab(self.weekly_table, "Weekly")
+            self.insights_tabs.addTab(self.retention_table, "Retention")
+            self.insights_tabs.addTab(self.topics_table, "Topics")
+            insights_layout.addWidget(self.insights_tabs)
+        else:
+            unavailable_label = QLabel("Install NumPy (pip install numpy) to see accuracy trends, streaks and retention.")
+            unavailable_label.setWordWrap(True)
+            unavailable_label.setProperty("class", "subtitle")
+            insights_layout.addWidget(unavailable_label)
+
+        left_layout.addWidget(insights_frame)
+
         # Statistics section
         stats_frame = QFrame()
         stats_frame.setProperty("class", "card")
@@ -144,14 +218,17 @@ class HistoryView(ResponsiveView):
         sessions_title.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
         sessions_layout.addWidget(sessions_title)
 
-        # Sessions table
-        self.sessions_table = QTableWidget(0, 6)
-        self.sessions_table.setHorizontalHeaderLabels([
-            "Date", "Time", "Deck", "Duration", "Cards Studied", "Accuracy"
-        ])
+        # Sessions table (rows are fetched from the model as they scroll into view)
+        self.sessions_model = SessionTableModel(self)
+        self.sessions_table = QTableView()
+        self.sessions_table.setModel(self.sessions_model)
         self.sessions_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.sessions_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.sessions_table.cellClicked.connect(self.on_session_selected)
+        self.sessions_table.verticalHeader().setVisible(False)
+        self.sessions_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.sessions_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.sessions_table.setSortingEnabled(True)
+        self.sessions_table.sortByColumn(SessionTableModel.DATE_COLUMN, Qt.SortOrder.DescendingOrder)
+        self.sessions_table.clicked.connect(self.on_session_selected)
         self.sessions_table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         sessions_layout.addWidget(self.sessions_table)
 
@@ -254,9 +331,28 @@ class HistoryView(ResponsiveView):
         # In a real implementation, we'd need to remove and re-add widgets
         pass
     
-    def refresh_history(self):
+    @traced(category="ui")
+    def refresh_changed(self, tables):
+        """Reload only the parts of the history that depend on the changed tables."""
+        if 'decks' in tables:
+            # Deck names appear in the filter, the statistics and the session table
+            self.refresh_history()
+            return
+        
+        self.logger.debug("Refreshing history for changed tables: %s", sorted(tables))
+        self.mark_rendered(*tables)
+        parts = {STATISTICS}
+        if 'study_sessions' in tables:
+            parts.add(SESSIONS)
+        if tables & {'card_reviews', 'daily_stats'}:
+            parts.add(INSIGHTS)
+        self.load_history(parts)
+    
+    @traced(category="ui")
+    def refresh_history(self, checked=None):
         """Refresh the history display with data from storage."""
         self.logger.debug("Refreshing history view")
+        self.mark_rendered()
         
         # Remember current selection
         current_deck_id = self.deck_combo.currentData()
@@ -272,9 +368,9 @@ class HistoryView(ResponsiveView):
                     break
         
         # Load data with current filter
-        self.load_statistics()
-        self.load_sessions()
+        self.load_history()
     
+    @traced(category="ui")
     def refresh_deck_list(self):
         """Refresh the deck filter dropdown."""
         # Remember current selection
@@ -299,37 +395,89 @@ class HistoryView(ResponsiveView):
                     return
     
     def on_filter_changed(self):
-        """Handle filter selection changed."""
-        self.load_statistics()
-        self.load_sessions()
+        """Handle filter selection changed; rapid changes are coalesced into one reload."""
+        self.filter_timer.start()
+    
+    def apply_filters(self):
+        """Reload the history for the current filter."""
         self.session_card_list.clear()
+        self.load_history()
     
-    @handle_errors(dialog_title="Data Error")
-    def load_statistics(self):
-        """Load and display deck statistics."""
-        # Get selected deck ID (None for all decks)
-        deck_id = self.deck_combo.currentData()
+    def load_history(self, parts=ALL_PARTS):
+        """
+        Load parts of the history for the current filter in a background thread.
+        
+        Any query still in flight is cancelled and its result will be discarded.
+        
+        Args:
+            parts: Any of STATISTICS, SESSIONS and INSIGHTS
+        """
+        if self.filter_timer.isActive():
+            # A filter change is still waiting to be applied; it needs everything
+            self.filter_timer.stop()
+            parts = ALL_PARTS
+        
+        # Parts requested by a superseded query have not been shown yet
+        parts = frozenset(parts) | self._pending_parts
+        self._pending_parts = parts
+        
+        if self._query_worker:
+            self._query_worker.cancel()
+        
+        self._query_generation += 1
+        query = HistoryQuery(
+            generation=self._query_generation,
+            deck_id=self.deck_combo.currentData(),
+            start_date=self.start_date.date().toPyDate(),
+            end_date=self.end_date.date().toPyDate(),
+            parts=parts
+        )
+        
+        worker = HistoryQueryWorker(self.storage, query)
+        worker.signals.finished.connect(self.on_history_loaded)
+        self._query_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    @traced(category="ui")
+    def on_history_loaded(self, result):
+        """Show the result of a background history query unless a newer one was started."""
+        if result.query.generation != self._query_generation:
+            self.logger.debug("Discarding stale history result (generation %s)", result.query.generation)
+            return
         
-        # Clear table
+        self._query_worker = None
+        self._pending_parts = frozenset()
+        self.logger.debug("History loaded in %.1f ms: %s", result.elapsed * 1000, sorted(result.query.parts))
+        
+        if result.statistics is not None:
+            self.show_statistics(result.statistics)
+        if result.sessions is not None:
+            self.show_sessions(result.sessions)
+        if result.dashboard is not None:
+            self.show_insights(result.dashboard)
+        
+        if result.errors:
+            QMessageBox.warning(
+                self, "Data Error",
+                "Some study history could not be loaded:\n" + "\n".join(result.errors)
+            )
+    
+    def shutdown(self):
+        """Cancel pending filter changes and any history query in flight."""
+        self.filter_timer.stop()
+        if self._query_worker:
+            self._query_worker.cancel()
+            self._query_worker = None
+        # Results still on their way are now stale
+        self._query_generation += 1
+    
+    @handle_errors(dialog_title="Data Error")
+    @traced(category="ui")
+    def show_statistics(self, statistics):
+        """Display deck statistics as (deck, stats) pairs."""
         self.stats_table.setRowCount(0)
-        
-        # Start and end dates
-        start_date = self.start_date.date().toPyDate()
-        end_date = self.end_date.date().toPyDate()
-        
-        # If specific deck is selected, show only that deck
-        if deck_id:
-            deck = self.storage.get_deck(deck_id)
-            if deck:
-                stats = self.storage.get_deck_stats(deck_id, start_date, end_date)
-                self.add_stats_row(deck, stats)
-        else:
-            # Show all decks
-            decks = self.storage.get_all_decks()
-            
-            for deck in decks:
-                stats = self.storage.get_deck_stats(deck.id, start_date, end_date)
-                self.add_stats_row(deck, stats)
+        for deck, stats in statistics:
+            self.add_stats_row(deck, stats)
     
     def add_stats_row(self, deck, stats):
         """Add a row to the statistics table."""
@@ -363,80 +511,72 @@ class HistoryView(ResponsiveView):
                 accuracy_item.setBackground(QColor(255, 200, 200))  # Light red
     
     @handle_errors(dialog_title="Data Error")
-    def load_sessions(self):
-        """Load and display study sessions."""
-        # Get selected deck ID (None for all decks)
-        deck_id = self.deck_combo.currentData()
-        
-        # Get date range
-        start_date = self.start_date.date().toPyDate()
-        end_date = self.end_date.date().toPyDate()
-        
-        # Get study sessions
-        sessions = self.storage.get_study_sessions(deck_id, start_date, end_date)
-        
-        # Clear table
-        self.sessions_table.setRowCount(0)
-        
-        # Add sessions to table
-        for session in sessions:
-            # Skip incomplete sessions
-            if not session.end_time:
-                continue
-                
-            row = self.sessions_table.rowCount()
-            self.sessions_table.insertRow(row)
-            
-            # Store session ID in the item data for retrieval
-            for col in range(6):
-                self.sessions_table.setItem(row, col, QTableWidgetItem())
-                self.sessions_table.item(row, col).setData(Qt.ItemDataRole.UserRole, session.id)
-            
-            # Get deck name
-            deck = self.storage.get_deck(session.deck_id)
-            deck_name = deck.name if deck else "Unknown Deck"
-            
-            # Date (just the date part)
-            date_str = session.start_time.strftime("%Y-%m-%d")
-            self.sessions_table.item(row, 0).setText(date_str)
-            
-            # Time (just the time part)
-            time_str = session.start_time.strftime("%H:%M")
-            self.sessions_table.item(row, 1).setText(time_str)
-            
-            # Deck name
-            self.sessions_table.item(row, 2).setText(deck_name)
-            
-            # Duration
-            duration = session.duration
-            if duration:
-                minutes = duration.total_seconds() // 60
-                seconds = duration.total_seconds() % 60
-                duration_str = f"{int(minutes)}m {int(seconds)}s"
-            else:
-                duration_str = "N/A"
-            self.sessions_table.item(row, 3).setText(duration_str)
-            
-            # Cards studied
-            self.sessions_table.item(row, 4).setText(str(session.cards_studied))
-            
-            # Accuracy
-            accuracy = session.accuracy
-            accuracy_str = f"{accuracy:.1f}%" if session.cards_studied > 0 else "N/A"
-            self.sessions_table.item(row, 5).setText(accuracy_str)
-            
-            # Color code by accuracy
-            if session.cards_studied > 0:
-                if accuracy >= 80:
-                    self.sessions_table.item(row, 5).setBackground(QColor(200, 255, 200))  # Light green
-                elif accuracy >= 60:
-                    self.sessions_table.item(row, 5).setBackground(QColor(255, 255, 200))  # Light yellow
-                else:  # < 60%
-                    self.sessions_table.item(row, 5).setBackground(QColor(255, 200, 200))  # Light red
+    @traced(category="ui")
+    def show_sessions(self, rows):
+        """Display study sessions from ``SQLiteStorage.get_session_rows`` rows."""
+        # Replace the model contents, keeping the user's sort column
+        self.sessions_model.set_sessions(rows)
+        header = self.sessions_table.horizontalHeader()
+        self.sessions_model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
+    
+    def create_insights_table(self, headers):
+        """Create a read-only table for one of the insights breakdowns."""
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setMinimumHeight(160)
+        return table
+    
+    @staticmethod
+    def format_percent(value):
+        """Format a 0..1 ratio as a percentage, or N/A if it is undefined."""
+        return "N/A" if value != value else f"{value * 100:.1f}%"  # NaN != NaN
+    
+    @staticmethod
+    def format_days(days):
+        """Format a number of days, e.g. "1 day" or "3 days"."""
+        return f"{days} day" if days == 1 else f"{days} days"
+    
+    def fill_insights_table(self, table, labels, counts, ratios):
+        """Replace the rows of an insights table."""
+        table.setRowCount(len(labels))
+        for row, (label, count, ratio) in enumerate(zip(labels, counts, ratios)):
+            table.setItem(row, 0, QTableWidgetItem(str(label)))
+            table.setItem(row, 1, QTableWidgetItem(str(count)))
+            table.setItem(row, 2, QTableWidgetItem(self.format_percent(ratio)))
+    
+    @handle_errors(dialog_title="Data Error")
+    @traced(category="ui")
+    def show_insights(self, dashboard):
+        """Display an insights dashboard."""
+        minutes = int(dashboard.study_seconds // 60)
+        self.metric_labels["reviews"].setText(str(dashboard.total_reviews))
+        self.metric_labels["accuracy"].setText(self.format_percent(dashboard.accuracy))
+        self.metric_labels["recent_accuracy"].setText(self.format_percent(dashboard.recent_accuracy))
+        self.metric_labels["current_streak"].setText(self.format_days(dashboard.current_streak))
+        self.metric_labels["longest_streak"].setText(self.format_days(dashboard.longest_streak))
+        self.metric_labels["study_time"].setText(f"{minutes // 60}h {minutes % 60}m")
+        
+        # Newest week first
+        self.fill_insights_table(
+            self.weekly_table,
+            [week.strftime("%Y-%m-%d") for week in reversed(dashboard.weeks)],
+            list(reversed(dashboard.weekly_reviews)),
+            list(reversed(dashboard.weekly_accuracy))
+        )
+        self.fill_insights_table(
+            self.retention_table, dashboard.retention_labels,
+            dashboard.retention_reviews, dashboard.retention_accuracy
+        )
+        self.fill_insights_table(
+            self.topics_table, dashboard.topics, dashboard.topic_reviews, dashboard.topic_accuracy
+        )
     
-    def on_session_selected(self, row, column):
+    def on_session_selected(self, index):
         """Handle session selection to show cards studied in that session."""
-        session_id = self.sessions_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        session_id = self.sessions_model.session_id(index.row())
         
         if not session_id:
             return
@@ -457,47 +597,4 @@ class HistoryView(ResponsiveView):
         
         # Show the cards from this deck
         self.session_card_list.clear()
-        self.session_card_list.add_cards(deck.cards)
-    
-    def update_settings(self):
-        """Update view based on changed settings."""
-        # Check for theme changes
-        theme = self.settings.get("theme", "light")
-        
-        # Apply theme-specific styling to tables
-        if theme == "dark":
-            # Apply dark theme styling to tables
-            self.apply_dark_theme_to_tables()
-        else:
-            # Apply light theme styling to tables
-            self.apply_light_theme_to_tables()
-
-    def apply_dark_theme_to_tables(self):
-        """Apply dark theme styling to table widgets."""
-        # Example styling - would be integrated with the theme system
-        if hasattr(self, 'stats_table'):
-            self.stats_table.setStyleSheet(
-                "QTableWidget { background-color: #2d2d2d; color: #e0e0e0; }"
-                "QHeaderView::section { background-color: #3d3d3d; color: #e0e0e0; }"
-            )
-        
-        if hasattr(self, 'sessions_table'):
-            self.sessions_table.setStyleSheet(
-                "QTableWidget { background-color: #2d2d2d; color: #e0e0e0; }"
-                "QHeaderView::section { background-color: #3d3d3d; color: #e0e0e0; }"
-            )
-
-    def apply_light_theme_to_tables(self):
-        """Apply light theme styling to table widgets."""
-        # Example styling - would be integrated with the theme system
-        if hasattr(self, 'stats_table'):
-            self.stats_table.setStyleSheet(
-                "QTableWidget { background-color: #ffffff; color: #333333; }"
-                "QHeaderView::section { background-color: #f0f0f0; color: #333333; }"
-            )
-        
-        if hasattr(self, 'sessions_table'):
-            self.sessions_table.setStyleSheet(
-                "QTableWidget { background-color: #ffffff; color: #333333; }"
-                "QHeaderView::section { background-color: #f0f0f0; color: #333333; }"
-            )
\ No newline at end of file
+        self.session_card_list.add_cards(deck.cards)
\ No newline at end of file
@@ -1,67 +1,26 @@
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QTextEdit, QSpinBox, QProgressBar, QMessageBox,
-    QFormLayout, QGroupBox, QSplitter, QSizePolicy, QWidget
+    QFormLayout, QGroupBox, QSplitter, QSizePolicy, QWidget, QCheckBox,
+    QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool, QRunnable, pyqtSlot, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool
 from PyQt6.QtGui import QIcon
-from src.api.client import APIClient
+from src.api.retry import RetryPolicy, CircuitBreaker
+from src.core.jobs import GenerationJobManager
+from src.core.batch import BatchGenerationWorker, parse_topic_file
+from src.core.events import CardsSaved, CardsDeleted, DecksDeleted
+from src.data.cache import ResponseCache
 from src.data.models import Flashcard, FlashcardDeck
 from src.ui.widgets.card_list_widget import CardListWidget
+from src.ui.widgets.job_queue_widget import JobQueueWidget
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
+from src.utils.tracing import traced
 from src.ui.views.responsive_view import ResponsiveView
 from src.ui.dialogs.new_card_with_topic_dialog import NewCardWithTopicDialog
 from src.ui.dialogs.edit_card_dialog import EditCardDialog  # Import EditCardDialog
 from typing import List, Tuple  # Import List and Tuple
-import sys
-import asyncio
-
-
-# Worker signals for background processing
-class WorkerSignals(QObject):
-    """Signals for communicating from worker thread."""
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
-
-
-# Worker for background flashcard generation
-class GenerateFlashcardsWorker(QRunnable):
-    """Worker for generating flashcards in background thread."""
-
-    def __init__(self, api_client, topic, num_cards, additional_notes):
-        super().__init__()
-        self.api_client = api_client
-        self.topic = topic
-        self.num_cards = num_cards
-        self.additional_notes = additional_notes
-        self.signals = WorkerSignals()
-
-    @pyqtSlot()
-    def run(self):
-        """Main worker function that runs in background thread."""
-        try:
-            # Create a new event loop for the thread
-            if sys.platform == 'win32':
-                loop = asyncio.ProactorEventLoop()
-            else:
-                loop = asyncio.new_event_loop()
-
-            asyncio.set_event_loop(loop)
-
-            # Call the API
-            response = loop.run_until_complete(
-                self.api_client.generate_flashcards(
-                    self.topic, 
-                    self.num_cards, 
-                    self.additional_notes
-                )
-            )
-
-            # Emit response
-            self.signals.finished.emit(response)
-        except Exception as e:
-            self.signals.error.emit(str(e))
 
 
 class HomeView(ResponsiveView):
@@ -70,23 +29,59 @@ class HomeView(ResponsiveView):
     # Signal emitted when a new deck is created
     deck_created = pyqtSignal(str)  # Emits deck ID
 
+    # Settings the API client is built from
+    api_settings = (
+        "api_url", "api_timeout", "api_max_retries", "api_backoff_base", "api_backoff_max",
+        "circuit_breaker_threshold", "circuit_breaker_reset"
+    )
+    # Settings the response cache is built from
+    cache_settings = ("cache_enabled", "cache_ttl_hours", "cache_max_entries")
+    settings_keys = api_settings + cache_settings + ("max_concurrent_generations",)
+
     def __init__(self, settings, storage, parent=None):
         super().__init__(settings, storage, parent)
         self.storage = storage  # Store the storage instance
+        # Create response cache shared by every API client this view creates
+        self.response_cache = self.create_response_cache()
+
+        # Circuit breaker shared by every API client for the same server, so
+        # rebuilding the client doesn't close a circuit that is open
+        self.circuit_breaker = self.create_circuit_breaker()
+
         # Create API client
-        api_url = self.settings.get("api_url", "http://localhost:8000")
-        self.api_client = APIClient(api_url)
+        self.api_client = self.create_api_client()
 
-        # Create thread pool for background tasks
-        self.thread_pool = QThreadPool()
+        # Create job manager for queued background generation
+        self.job_manager = GenerationJobManager(
+            self.api_client,
+            max_in_flight=self.settings.get("max_concurrent_generations", 2),
+            parent=self
+        )
+        self.job_manager.queue_changed.connect(self.on_queue_changed)
+        self.job_manager.job_finished.connect(self.on_generation_complete)
+        self.job_manager.job_failed.connect(self.on_generation_failed)
+
+        # Batch generation from a topic file (at most one at a time)
+        self.batch_worker = None
 
         # Setup UI
         self.setup_ui()
 
+        # Keep the recent cards list in sync with writes made anywhere
+        self.subscribe(CardsSaved, self.on_cards_saved)
+        self.subscribe(CardsDeleted, self.on_cards_deleted)
+        self.subscribe(DecksDeleted, self.on_decks_deleted)
+
+        self.logger.info("HomeView initialized")
+
+    @traced(category="ui")
+    def load_data(self):
+        """Load recent cards and resume queued jobs once the window is shown."""
         # Load recent cards
         self.load_recent_cards()
 
-        self.logger.info("HomeView initialized")
+        # Pick up jobs left unfinished by the previous session
+        self.job_manager.resume_pending()
 
     @handle_errors(dialog_title="UI Error")
     def setup_ui(self):
@@ -177,6 +172,11 @@ class HomeView(ResponsiveView):
         notes_help.setProperty("class", "help-text")
         form_layout.addRow("", notes_help)
 
+        # Cache bypass
+        self.bypass_cache_checkbox = QCheckBox("Always request new flashcards (bypass cache)")
+        self.bypass_cache_checkbox.setEnabled(self.response_cache is not None)
+        form_layout.addRow("", self.bypass_cache_checkbox)
+
         left_layout.addWidget(form_group)
 
         # Progress area
@@ -198,6 +198,11 @@ class HomeView(ResponsiveView):
         self.status_label.setProperty("class", "subtitle")
         self.status_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
         progress_layout.addWidget(self.status_label)
+
+        # Queued and running generation jobs
+        self.job_queue = JobQueueWidget()
+        self.job_queue.cancel_requested.connect(self.job_manager.cancel)
+        progress_layout.addWidget(self.job_queue)
         
         left_layout.addWidget(progress_container)
 
@@ -207,6 +212,14 @@ class HomeView(ResponsiveView):
         button_layout.setSpacing(16)
         button_layout.addStretch(1)
 
+        # Batch button
+        self.batch_button = QPushButton("Batch from File...")
+        self.batch_button.setProperty("class", "flat")
+        self.batch_button.setToolTip("Generate a deck for every topic in a text or CSV file")
+        self.batch_button.clicked.connect(self.on_batch_button_clicked)
+        self.batch_button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        button_layout.addWidget(self.batch_button)
+
         # Clear button
         self.clear_button = QPushButton("Clear")
         self.clear_button.setProperty("class", "flat")
@@ -302,6 +315,7 @@ class HomeView(ResponsiveView):
         self.topic_input.clear()
         self.num_cards_input.setValue(10)
         self.notes_input.clear()
+        self.bypass_cache_checkbox.setChecked(False)
         self.topic_input.setFocus()
 
     def start_new_deck(self):
@@ -331,30 +345,112 @@ class HomeView(ResponsiveView):
         if notes:
             topic = f"{topic}"
 
-        # Show progress UI
-        self.progress_bar.setVisible(True)
-        self.status_label.setText("Generating flashcards... This may take up to a minute.")
-        self.status_label.setVisible(True)
-        self.generate_button.setEnabled(False)
-        self.clear_button.setEnabled(False)
+        # Queue the job; the form is free for the next topic straight away
+        use_cache = not self.bypass_cache_checkbox.isChecked()
+        self.job_manager.submit(topic, num_cards, notes, use_cache)
+        self.clear_form()
+
+    def on_queue_changed(self):
+        """Update the progress UI to reflect the generation queue."""
+        jobs = self.job_manager.jobs()
+        self.job_queue.set_jobs(jobs)
+
+        busy = self.job_manager.is_busy() or self.batch_worker is not None
+        self.progress_bar.setVisible(busy)
+        self.status_label.setVisible(busy)
+        if self.job_manager.is_busy():
+            self.status_label.setText(
+                f"Generating flashcards for {len(jobs)} topic(s)... This may take up to a minute each."
+            )
+
+    def on_batch_button_clicked(self, checked=None):
+        """Start a batch from a file, or cancel the running batch."""
+        if self.batch_worker is not None:
+            self.batch_worker.cancel()
+            self.batch_button.setEnabled(False)
+            self.status_label.setText("Cancelling batch... decks generated so far will be kept.")
+            return
 
-        # Create worker for background processing
-        worker = GenerateFlashcardsWorker(self.api_client, topic, num_cards, notes)
+        self.start_batch_generation()
 
-        # Connect signals
-        worker.signals.finished.connect(self.on_generation_complete)
-        worker.signals.error.connect(self.on_generation_error)
+    @handle_errors(dialog_title="Batch Error")
+    def start_batch_generation(self):
+        """Generate a deck for every topic listed in a text or CSV file."""
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Topic List",
+            "",
+            "Topic lists (*.txt *.csv);;All files (*)"
+        )
+        if not path:
+            return
 
-        # Start worker
-        self.thread_pool.start(worker)
+        topics = parse_topic_file(path, default_num_cards=self.num_cards_input.value())
+        if not topics:
+            QMessageBox.warning(self, "No Topics", "The selected file doesn't contain any topics.")
+            return
 
-        self.logger.info(f"Started flashcard generation for '{topic}' with {num_cards} cards")
+        reply = QMessageBox.question(
+            self,
+            "Batch Generation",
+            f"Generate {len(topics)} decks from '{path}'?\n\n"
+            f"This may take a while; you can keep using the app in the meantime.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        self.batch_worker = BatchGenerationWorker(
+            self.api_client,
+            self.storage,
+            topics,
+            max_concurrency=self.settings.get("batch_max_concurrency", 3)
+        )
+        self.batch_worker.signals.progress.connect(self.on_batch_progress)
+        self.batch_worker.signals.finished.connect(self.on_batch_finished)
+        self.batch_worker.signals.error.connect(self.on_batch_error)
+
+        # Show determinate progress for the batch
+        self.batch_button.setText("Cancel Batch")
+        self.progress_bar.setRange(0, len(topics))
+        self.progress_bar.setValue(0)
+        self.on_batch_progress(0, len(topics))
+        self.on_queue_changed()
+
+        # Run outside the job manager's pool so queued jobs keep their slots
+        QThreadPool.globalInstance().start(self.batch_worker)
+        self.logger.info("Started batch generation of %s topics from %s", len(topics), path)
+
+    def on_batch_progress(self, done, total):
+        """Show batch progress."""
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"Batch generation: {done} of {total} topics processed")
+
+    def _reset_batch_ui(self):
+        """Restore the progress UI after a batch ends."""
+        self.batch_worker = None
+        self.batch_button.setText("Batch from File...")
+        self.batch_button.setEnabled(True)
+        self.progress_bar.setRange(0, 0)  # Back to indeterminate
+        self.on_queue_changed()
+
+    def on_batch_finished(self, report):
+        """Show the batch report."""
+        self._reset_batch_ui()
+
+        QMessageBox.information(self, "Batch Generation Complete", report.summary())
+
+    def on_batch_error(self, error_message):
+        """Handle a batch that could not run at all."""
+        self._reset_batch_ui()
+        QMessageBox.critical(self, "Batch Generation Failed", f"Batch generation failed: {error_message}")
 
     @handle_errors(dialog_title="Processing Error")
-    def on_generation_complete(self, response):
+    def on_generation_complete(self, job, response):
         """Handle successful flashcard generation."""
         if not response or not response.cards:
-            self.on_generation_error("No flashcards were generated. Please try again.")
+            self.on_generation_failed(job, "No flashcards were generated. Please try again.")
             return
 
         # Create a new deck from the response
@@ -372,46 +468,41 @@ class HomeView(ResponsiveView):
             )
             deck.add_card(card)
 
-        # Save the deck
+        # Save the deck (the recent cards list updates from the storage event)
         self.storage.save_deck(deck)
 
-        # Reset UI
-        self.progress_bar.setVisible(False)
-        self.status_label.setVisible(False)
-        self.generate_button.setEnabled(True)
-        self.clear_button.setEnabled(True)
-        self.clear_form()
-
-        # Refresh recent cards
-        self.load_recent_cards()
-
-        # Show success message
-        QMessageBox.information(
-            self,
-            "Flashcards Generated",
-            f"Successfully created {len(response.cards)} flashcards on '{response.topic}'.\n\n"
-            f"Switch to the Study tab to start learning!"
-        )
+        # While other jobs are still running, don't interrupt with a dialog
+        if self.job_manager.is_busy():
+            self.logger.info("Created %s flashcards on '%s'", len(response.cards), response.topic)
+        else:
+            # Show success message
+            source_note = " (loaded from cache)" if response.from_cache else ""
+            QMessageBox.information(
+                self,
+                "Flashcards Generated",
+                f"Successfully created {len(response.cards)} flashcards on '{response.topic}'{source_note}.\n\n"
+                f"Switch to the Study tab to start learning!"
+            )
 
         # Emit signal that a new deck was created
         self.deck_created.emit(deck.id)
 
-    def on_generation_error(self, error_message):
+    def on_generation_failed(self, job, error_message):
         """Handle error during flashcard generation."""
-        # Reset UI
-        self.progress_bar.setVisible(False)
-        self.status_label.setVisible(False)
-        self.generate_button.setEnabled(True)
-        self.clear_button.setEnabled(True)
+        # While other jobs are still running, report without a dialog
+        if self.job_manager.is_busy():
+            self.status_label.setText(f"Failed to generate flashcards for '{job.topic}': {error_message}")
+            return
 
         # Show error message
         QMessageBox.critical(
             self,
             "Generation Failed",
-            f"Failed to generate flashcards: {error_message}\n\n"
+            f"Failed to generate flashcards for '{job.topic}': {error_message}\n\n"
             f"Please check your internet connection and try again."
         )
 
+    @traced(category="ui")
     def load_recent_cards(self):
         """Load and display recently created cards."""
         self.logger.debug("Loading recent cards")
@@ -438,6 +529,28 @@ class HomeView(ResponsiveView):
         # Add to card list
         self.card_list.add_cards(recent_cards)
 
+    def on_cards_saved(self, event):
+        """Update listed cards in place and reload when new cards were added."""
+        has_new_cards = False
+        for card in event.cards:
+            if self.card_list.get_card(card.id):
+                self.card_list.update_card(card)
+            else:
+                has_new_cards = True
+
+        if has_new_cards:
+            self.load_recent_cards()
+
+    def on_cards_deleted(self, event):
+        """Remove deleted cards from the list."""
+        for card_id in event.card_ids:
+            if self.card_list.get_card(card_id):
+                self.card_list.remove_card(card_id)
+
+    def on_decks_deleted(self, event):
+        """Reload the list, since the cards of deleted decks are gone too."""
+        self.load_recent_cards()
+
     def preview_card(self, card_id):
         """Preview a card when requested."""
         card = self.card_list.get_card(card_id)
@@ -454,7 +567,7 @@ class HomeView(ResponsiveView):
         # Find the card
         card = self.card_list.get_card(card_id)
         if not card:
-            self.logger.warning(f"Card {card_id} not found for editing")
+            self.logger.warning("Card %s not found for editing", card_id)
             return
 
         # Get the deck for this card
@@ -471,10 +584,10 @@ class HomeView(ResponsiveView):
                             updated_card = dialog.get_updated_card()
                             self.storage.save_card(updated_card, deck.id)
                             self.card_list.update_card(updated_card)
-                            self.logger.info(f"Card {card_id} updated")
+                            self.logger.info("Card %s updated", card_id)
                         return
 
-        self.logger.warning(f"Could not find deck for card {card_id}")
+        self.logger.warning("Could not find deck for card %s", card_id)
 
     @handle_errors(dialog_title="Delete Error")
     def delete_card(self, card_id):
@@ -497,18 +610,82 @@ class HomeView(ResponsiveView):
         if result:
             # Remove from UI
             self.card_list.remove_card(card_id)
-            self.logger.info(f"Card {card_id} deleted")
+            self.logger.info("Card %s deleted", card_id)
         else:
-            self.logger.warning(f"Failed to delete card {card_id}")
+            self.logger.warning("Failed to delete card %s", card_id)
 
-    def update_settings(self):
+    def update_settings(self, changed):
         """Update view based on changed settings."""
-        # Get updated settings
+        cache_changed = not changed.isdisjoint(self.cache_settings)
+        if cache_changed:
+            self.update_response_cache()
+
+        # Rebuild the API client only when its configuration changed
+        if cache_changed or not changed.isdisjoint(self.api_settings):
+            if "api_url" in changed:
+                # A different server starts with a closed circuit
+                self.circuit_breaker = self.create_circuit_breaker()
+            else:
+                self.circuit_breaker.failure_threshold = self.settings.get("circuit_breaker_threshold", 5)
+                self.circuit_breaker.reset_timeout = self.settings.get("circuit_breaker_reset", 30)
+            self.api_client = self.create_api_client()
+            self.job_manager.set_api_client(self.api_client)
+        if "max_concurrent_generations" in changed:
+            self.job_manager.set_max_in_flight(self.settings.get("max_concurrent_generations", 2))
+
+    def create_api_client(self):
+        """Create an API client configured from the current settings."""
         api_url = self.settings.get("api_url", "http://localhost:8000")
         api_timeout = self.settings.get("api_timeout", 60)
 
-        # Update API client
-        self.api_client = APIClient(base_url=api_url, timeout=api_timeout)
+        retry_policy = RetryPolicy(
+            max_retries=self.settings.get("api_max_retries", 3),
+            backoff_base=self.settings.get("api_backoff_base", 1.0),
+            backoff_max=self.settings.get("api_backoff_max", 30.0)
+        )
+        # Imported here so the HTTP stack isn't loaded during startup
+        from src.api.client import APIClient
+
+        return APIClient(
+            base_url=api_url,
+            timeout=api_timeout,
+            cache=self.response_cache,
+            retry_policy=retry_policy,
+            circuit_breaker=self.circuit_breaker
+        )
+
+    def create_circuit_breaker(self):
+        """Create a circuit breaker configured from the current settings."""
+        return CircuitBreaker(
+            failure_threshold=self.settings.get("circuit_breaker_threshold", 5),
+            reset_timeout=self.settings.get("circuit_breaker_reset", 30)
+        )
+
+    def shutdown(self):
+        """Stop background generation, keeping unfinished jobs for the next run."""
+        self.job_manager.shutdown()
+        if self.batch_worker is not None:
+            self.batch_worker.cancel()
+
+    def create_response_cache(self):
+        """Create the on-disk response cache if caching is enabled in settings."""
+        if not self.settings.get("cache_enabled", True):
+            self.logger.info("Response cache disabled in settings")
+            return None
+
+        ttl_hours = self.settings.get("cache_ttl_hours", 168)
+        max_entries = self.settings.get("cache_max_entries", 500)
+        return ResponseCache(ttl_seconds=ttl_hours * 3600, max_entries=max_entries)
+
+    def update_response_cache(self):
+        """Apply changed cache settings, keeping the cache and its counters while it stays enabled."""
+        if self.response_cache is None or not self.settings.get("cache_enabled", True):
+            self.response_cache = self.create_response_cache()
+        else:
+            # Expiry applies from the next lookup, the entry limit from the next stored response
+            self.response_cache.ttl_seconds = self.settings.get("cache_ttl_hours", 168) * 3600
+            self.response_cache.max_entries = self.settings.get("cache_max_entries", 500)
+        self.bypass_cache_checkbox.setEnabled(self.response_cache is not None)
 
     def show_new_card_with_topic_dialog(self):
         """Show the dialog to create a new card with topic selection."""
@@ -534,7 +711,6 @@ class HomeView(ResponsiveView):
 
         # Save the card with the correct deck_id
         self.storage.save_card(new_card, deck_id)
-        self.load_recent_cards()
 
         # Show confirmation
         QMessageBox.information(
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QSizePolicy
 from PyQt6.QtCore import Qt, QSize
+from src.core.events import StorageEvent
 from src.utils.logger import get_logger
 
 class ResponsiveView(QWidget):
@@ -8,6 +9,12 @@ class ResponsiveView(QWidget):
     Inherit from this class to create views that respond to window size changes.
     """
     
+    # Storage tables the view renders; refresh_if_stale only reloads when one of them changed
+    data_tables = ()
+    
+    # Settings the view depends on; update_settings is only called when one of them changed
+    settings_keys = ()
+    
     def __init__(self, settings, storage, parent=None):
         """Initialize the responsive view with settings and storage."""
         super().__init__(parent)
@@ -26,6 +33,16 @@ class ResponsiveView(QWidget):
         
         # Store references to all layouts to prevent garbage collection
         self._layout_references = []
+        
+        # Storage table versions as of the last render
+        self._rendered_versions = {}
+        
+        # Views that render storage data follow writes made anywhere in the app
+        if self.data_tables:
+            self.subscribe(StorageEvent, self.on_storage_changed)
+        
+        if self.settings_keys:
+            self.settings.subscribe(self.settings_keys, self.update_settings)
     
     def handle_resize(self, width, height):
         """
@@ -73,10 +90,73 @@ class ResponsiveView(QWidget):
         self.is_compact_mode = False
         self.logger.debug("Switching to normal mode")
     
-    def update_settings(self):
+    def load_data(self):
+        """
+        Load the view's data from storage.
+        Called once the main window has been shown, so slow queries don't delay the first paint.
+        """
+        pass
+    
+    def mark_rendered(self, *tables):
+        """
+        Record that the view now shows the current contents of the given tables.
+        Call before querying storage, so writes made during the query trigger another refresh.
+        
+        Args:
+            tables: Tables that were reloaded; defaults to all of ``data_tables``
+        """
+        versions = self.storage.data_versions()
+        for table in tables or self.data_tables:
+            self._rendered_versions[table] = versions[table]
+    
+    def changed_tables(self):
+        """Get the tables in ``data_tables`` that changed since they were last rendered."""
+        versions = self.storage.data_versions()
+        return {table for table in self.data_tables if self._rendered_versions.get(table) != versions[table]}
+    
+    def refresh_if_stale(self):
+        """
+        Reload the view if any table it renders changed since the last render.
+        
+        Returns:
+            True if the view was refreshed
+        """
+        changed = self.changed_tables()
+        if not changed:
+            self.logger.debug("View is up to date, skipping refresh")
+            return False
+        
+        self.refresh_changed(changed)
+        return True
+    
+    def subscribe(self, event_type, callback):
+        """Subscribe to storage events, if the storage publishes them."""
+        event_bus = getattr(self.storage, 'event_bus', None)
+        if event_bus:
+            event_bus.subscribe(event_type, callback)
+    
+    def on_storage_changed(self, event):
+        """
+        Refresh the view after a storage write if it is on screen.
+        Hidden views catch up through refresh_if_stale when they are shown.
+        """
+        if self.isVisible():
+            self.refresh_if_stale()
+    
+    def refresh_changed(self, tables):
+        """
+        Reload the parts of the view that depend on the given changed tables.
+        Override this method in subclasses that set ``data_tables``.
+        """
+        pass
+    
+    def update_settings(self, changed):
         """
         Update view based on changed settings.
-        Override this method in subclasses to implement settings update behavior.
+        Override this method in subclasses that set ``settings_keys``.
+        
+        Args:
+            changed: The changed setting keys, at least one of which is in ``settings_keys``
         """
         pass
         
@@ -6,12 +6,14 @@ from PyQt6.QtWidgets import (
     QGroupBox, QFrame, QSplitter, QSizePolicy, QWidget,
     QSpacerItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from src.core.prefetch import CardPrefetcher, DEFAULT_LOOKAHEAD, cache_size
 from src.data.models import StudySession, Flashcard
 from src.ui.widgets.flashcard_widget import FlashcardWidget
 from src.ui.widgets.card_list_widget import CardListWidget
 from src.utils.logger import get_logger
 from src.utils.error_handling import handle_errors
+from src.utils.tracing import traced
 from src.ui.views.responsive_view import ResponsiveView
 from src.ui.theme import ThemeManager
 
@@ -21,10 +23,15 @@ class StudyView(ResponsiveView):
     # Signal when study session is completed
     study_completed = pyqtSignal(str, int, int)  # deck_id, cards_studied, cards_correct
 
+    # The deck list shows deck names and card counts
+    data_tables = ('decks', 'flashcards')
+
+    settings_keys = ("card_flip_animation", "study_prefetch_cards", "theme")
+
     def __init__(self, settings, storage, parent=None):
         super().__init__(settings, storage, parent)
 
-        self.theme_manager = ThemeManager(settings=settings)
+        self.theme_manager = ThemeManager.shared(settings)
 
         # Study session state
         self.current_deck = None
@@ -34,6 +41,12 @@ class StudyView(ResponsiveView):
         self.cards_studied = 0
         self.cards_correct = 0
 
+        # Renders the faces of the next cards while the current one is studied
+        self.card_prefetcher = CardPrefetcher(
+            max_entries=cache_size(self.settings.get("study_prefetch_cards", DEFAULT_LOOKAHEAD)),
+            parent=self
+        )
+
         # Setup UI
         self.setup_ui()
 
@@ -211,10 +224,15 @@ class StudyView(ResponsiveView):
         self.flashcard_layout.addWidget(progress_container)
         
         # Flashcard widget (will auto-scale)
-        self.flashcard_widget = FlashcardWidget()
-        self.flashcard_widget.card_frame.setObjectName("flashcardFrame")
+        self.flashcard_widget = FlashcardWidget(animate_flips=self.settings.get("card_flip_animation", True))
         self.flashcard_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.flashcard_widget.card_flipped.connect(self.on_card_flipped)
+        # Render the upcoming cards again for the new width once resizing settles
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(200)
+        self.prefetch_timer.timeout.connect(self.prefetch_cards)
+        self.flashcard_widget.width_changed.connect(self.prefetch_timer.start)
         self.flashcard_layout.addWidget(self.flashcard_widget)
         
         # Control buttons in responsive grid layout
@@ -474,9 +492,21 @@ class StudyView(ResponsiveView):
         self.controls_layout.addStretch(1)
 
 
+    @traced(category="ui")
+    def refresh_changed(self, tables):
+        """Reload the deck list when decks or cards changed."""
+        self.refresh_decks()
+
+    def on_storage_changed(self, event):
+        """Refresh for changes made elsewhere, but never in the middle of a session."""
+        if not self.current_session:
+            super().on_storage_changed(event)
+
+    @traced(category="ui")
     def refresh_decks(self):
         """Refresh the deck list from storage."""
         self.logger.debug("Refreshing decks list")
+        self.mark_rendered()
 
         # Remember current selection if any
         current_id = self.deck_combo.currentData() if self.deck_combo.count() > 0 else None
@@ -612,7 +642,10 @@ class StudyView(ResponsiveView):
         # Apply appropriate layout for current window size
         self.handle_resize(self.current_width, self.current_height)
 
-        self.logger.info(f"Started study session for deck: {self.current_deck.name}")
+        # The card faces only have their final width once the study screen is laid out
+        QTimer.singleShot(0, self.prefetch_cards)
+
+        self.logger.info("Started study session for deck: %s", self.current_deck.name)
 
     def update_progress(self):
         """Update the progress display."""
@@ -631,6 +664,7 @@ class StudyView(ResponsiveView):
             self.progress_bar.setValue(0)
 
 
+    @traced(category="ui")
     def show_current_card(self):
         """Show the current card."""
         if not self.cards or not (0 <= self.current_index < len(self.cards)):
@@ -642,8 +676,14 @@ class StudyView(ResponsiveView):
         # Get the current card
         card = self.cards[self.current_index]
 
-        # Update the flashcard widget
-        self.flashcard_widget.set_card(card.question, card.answer)
+        # Update the flashcard widget, with the faces rendered ahead of time if they are ready
+        question_style, answer_style = self.flashcard_widget.face_styles()
+        self.flashcard_widget.set_card(
+            card.question,
+            card.answer,
+            self.card_prefetcher.get(card.question, question_style),
+            self.card_prefetcher.get(card.answer, answer_style)
+        )
 
         # Update navigation buttons
         self.prev_button.setEnabled(self.current_index > 0)
@@ -660,6 +700,26 @@ class StudyView(ResponsiveView):
         # Highlight the current card in the list
         self.study_card_list.highlight_card(card.id)
 
+        self.prefetch_cards()
+
+    def prefetch_cards(self):
+        """Render the faces of the next cards, and of the previous one, in the background."""
+        lookahead = self.settings.get("study_prefetch_cards", DEFAULT_LOOKAHEAD)
+        if lookahead <= 0 or not self.cards or not self.flashcard_widget.isVisible():
+            return
+
+        question_style, answer_style = self.flashcard_widget.face_styles()
+        # The current answer is needed first, then the cards in the order they will be shown
+        upcoming = self.cards[self.current_index + 1:self.current_index + 1 + lookahead]
+        faces = [(self.cards[self.current_index].answer, answer_style)]
+        for card in upcoming:
+            faces.append((card.question, question_style))
+            faces.append((card.answer, answer_style))
+        if self.current_index > 0:
+            previous = self.cards[self.current_index - 1]
+            faces.append((previous.question, question_style))
+        self.card_prefetcher.prefetch(faces)
+
     def show_previous_card(self):
         """Show the previous card."""
         if self.current_index > 0:
@@ -706,7 +766,8 @@ class StudyView(ResponsiveView):
              self.logger.error("Cannot save reviewed card: current_deck is None.")
              QMessageBox.critical(self, "Internal Error", "Cannot save card review status. Deck information missing.")
              return
-        self.storage.save_card(card, self.current_deck.id)
+        session_id = self.current_session.id if self.current_session else None
+        self.storage.save_review(card, self.current_deck.id, is_correct, session_id)
 
         # Track statistics
         self.cards_studied += 1
@@ -771,8 +832,8 @@ class StudyView(ResponsiveView):
         )
 
         self.logger.info(
-            f"Study session completed: {self.cards_studied} cards studied, "
-            f"{self.cards_correct} correct, {accuracy:.1f}% accuracy"
+            "Study session completed: %s cards studied, %s correct, %.1f%% accuracy",
+            self.cards_studied, self.cards_correct, accuracy
         )
 
     def restart_session(self):
@@ -798,7 +859,7 @@ class StudyView(ResponsiveView):
              self.start_study_session()
         else:
              # If deck somehow disappeared, go back to selection screen
-             self.logger.warning(f"Could not find deck {deck_id} to restart session.")
+             self.logger.warning("Could not find deck %s to restart session.", deck_id)
              self.return_to_deck_selection()
 
 
@@ -880,7 +941,7 @@ class StudyView(ResponsiveView):
                      new_text = f"{deck_name} ({new_count} cards)"
                      self.deck_combo.setItemText(self.deck_combo.currentIndex(), new_text)
                 except (IndexError, ValueError):
-                     self.logger.warning(f"Could not parse card count from '{current_text}' to update.")
+                     self.logger.warning("Could not parse card count from '%s' to update.", current_text)
                      # Fallback: Refresh the whole deck list if parsing fails
                      self.refresh_decks()
 
@@ -899,7 +960,7 @@ class StudyView(ResponsiveView):
         card = self.preview_card_list.get_card(card_id)
 
         if not card:
-            self.logger.warning(f"Card {card_id} not found in preview list for editing.")
+            self.logger.warning("Card %s not found in preview list for editing.", card_id)
             return
 
         # Get the deck context (assuming the currently selected deck is correct)
@@ -966,7 +1027,7 @@ class StudyView(ResponsiveView):
                  new_text = f"{deck_name} ({new_count} cards)"
                  self.deck_combo.setItemText(self.deck_combo.currentIndex(), new_text)
             except (IndexError, ValueError):
-                 self.logger.warning(f"Could not parse card count from '{current_text}' to update after delete.")
+                 self.logger.warning("Could not parse card count from '%s' to update after delete.", current_text)
                  # Fallback: Refresh the whole deck list if parsing fails
                  self.refresh_decks()
 
@@ -978,36 +1039,21 @@ class StudyView(ResponsiveView):
                 "The flashcard has been deleted successfully."
             )
         else:
-            self.logger.warning(f"Failed to delete card {card_id} from storage.")
+            self.logger.warning("Failed to delete card %s from storage.", card_id)
             QMessageBox.warning(
                 self,
                 "Delete Failed",
                 "Failed to delete the flashcard from storage. Please check logs."
             )
 
-    def update_settings(self):
+    def update_settings(self, changed):
         """Update view based on changed settings."""
-        # Apply any settings changes that affect the study view
-        # e.g., shuffle setting, card display preferences
-
-        # Check for theme changes that might affect card display
-        theme = self.settings.get("theme", "light")
-        if hasattr(self, 'flashcard_widget'):
-            # Update flashcard styling based on theme
-            # More robust theme handling might involve stylesheets or specific methods
-            # Keeping simple background color change for now
-            if theme == "dark":
-                # Example: Use theme variables if available
-                bg_color = self.theme_manager.variables.get("dark", {}).get("background", "#3a3a3a")
-                fg_color = self.theme_manager.variables.get("dark", {}).get("foreground", "#e0e0e0")
-                border_color = self.theme_manager.variables.get("dark", {}).get("border", "#555555")
-                # Apply to card_frame specifically if general theme isn't enough
-                # self.flashcard_widget.card_frame.setStyleSheet(f"background-color: {bg_color}; color: {fg_color}; border: 1px solid {border_color};")
-            else:
-                bg_color = self.theme_manager.variables.get("light", {}).get("background", "white")
-                fg_color = self.theme_manager.variables.get("light", {}).get("foreground", "#333333")
-                border_color = self.theme_manager.variables.get("light", {}).get("border", "#cccccc")
-                # self.flashcard_widget.card_frame.setStyleSheet(f"background-color: {bg_color}; color: {fg_color}; border: 1px solid {border_color};")
-            # Note: Theme application is primarily handled by ThemeManager applying stylesheets.
-            # This direct styling might be redundant or conflict if not managed carefully.
-            pass # Rely on ThemeManager stylesheet updates primarily
\ No newline at end of file
+        if not hasattr(self, 'flashcard_widget'):
+            return
+        self.flashcard_widget.animate_flips = self.settings.get("card_flip_animation", True)
+        if "theme" in changed:
+            # Faces rendered with the old theme's font and colours no longer match
+            self.flashcard_widget.show_text()
+            self.card_prefetcher.clear()
+        if "study_prefetch_cards" in changed:
+            self.card_prefetcher.resize(cache_size(self.settings.get("study_prefetch_cards", DEFAULT_LOOKAHEAD)))
\ No newline at end of file
@@ -1,103 +1,216 @@
 # src/ui/widgets/flashcard_widget.py
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, 
-    QFrame, QSizePolicy
+    QWidget, QVBoxLayout, QLabel, QFrame, QSizePolicy,
+    QStackedWidget, QGraphicsOpacityEffect
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QRect
+from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6.QtGui import QPalette, QPixmap
+from src.core.prefetch import FaceStyle
 
 class FlashcardWidget(QWidget):
-    """Widget for displaying and interacting with a flashcard."""
-    
+    """
+    Widget for displaying and interacting with a flashcard.
+
+    The question and answer sides are two faces built and styled once, in
+    a stacked widget. Showing a card only sets the faces' text and flipping
+    only switches the visible face, so neither re-resolves the stylesheet.
+
+    A face can also show an image of its text rendered ahead of time by
+    ``CardPrefetcher`` with the style from ``face_styles``, which skips
+    laying out the text when the card is shown.
+    """
+
     # Signal emitted when card is flipped
     card_flipped = pyqtSignal(bool)
-    
-    def __init__(self):
+
+    # Signal emitted when the card width, and so the face style, changes
+    width_changed = pyqtSignal()
+
+    # Length of the flip cross-fade in milliseconds
+    FLIP_DURATION_MS = 150
+
+    def __init__(self, animate_flips=True):
         super().__init__()
-        
+
         # State
         self.question = ""
         self.answer = ""
         self.is_flipped = False
-        
+        # Whether a face currently shows a pre-rendered image instead of text
+        self.showing_images = False
+
+        # Whether flipping cross-fades to the other face
+        self.animate_flips = animate_flips
+        self._flip_animation = None
+
         # Setup UI
         self.setup_ui()
-    
+
     def setup_ui(self):
         """Set up the user interface with modern styling."""
         # Main layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        
-        # Create card frame
-        self.card_frame = QFrame()
-        self.card_frame.setObjectName("flashcardFrame")
-        self.card_frame.setFrameShape(QFrame.Shape.Box)
-        self.card_frame.setLineWidth(0)  # No explicit line - handled by stylesheet border
-        self.card_frame.setSizePolicy(
-            QSizePolicy.Policy.Expanding, 
+
+        # One pre-styled face per side of the card
+        self.face_stack = QStackedWidget()
+        self.face_stack.setSizePolicy(
+            QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
         )
-        self.card_frame.setMinimumHeight(400)
-        
+        self.question_frame, self.question_label = self.create_face(flipped=False)
+        self.answer_frame, self.answer_label = self.create_face(flipped=True)
+        self.face_stack.addWidget(self.question_frame)
+        self.face_stack.addWidget(self.answer_frame)
+
+        # Add the faces to main layout
+        layout.addWidget(self.face_stack)
+
+        # Set initial content
+        self.update_display()
+
+    def create_face(self, flipped):
+        """
+        Create the frame and content label of one side of the card.
+
+        The style properties are set before the face is first polished and
+        never change afterwards.
+
+        Returns:
+            Tuple of (frame, label)
+        """
+        frame = QFrame()
+        frame.setObjectName("flashcardFrame")
+        frame.setProperty("flipped", "true" if flipped else "false")
+        frame.setFrameShape(QFrame.Shape.Box)
+        frame.setLineWidth(0)  # No explicit line - handled by stylesheet border
+        frame.setMinimumHeight(400)
+
         # Card layout
-        card_layout = QVBoxLayout(self.card_frame)
+        card_layout = QVBoxLayout(frame)
         card_layout.setContentsMargins(32, 32, 32, 32)
         card_layout.setSpacing(16)
-        
+
         # Content label
-        self.content_label = QLabel()
-        self.content_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.content_label.setWordWrap(True)
-        self.content_label.setProperty("class", "card-content")
-        card_layout.addWidget(self.content_label, 1)
-        
-        # Add card frame to main layout
-        layout.addWidget(self.card_frame)
-        
-        # Set initial content
-        self.update_display()
+        label = QLabel()
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setWordWrap(True)
+        label.setProperty("class", "card-content card-answer" if flipped else "card-content card-question")
+        # A pre-rendered image must not stop the card from shrinking
+        label.setMinimumWidth(1)
+        card_layout.addWidget(label, 1)
+
+        return frame, label
 
     def update_display(self):
-        """Update the display based on current state with proper styling."""
-        if self.is_flipped:
-            self.content_label.setText(self.answer)
-            self.content_label.setProperty("class", "card-content card-answer")
-            # Set flipped property for styling
-            self.card_frame.setProperty("flipped", "true")
-        else:
-            self.content_label.setText(self.question)
-            self.content_label.setProperty("class", "card-content card-question")
-            # Remove flipped property
-            self.card_frame.setProperty("flipped", "false")
-        
-        # Force style refresh
-        self.card_frame.style().unpolish(self.card_frame)
-        self.card_frame.style().polish(self.card_frame)
-        self.content_label.style().unpolish(self.content_label)
-        self.content_label.style().polish(self.content_label)
-    
-    def set_card(self, question, answer):
-        """Set the card content."""
+        """Show the face matching the current state, without animation."""
+        self._finish_flip_animation()
+        self.face_stack.setCurrentWidget(self.answer_frame if self.is_flipped else self.question_frame)
+
+    def set_card(self, question, answer, question_image=None, answer_image=None):
+        """
+        Set the card content.
+
+        Args:
+            question: Question text
+            answer: Answer text
+            question_image: Optional QImage of the question rendered with ``face_styles()``
+            answer_image: Optional QImage of the answer rendered with ``face_styles()``
+        """
         self.question = question
         self.answer = answer
-        
+        self.set_face_content(self.question_label, question, question_image)
+        self.set_face_content(self.answer_label, answer, answer_image)
+        self.showing_images = question_image is not None or answer_image is not None
+
         # Reset to question side
         self.is_flipped = False
         self.update_display()
-    
+
+    def set_face_content(self, label, text, image=None):
+        """Show a face's pre-rendered image if there is one, otherwise its text."""
+        if image is not None:
+            label.setPixmap(QPixmap.fromImage(image))
+            label.setAccessibleName(text)
+        else:
+            label.setText(text)
+
+    def show_text(self):
+        """Replace pre-rendered images with the text, e.g. once they no longer match the faces."""
+        if self.showing_images:
+            self.set_face_content(self.question_label, self.question)
+            self.set_face_content(self.answer_label, self.answer)
+            self.showing_images = False
+
+    def face_styles(self):
+        """
+        Get how the question and answer faces draw text, for rendering cards ahead of time.
+
+        Returns:
+            Tuple of (question FaceStyle, answer FaceStyle)
+        """
+        # The hidden face is not laid out, and both faces have the same width
+        width = self.question_label.contentsRect().width()
+        styles = []
+        for label in (self.question_label, self.answer_label):
+            label.ensurePolished()
+            styles.append(FaceStyle(
+                font=label.font().toString(),
+                color=label.palette().color(QPalette.ColorRole.WindowText).name(),
+                width=width,
+                device_pixel_ratio=label.devicePixelRatioF()
+            ))
+        return tuple(styles)
+
+    def resizeEvent(self, event):
+        """Fall back to text when the card width changes, as the images were rendered for the old width."""
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self.show_text()
+            self.width_changed.emit()
+
     def flip_card(self):
         """Flip the card between question and answer."""
         self.is_flipped = not self.is_flipped
-        
+
         # Update display with animation
         self.animate_flip()
-        
+
         # Emit signal
         self.card_flipped.emit(self.is_flipped)
-    
+
     def animate_flip(self):
-        """Animate the card flip."""
-        # Simple animation - just update content
-        # In a more advanced implementation, you could add a 3D flip effect
-        self.update_display()
\ No newline at end of file
+        """
+        Switch to the other face, fading it in when animations are on.
+
+        The fade is driven by the event loop, so input keeps being handled
+        while it runs; the opacity effect is removed when it finishes.
+        """
+        self.update_display()
+        if not self.animate_flips or not self.isVisible():
+            return
+
+        face = self.face_stack.currentWidget()
+        effect = QGraphicsOpacityEffect(face)
+        face.setGraphicsEffect(effect)
+
+        animation = QPropertyAnimation(effect, b"opacity", self)
+        animation.setDuration(self.FLIP_DURATION_MS)
+        animation.setStartValue(0.0)
+        animation.setEndValue(1.0)
+        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        animation.finished.connect(self._finish_flip_animation)
+        self._flip_animation = animation
+        animation.start()
+
+    def _finish_flip_animation(self):
+        """Stop a running flip fade and remove its opacity effect."""
+        animation, self._flip_animation = self._flip_animation, None
+        if animation is None:
+            return
+        animation.stop()
+        face = animation.targetObject().parent()
+        # Without the effect the face is painted directly again
+        face.setGraphicsEffect(None)
+        animation.deleteLater()
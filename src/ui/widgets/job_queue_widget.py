@@ -0,0 +1,90 @@
+# src/ui/widgets/job_queue_widget.py
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QListWidget, QListWidgetItem, QPushButton,
+    QAbstractItemView, QSizePolicy
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+
+class JobQueueWidget(QWidget):
+    """Widget listing queued and running generation jobs with per-job cancellation."""
+
+    # Emits job ID when the user cancels a job
+    cancel_requested = pyqtSignal(str)
+
+    STATUS_LABELS = {
+        "pending": "Waiting",
+        "running": "Generating..."
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Set up the user interface."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        # Header with cancel button
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(8)
+
+        self.header_label = QLabel("Generation Queue")
+        self.header_label.setProperty("class", "h3")
+        self.header_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        header_layout.addWidget(self.header_label)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setProperty("class", "flat")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_selected_job)
+        self.cancel_button.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        header_layout.addWidget(self.cancel_button)
+
+        layout.addLayout(header_layout)
+
+        # Job list
+        self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.list_widget.itemSelectionChanged.connect(self.on_selection_changed)
+        self.list_widget.setMaximumHeight(140)
+        self.list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+        layout.addWidget(self.list_widget)
+
+        # Hidden until there is something queued
+        self.setVisible(False)
+
+    def set_jobs(self, jobs):
+        """Show the given jobs, keeping the current selection where possible."""
+        selected_id = self.selected_job_id()
+
+        self.list_widget.clear()
+        for job in jobs:
+            status = self.STATUS_LABELS.get(job.status, job.status.capitalize())
+            item = QListWidgetItem(f"{job.topic} ({job.num_cards} cards) - {status}")
+            item.setData(Qt.ItemDataRole.UserRole, job.id)
+            self.list_widget.addItem(item)
+            if job.id == selected_id:
+                item.setSelected(True)
+
+        self.header_label.setText(f"Generation Queue ({len(jobs)})")
+        self.setVisible(bool(jobs))
+        self.on_selection_changed()
+
+    def selected_job_id(self):
+        """Get the ID of the selected job, if any."""
+        items = self.list_widget.selectedItems()
+        return items[0].data(Qt.ItemDataRole.UserRole) if items else None
+
+    def on_selection_changed(self):
+        """Enable the cancel button only when a job is selected."""
+        self.cancel_button.setEnabled(self.selected_job_id() is not None)
+
+    def cancel_selected_job(self):
+        """Request cancellation of the selected job."""
+        job_id = self.selected_job_id()
+        if job_id:
+            self.cancel_requested.emit(job_id)
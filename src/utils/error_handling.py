@@ -1,96 +1,139 @@
-import traceback
+import inspect
 import functools
-from PyQt6.QtWidgets import QMessageBox
+import threading
+from PyQt6.QtCore import Qt, QObject, QCoreApplication, QThread, pyqtSignal, pyqtSlot
 from src.utils.logger import get_logger
 
 logger = get_logger("error_handler")
 
+# Friendlier dialogs for errors that have a well-known cause: type -> (title, message)
+DIALOG_MESSAGES = {
+    ConnectionError: (
+        "Connection Error",
+        "Could not connect to the flashcard API server.\n\n"
+        "Please check that the server is running and your network connection is active."
+    ),
+    TimeoutError: (
+        "Request Timeout",
+        "The request to the API server timed out.\n\n"
+        "This might be due to network issues or high server load."
+    ),
+}
+
+
+class _DialogDispatcher(QObject):
+    """Lives in the GUI thread and shows error dialogs requested from any thread."""
+    show = pyqtSignal(str, str)
+
+    def __init__(self):
+        super().__init__()
+        # Emitted from worker threads, so always delivered through the GUI
+        # event queue, even when the first error is reported by a worker
+        self.show.connect(self.show_dialog, Qt.ConnectionType.QueuedConnection)
+
+    @pyqtSlot(str, str)
+    def show_dialog(self, title, message):
+        # QtWidgets is only needed once an error dialog is actually shown
+        from PyQt6.QtWidgets import QMessageBox
+        QMessageBox.critical(None, title, message)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def _get_dispatcher(app) -> _DialogDispatcher:
+    """Get the dialog dispatcher, creating it in the GUI thread's affinity on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = _DialogDispatcher()
+            _dispatcher.moveToThread(app.thread())
+        return _dispatcher
+
+
+def show_error_dialog(title: str, message: str) -> None:
+    """
+    Show an error dialog from any thread.
+
+    In the GUI thread the dialog is shown immediately (and is modal, as
+    before); from other threads it is queued to the GUI thread. Without a
+    running application there is nobody to show it to, so it is skipped.
+    """
+    app = QCoreApplication.instance()
+    if app is None:
+        return
+    dispatcher = _get_dispatcher(app)
+    if QThread.currentThread() is app.thread():
+        dispatcher.show_dialog(title, message)
+    else:
+        dispatcher.show.emit(title, message)
+
+
+def _report(error: Exception, name: str, show_dialog: bool, dialog_title: str, log_exception: bool):
+    """Log an exception caught by handle_errors and show its dialog (called from the except block)."""
+    if log_exception:
+        logger.error("Error in %s: %s: %s", name, type(error).__name__, error)
+        # The traceback is only formatted when debug logging is on for this module
+        logger.debug("Stack trace of %s", name, exc_info=True)
+
+    if show_dialog:
+        for error_type, (title, message) in DIALOG_MESSAGES.items():
+            if isinstance(error, error_type):
+                break
+        else:
+            title = dialog_title
+            message = f"An error occurred: {error}\n\nPlease try again or check the application logs."
+        show_error_dialog(title, message)
+
+
 def handle_errors(show_dialog=True, dialog_title="Error", log_exception=True):
     """
     Decorator for centralized error handling.
-    
+
+    Works on plain functions and coroutine functions. When no exception is
+    raised the wrapper only adds a call and a try block; the error is
+    reported, and the dialog shown on the GUI thread, only on failure.
+
     Args:
         show_dialog (bool): Whether to show an error dialog to the user
         dialog_title (str): Title for the error dialog
         log_exception (bool): Whether to log the exception details
-    
+
     Usage:
         @handle_errors()
         def some_function():
             # code that might raise exceptions
-            
+
         @handle_errors(show_dialog=False)  # Just log, don't show dialog
         def background_task():
             # background processing
+
+        @handle_errors(show_dialog=False)
+        async def fetch():
+            # awaited code that might raise exceptions
     """
     def decorator(func):
+        name = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    _report(e, name, show_dialog, dialog_title, log_exception)
+                    # Return None to indicate failure
+                    return None
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                # Get detailed exception information
-                error_msg = str(e)
-                error_type = type(e).__name__
-                stack_trace = traceback.format_exc()
-                
-                # Log the exception if requested
-                if log_exception:
-                    logger.error(f"Error in {func.__name__}: {error_type}: {error_msg}")
-                    logger.debug(f"Stack trace:\n{stack_trace}")
-                
-                # Show dialog if requested
-                if show_dialog:
-                    QMessageBox.critical(
-                        None,
-                        dialog_title,
-                        f"An error occurred: {error_msg}\n\n"
-                        f"Please try again or check the application logs."
-                    )
-                
-                # Re-raise certain exceptions that should not be swallowed
-                if isinstance(e, (KeyboardInterrupt, SystemExit)):
-                    raise
-                
+                _report(e, name, show_dialog, dialog_title, log_exception)
                 # Return None to indicate failure
                 return None
         return wrapper
     return decorator
-
-
-def handle_api_errors(func):
-    """
-    Specialized decorator for API call functions.
-    Handles API-specific errors and provides appropriate messages.
-    """
-    @functools.wraps(func)
-    @handle_errors(show_dialog=False, log_exception=True)  # First log but don't show dialog
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except ConnectionError:
-            logger.error("API connection error")
-            QMessageBox.critical(
-                None,
-                "Connection Error",
-                "Could not connect to the flashcard API server.\n\n"
-                "Please check that the server is running and your network connection is active."
-            )
-        except TimeoutError:
-            logger.error("API request timeout")
-            QMessageBox.critical(
-                None,
-                "Request Timeout",
-                "The request to the API server timed out.\n\n"
-                "This might be due to network issues or high server load."
-            )
-        except Exception as e:
-            # This will catch any exceptions not handled by the outer decorator
-            logger.error(f"Unhandled API error: {str(e)}")
-            QMessageBox.critical(
-                None,
-                "API Error",
-                f"An error occurred while communicating with the server: {str(e)}"
-            )
-        return None
-    return wrapper
\ No newline at end of file
@@ -1,6 +1,14 @@
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Background writer for the application log, started by setup_logger
+_listener = None
+
+# Module names given their own level by the last configure_log_levels call
+_module_levels = set()
 
 def get_log_path():
     """Get the path to the log file directory."""
@@ -10,7 +18,14 @@ def get_log_path():
     return os.path.join(log_dir, "flashcards.log")
 
 def setup_logger():
-    """Set up and configure the application logger."""
+    """
+    Set up and configure the application logger.
+    
+    Log calls only put the record on a queue; a QueueListener thread writes
+    it to the console and the log file, so no log call waits on file I/O.
+    """
+    global _listener
+    
     # Create logger
     logger = logging.getLogger("flashcards")
     logger.setLevel(logging.INFO)
@@ -33,14 +48,62 @@ def setup_logger():
         file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_format)
         
-        # Add handlers to logger
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+        # The logger only enqueues records; the listener thread runs the handlers
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
     
     return logger
 
+def shutdown_logging():
+    """
+    Stop the background writer once every queued record has been written.
+    
+    The handlers are moved back onto the logger, so anything logged later
+    in shutdown is still written, synchronously.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        logger = logging.getLogger("flashcards")
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        for handler in _listener.handlers:
+            logger.addHandler(handler)
+        _listener = None
+
+def _parse_level(level, default):
+    """Get a numeric log level from a level name or number, or the default if it is not valid."""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(str(level).upper())
+    return value if isinstance(value, int) else default
+
+def configure_log_levels(settings):
+    """
+    Apply the log levels from the settings.
+    
+    ``log_level`` is the level of the application logger and ``log_levels``
+    maps module names, as passed to get_logger, to their own level,
+    e.g. {"storage": "DEBUG"}. Modules dropped from the map since the last
+    call go back to the application level.
+    """
+    logger = logging.getLogger("flashcards")
+    logger.setLevel(_parse_level(settings.get("log_level"), logging.INFO))
+    
+    module_levels = settings.get("log_levels") or {}
+    for name in _module_levels.difference(module_levels):
+        get_logger(name).setLevel(logging.NOTSET)
+    for name, level in module_levels.items():
+        get_logger(name).setLevel(_parse_level(level, logging.NOTSET))
+    _module_levels.clear()
+    _module_levels.update(module_levels)
+
 def get_logger(name=None):
     """Get a named logger for a specific module."""
     if name:
         return logging.getLogger(f"flashcards.{name}")
-    return logging.getLogger("flashcards")
\ No newline at end of file
+    return logging.getLogger("flashcards")
@@ -0,0 +1,314 @@
+# src/utils/tracing.py
+"""
+Lightweight performance tracing.
+
+Code is instrumented with the ``traced`` decorator or the ``trace_span``
+context manager. While tracing is enabled every call records a span (name,
+category, start, duration, thread) in a fixed-size ring buffer of recent
+spans, from which per-name latency percentiles are computed and a Chrome
+trace (chrome://tracing or https://ui.perfetto.dev) can be exported.
+While disabled, an instrumented call costs one flag check.
+"""
+import os
+import sys
+import json
+import time
+import inspect
+import functools
+import threading
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional
+from src.utils.logger import get_logger
+from src.utils.error_handling import handle_errors
+
+logger = get_logger("tracing")
+
+# Set to a non-empty value (other than 0) to trace from startup, or pass --trace
+TRACE_ENV_VAR = "FLASHCARDS_TRACE"
+TRACE_FLAG = "--trace"
+
+# Number of recent spans kept in the ring buffer
+DEFAULT_CAPACITY = 20000
+
+# Checked by every instrumented call; only changed by enable/disable_tracing
+_enabled = False
+
+# Span start times are relative to this, in nanoseconds
+_origin_ns = time.perf_counter_ns()
+
+
+class Span(NamedTuple):
+    """A completed span; times are nanoseconds since the tracing origin."""
+    name: str
+    category: str
+    start: int
+    duration: int
+    thread_id: int
+    error: bool = False
+
+
+class SpanStats(NamedTuple):
+    """Latency statistics of the recent spans with one name, in milliseconds."""
+    name: str
+    category: str
+    count: int
+    errors: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class SpanRecorder:
+    """Keeps the most recent spans and lifetime call counts per span name."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.spans = deque(maxlen=capacity)
+        # name -> [category, calls, total nanoseconds] since the recorder was created or cleared
+        self.totals: Dict[str, list] = {}
+        self.thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, category: str, start: int, duration: int, error: bool = False) -> None:
+        """Add a completed span."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            self.spans.append(Span(name, category, start, duration, thread_id, error))
+            totals = self.totals.get(name)
+            if totals is None:
+                self.totals[name] = [category, 1, duration]
+            else:
+                totals[1] += 1
+                totals[2] += duration
+            if thread_id not in self.thread_names:
+                self.thread_names[thread_id] = threading.current_thread().name
+
+    def recent(self) -> List[Span]:
+        """Get a copy of the spans in the ring buffer, oldest first."""
+        with self._lock:
+            return list(self.spans)
+
+    def clear(self) -> None:
+        """Forget all recorded spans and totals."""
+        with self._lock:
+            self.spans.clear()
+            self.totals.clear()
+
+    def lifetime_totals(self) -> Dict[str, tuple]:
+        """Get (category, calls, total milliseconds) per span name since the recorder was created or cleared."""
+        with self._lock:
+            return {
+                name: (category, calls, total / 1e6)
+                for name, (category, calls, total) in self.totals.items()
+            }
+
+    def stats(self) -> List[SpanStats]:
+        """Get latency percentiles per span name over the ring buffer, slowest total first."""
+        by_name: Dict[str, List[Span]] = {}
+        for span in self.recent():
+            by_name.setdefault(span.name, []).append(span)
+
+        stats = []
+        for name, spans in by_name.items():
+            durations = sorted(span.duration / 1e6 for span in spans)
+            stats.append(SpanStats(
+                name=name,
+                category=spans[0].category,
+                count=len(durations),
+                errors=sum(span.error for span in spans),
+                total=sum(durations),
+                p50=percentile(durations, 50),
+                p95=percentile(durations, 95),
+                p99=percentile(durations, 99),
+                max=durations[-1]
+            ))
+        stats.sort(key=lambda item: item.total, reverse=True)
+        return stats
+
+    def chrome_trace(self) -> Dict:
+        """Get the recent spans in the Chrome trace event format."""
+        spans = self.recent()
+        pid = os.getpid()
+        with self._lock:
+            thread_names = dict(self.thread_names)
+
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in thread_names.items()
+        ]
+        for span in spans:
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start / 1000,
+                "dur": span.duration / 1000,
+                "pid": pid,
+                "tid": span.thread_id
+            }
+            if span.error:
+                event["args"] = {"error": True}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Get a percentile of sorted values by the nearest-rank method."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+# The process-wide recorder used by traced and trace_span
+recorder = SpanRecorder()
+
+
+def tracing_requested(argv: Optional[List[str]] = None) -> bool:
+    """Check whether tracing was requested on the command line or environment."""
+    if argv is None:
+        argv = sys.argv
+    if TRACE_FLAG in argv:
+        return True
+    return os.environ.get(TRACE_ENV_VAR, "") not in ("", "0")
+
+
+def tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _enabled
+
+
+def enable_tracing(capacity: Optional[int] = None) -> None:
+    """Start recording spans, optionally resizing the ring buffer (which clears it)."""
+    global _enabled
+    if capacity is not None and capacity != recorder.spans.maxlen:
+        with recorder._lock:
+            recorder.spans = deque(maxlen=capacity)
+    _enabled = True
+    logger.info("Tracing enabled (keeping the last %s spans)", recorder.spans.maxlen)
+
+
+def disable_tracing() -> None:
+    """Stop recording spans; the spans recorded so far are kept."""
+    global _enabled
+    _enabled = False
+    logger.info("Tracing disabled")
+
+
+def get_trace_path() -> str:
+    """Get the default path of an exported Chrome trace."""
+    log_dir = os.path.join(os.path.expanduser("~"), ".flashcards", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    return os.path.join(log_dir, "trace.json")
+
+
+@handle_errors(show_dialog=False, log_exception=True)
+def export_chrome_trace(path: Optional[str] = None) -> Optional[str]:
+    """
+    Write the recent spans as a Chrome trace JSON file.
+
+    Args:
+        path: Output file, defaults to ``get_trace_path()``
+
+    Returns:
+        The path written, or None if it could not be written
+    """
+    path = path or get_trace_path()
+    with open(path, 'w') as f:
+        json.dump(recorder.chrome_trace(), f)
+    logger.info("Trace of %s spans written to %s", len(recorder.spans), path)
+    return path
+
+
+class _Span:
+    """An open span, recorded when its block exits."""
+    __slots__ = ('name', 'category', 'start')
+
+    def __init__(self, name: str, category: str):
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        recorder.record(self.name, self.category, self.start - _origin_ns, end - self.start, exc_type is not None)
+        return False
+
+
+class _NullSpan:
+    """Stands in for a span while tracing is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def trace_span(name: str, category: str = "app"):
+    """
+    Context manager recording the enclosed block as a span.
+
+    Usage:
+        with trace_span("HistoryView.fill_table", "ui"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category)
+
+
+def traced(name: Optional[str] = None, category: str = "app"):
+    """
+    Decorator recording every call of a function or coroutine function as a span.
+
+    Args:
+        name (str): Span name, defaults to the function's qualified name
+        category (str): Span category, e.g. "storage", "api" or "ui"
+
+    Usage:
+        @handle_errors(show_dialog=False)
+        @traced(category="storage")
+        def get_all_decks(self):
+            ...
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                error = True
+                try:
+                    result = await func(*args, **kwargs)
+                    error = False
+                    return result
+                finally:
+                    recorder.record(span_name, category, start - _origin_ns, time.perf_counter_ns() - start, error)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                recorder.record(span_name, category, start - _origin_ns, time.perf_counter_ns() - start, error)
+        return wrapper
+    return decorator
@@ -0,0 +1,203 @@
+# src/utils/watchdog.py
+"""
+Event-loop stall detection.
+
+A background thread pings the GUI thread through a queued Qt signal and
+measures how long the reply takes: the event-loop latency any click or
+paint would have seen. When a ping stays unanswered for longer than the
+stall threshold, the watchdog captures the GUI thread's Python stack with
+``sys._current_frames`` and logs it, so the code blocking the event loop
+(typically a synchronous storage call in a view) can be found.
+"""
+import os
+import sys
+import time
+import datetime
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List
+from PyQt6.QtCore import QObject, pyqtSignal
+from src.utils import tracing
+from src.utils.logger import get_logger
+
+logger = get_logger("watchdog")
+
+# Frames from files under this directory are the application's own code
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_WRAPPER_FILES = ("tracing.py", "error_handling.py")
+
+
+@dataclass
+class StallReport:
+    """A period during which the event loop did not respond."""
+    started: datetime.datetime
+    function: str
+    stack: List[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+    ongoing: bool = True
+
+
+def describe_frame(summary: traceback.FrameSummary) -> str:
+    """Describe a stack frame as "function (path:line)", relative to the application source."""
+    path = summary.filename
+    if path.startswith(_SOURCE_ROOT):
+        path = os.path.relpath(path, os.path.dirname(_SOURCE_ROOT))
+    return f"{summary.name} ({path}:{summary.lineno})"
+
+
+def blocking_function(stack: traceback.StackSummary) -> str:
+    """Get the innermost application frame of a stack, or the innermost frame if none is ours."""
+    for summary in reversed(stack):
+        # Skip the decorators wrapping the function that is actually blocking
+        if summary.filename.startswith(_SOURCE_ROOT) and not summary.filename.endswith(_WRAPPER_FILES):
+            return describe_frame(summary)
+    return describe_frame(stack[-1]) if stack else "unknown"
+
+
+class _Heartbeat(QObject):
+    """Lives in the GUI thread and answers the watchdog's pings."""
+    ping = pyqtSignal(int)
+
+    def __init__(self, watchdog):
+        super().__init__()
+        self.watchdog = watchdog
+        # Emitted from the watchdog thread, so delivered through the GUI event queue
+        self.ping.connect(self.pong)
+
+    def pong(self, sequence):
+        self.watchdog._on_pong(sequence)
+
+
+class EventLoopWatchdog:
+    """
+    Measures GUI event-loop latency from a background thread and reports stalls.
+
+    Start it from the GUI thread once the event loop is running.
+    """
+
+    def __init__(self, interval_ms: int = 100, stall_threshold_ms: int = 250, window: int = 600,
+                 max_reports: int = 50):
+        self.interval_ms = interval_ms
+        self.stall_threshold_ms = stall_threshold_ms
+
+        # Latency of the most recent pings (one minute at the default interval)
+        self.lags = deque(maxlen=window)
+        self.reports = deque(maxlen=max_reports)
+        self.stalls = 0
+        self.worst_lag_ms = 0.0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._heartbeat = None
+        self._gui_thread_id = None
+        self._sequence = 0
+        self._sent_at = None  # perf_counter of the unanswered ping
+        self._current_report = None  # StallReport of the unanswered ping
+
+    def start(self):
+        """Start watching the calling (GUI) thread's event loop."""
+        if self._thread is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._heartbeat = _Heartbeat(self)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.debug("Event loop watchdog started (stall threshold %s ms)", self.stall_threshold_ms)
+
+    def stop(self):
+        """Stop the watchdog thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def set_stall_threshold(self, threshold_ms: int):
+        """Change the latency at which the event loop counts as stalled."""
+        self.stall_threshold_ms = threshold_ms
+
+    def reset(self):
+        """Forget the recorded latencies, stalls and stall reports."""
+        with self._lock:
+            self.lags.clear()
+            self.reports.clear()
+            self.stalls = 0
+            self.worst_lag_ms = 0.0
+
+    def _run(self):
+        """Watchdog thread: send a ping whenever the last one was answered, and check for stalls."""
+        interval = self.interval_ms / 1000
+        while not self._stop.wait(interval):
+            with self._lock:
+                sent_at = self._sent_at
+                if sent_at is None:
+                    self._sequence += 1
+                    self._sent_at = time.perf_counter()
+                    sequence = self._sequence
+                elif self._current_report is None:
+                    waited_ms = (time.perf_counter() - sent_at) * 1000
+                    if waited_ms >= self.stall_threshold_ms:
+                        self._current_report = self._capture_stall(waited_ms)
+
+            if sent_at is None:
+                self._heartbeat.ping.emit(sequence)
+
+    def _capture_stall(self, waited_ms: float) -> StallReport:
+        """Record the GUI thread's stack at the moment a stall is detected (called with the lock held)."""
+        frame = sys._current_frames().get(self._gui_thread_id)
+        stack = traceback.extract_stack(frame) if frame is not None else traceback.StackSummary()
+        report = StallReport(
+            started=datetime.datetime.now() - datetime.timedelta(milliseconds=waited_ms),
+            function=blocking_function(stack),
+            stack=[describe_frame(summary) for summary in stack]
+        )
+        self.stalls += 1
+        self.reports.append(report)
+        logger.warning(
+            "Event loop blocked for over %.0f ms in %s\nGUI thread stack (most recent call last):\n  %s",
+            waited_ms, report.function, "\n  ".join(report.stack)
+        )
+        return report
+
+    def _on_pong(self, sequence):
+        """GUI thread: the ping was answered; record its latency and close any stall."""
+        now = time.perf_counter()
+        with self._lock:
+            if sequence != self._sequence or self._sent_at is None:
+                return
+            lag = (now - self._sent_at) * 1000
+            self._sent_at = None
+            self.lags.append(lag)
+            self.worst_lag_ms = max(self.worst_lag_ms, lag)
+            report, self._current_report = self._current_report, None
+
+        if report is not None:
+            report.duration_ms = lag
+            report.ongoing = False
+            logger.warning("Event loop was blocked for %.0f ms in %s", lag, report.function)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get the latest, p95 and maximum recent latency (ms), stall count and worst latency ever."""
+        with self._lock:
+            lags = list(self.lags)
+            pending = (time.perf_counter() - self._sent_at) * 1000 if self._sent_at is not None else None
+            stalls, worst = self.stalls, self.worst_lag_ms
+        # An unanswered ping is the current latency
+        current = pending if pending is not None else (lags[-1] if lags else 0.0)
+        lags.sort()
+        return {
+            'current': current,
+            'p95': tracing.percentile(lags, 95),
+            'max': lags[-1] if lags else 0.0,
+            'stalls': stalls,
+            'worst': worst
+        }
+
+    def recent_reports(self) -> List[StallReport]:
+        """Get the recent stall reports, newest first."""
+        with self._lock:
+            return list(reversed(self.reports))
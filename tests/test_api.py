@@ -0,0 +1,213 @@
+import json
+import asyncio
+import pytest
+from src.api.decoding import DECODERS, ResponseValidationError
+from src.api.models import FlashCardPair, FlashCardResponse
+
+
+CARD = {"question": "What is 2 + 2?", "answer": "4"}
+
+VALID = [
+    ({"topic": "Math", "cards": [CARD], "source_info": "web"},
+     FlashCardResponse("Math", [FlashCardPair("What is 2 + 2?", "4")], "web")),
+    # Missing optional fields default like FlashCardResponse.from_dict
+    ({"topic": "Math"}, FlashCardResponse("Math", [])),
+    ({"topic": "Math", "cards": [], "source_info": None}, FlashCardResponse("Math", [])),
+    # Unknown keys are ignored, including the client-only from_cache
+    ({"topic": "Math", "cards": [dict(CARD, hint="even")], "from_cache": True, "model": "x"},
+     FlashCardResponse("Math", [FlashCardPair("What is 2 + 2?", "4")])),
+]
+
+INVALID = [
+    b"not json",
+    b"[]",
+    b'{"cards": []}',
+    b'{"topic": null}',
+    b'{"topic": 1}',
+    b'{"topic": "Math", "cards": null}',
+    b'{"topic": "Math", "cards": {}}',
+    b'{"topic": "Math", "cards": ["card"]}',
+    b'{"topic": "Math", "cards": [{"question": "Q"}]}',
+    b'{"topic": "Math", "cards": [{"question": "Q", "answer": 4}]}',
+    b'{"topic": "Math", "source_info": 1}',
+]
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+@pytest.mark.parametrize("data, expected", VALID)
+def test_decoders_accept_the_same_responses(decoder, data, expected):
+    response = DECODERS[decoder](json.dumps(data).encode())
+    assert response == expected
+    assert response.from_cache is False
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+@pytest.mark.parametrize("content", INVALID)
+def test_decoders_reject_the_same_responses(decoder, content):
+    with pytest.raises(ResponseValidationError):
+        DECODERS[decoder](content)
+
+
+class FakeClock:
+    """Stands in for the time module of src.api.retry."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    from src.api import retry
+    fake = FakeClock()
+    monkeypatch.setattr(retry, "time", fake)
+    return fake
+
+
+def open_breaker(clock, **kwargs):
+    """A breaker that has just opened after reaching its failure threshold."""
+    from src.api.retry import CircuitBreaker
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, **kwargs)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_circuit_breaker_lets_one_trial_through_after_reset_timeout(clock):
+    from src.api.retry import CircuitBreaker
+    breaker = open_breaker(clock)
+    assert not breaker.allow_request()
+    assert breaker.retry_in() == 30
+
+    clock.now += 30
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one trial at a time
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_failed_trial_reopens(clock):
+    from src.api.retry import CircuitBreaker
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_in() == 30
+
+
+def test_circuit_breaker_released_trial_frees_the_slot(clock):
+    from src.api.retry import CircuitBreaker
+    breaker = open_breaker(clock)
+    clock.now += 30
+    assert breaker.allow_request()
+    breaker.release_trial()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_lost_trial_reopens_after_trial_timeout(clock):
+    from src.api.retry import CircuitBreaker
+    breaker = open_breaker(clock, trial_timeout=60)
+    clock.now += 30
+    assert breaker.allow_request()
+
+    clock.now += 59
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert not breaker.allow_request()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 30
+    assert breaker.allow_request()
+
+
+class ScriptedClient:
+    """Async HTTP client whose POSTs raise or return the scripted outcomes in turn."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def make_api_client(breaker=None):
+    from src.api.client import APIClient
+    from src.api.retry import RetryPolicy
+    policy = RetryPolicy(max_retries=2, backoff_base=0, jitter=0)
+    return APIClient(retry_policy=policy, circuit_breaker=breaker)
+
+
+def post(api_client, http_client):
+    return asyncio.run(api_client._post_with_retry(http_client, "http://server/generate_flashcards", {}))
+
+
+def test_retry_loop_retries_transport_errors():
+    httpx = pytest.importorskip("httpx")
+    api_client = make_api_client()
+    http_client = ScriptedClient(httpx.ConnectError("refused"), httpx.ReadError("reset"), httpx.Response(200))
+    assert post(api_client, http_client).status_code == 200
+    assert http_client.calls == 3
+    assert api_client.circuit_breaker.state == "closed"
+
+
+def test_retry_loop_does_not_retry_read_timeouts_or_rejections():
+    httpx = pytest.importorskip("httpx")
+    from src.api.retry import APIError
+    api_client = make_api_client()
+    for outcome in (httpx.ReadTimeout("slow"), httpx.Response(422)):
+        http_client = ScriptedClient(outcome)
+        with pytest.raises(APIError):
+            post(api_client, http_client)
+        assert http_client.calls == 1
+
+
+@pytest.mark.parametrize("trial_outcome, state_after", [
+    ("read_error", "open"),
+    ("cancelled", "half_open"),
+    ("rejected", "half_open"),
+    ("success", "closed"),
+])
+def test_retry_loop_always_settles_the_trial_request(clock, trial_outcome, state_after):
+    """Whatever happens to a half-open trial, the breaker doesn't keep rejecting every request."""
+    httpx = pytest.importorskip("httpx")
+    from src.api.retry import APIError
+    breaker = open_breaker(clock)
+    clock.now += 30
+    api_client = make_api_client(breaker)
+    api_client.retry_policy.max_retries = 0
+
+    outcome = {
+        "read_error": httpx.ReadError("reset"),
+        "cancelled": asyncio.CancelledError(),
+        "rejected": httpx.Response(422),
+        "success": httpx.Response(200),
+    }[trial_outcome]
+    try:
+        post(api_client, ScriptedClient(outcome))
+    except (APIError, asyncio.CancelledError):
+        pass
+
+    assert breaker.state == state_after
+    if state_after == "open":
+        clock.now += 30
+    # The next request is sent (as a new trial unless the circuit closed)
+    assert breaker.allow_request()
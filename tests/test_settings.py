@@ -0,0 +1,166 @@
+import json
+import time
+import pytest
+from src.core.settings import Settings, FSYNC_ALWAYS, FSYNC_NEVER
+
+
+@pytest.fixture
+def settings_path(tmp_path):
+    return str(tmp_path / "settings.json")
+
+
+@pytest.fixture
+def make_settings(settings_path, monkeypatch):
+    """Create Settings that count their file writes in ``settings.writes``."""
+    def make(**kwargs):
+        kwargs.setdefault("flush_delay", 0.05)
+        settings = Settings(settings_path, **kwargs)
+        settings.writes = []
+        write = settings._write
+
+        def counting_write(data, fsync=False):
+            settings.writes.append((dict(data), fsync))
+            return write(data, fsync)
+        monkeypatch.setattr(settings, "_write", counting_write)
+        return settings
+    return make
+
+
+def saved(settings_path):
+    with open(settings_path) as f:
+        return json.load(f)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_burst_of_changes_is_written_once(make_settings, settings_path):
+    settings = make_settings()
+    for size in range(10, 20):
+        settings.set("card_font_size", size)
+    settings.set("theme", "dark")
+
+    # Nothing is written until the changes stop
+    assert settings.writes == []
+    assert wait_for(lambda: settings.writes)
+    time.sleep(0.1)
+
+    assert len(settings.writes) == 1
+    assert saved(settings_path)["card_font_size"] == 19
+    assert saved(settings_path)["theme"] == "dark"
+
+
+def test_unchanged_value_is_not_written(make_settings):
+    settings = make_settings()
+    settings.set("theme", settings.get("theme"))
+
+    assert not settings._dirty
+    assert settings.flush()
+    assert settings.writes == []
+
+
+def test_batch_schedules_the_write_when_the_outermost_batch_ends(make_settings, settings_path):
+    settings = make_settings(flush_delay=60)
+    with settings.batch():
+        settings.set("theme", "dark")
+        with settings.batch():
+            settings.update({"card_font_size": 18, "study_session_cards": 5})
+        assert settings._flush_timer is None
+    assert settings._flush_timer is not None
+
+    settings.flush()
+    assert settings._flush_timer is None
+    assert len(settings.writes) == 1
+    assert {key: saved(settings_path)[key] for key in ("theme", "card_font_size", "study_session_cards")} == {
+        "theme": "dark", "card_font_size": 18, "study_session_cards": 5
+    }
+
+
+def test_pending_changes_survive_a_restart_after_close(make_settings, settings_path):
+    settings = make_settings(flush_delay=60)
+    settings.set("theme", "dark")
+    settings.close()
+
+    assert Settings(settings_path).get("theme") == "dark"
+
+
+@pytest.mark.parametrize("policy, on_write, on_close", [
+    (FSYNC_ALWAYS, True, True),
+    ("close", False, True),
+    (FSYNC_NEVER, False, False),
+])
+def test_fsync_policy(make_settings, policy, on_write, on_close):
+    settings = make_settings(fsync_policy=policy)
+    settings.set("theme", "dark")
+    settings.flush()
+    settings.set("theme", "light")
+    settings.close()
+
+    assert [fsync for _, fsync in settings.writes] == [on_write, on_close]
+
+
+def test_subscribers_only_hear_about_their_keys(make_settings):
+    settings = make_settings(flush_delay=60)
+    theme, fonts, everything = [], [], []
+    settings.subscribe({"theme"}, theme.append)
+    settings.subscribe(["card_font_size", "card_flip_animation"], fonts.append)
+    settings.subscribe(None, everything.append)
+
+    settings.set("theme", "dark")
+    settings.set("study_session_cards", 5)
+
+    assert theme == [{"theme"}]
+    assert fonts == []
+    assert everything == [{"theme"}, {"study_session_cards"}]
+
+
+def test_batch_notifies_once_with_every_changed_key(make_settings):
+    settings = make_settings(flush_delay=60)
+    changes = []
+    settings.subscribe(None, changes.append)
+
+    with settings.batch():
+        settings.set("theme", "dark")
+        settings.update({"card_font_size": 18, "study_session_cards": settings.get("study_session_cards")})
+        assert changes == []
+
+    assert changes == [{"theme", "card_font_size"}]
+
+
+def test_reset_notifies_the_keys_it_changed(make_settings):
+    settings = make_settings(flush_delay=60)
+    settings.update({"theme": "dark", "card_font_size": 18})
+    changes = []
+    settings.subscribe(None, changes.append)
+
+    settings.reset()
+
+    assert changes == [{"theme", "card_font_size"}]
+
+
+def test_failing_subscriber_does_not_stop_the_others(make_settings):
+    settings = make_settings(flush_delay=60)
+    changes = []
+
+    def broken(changed):
+        raise RuntimeError("view was deleted")
+    settings.subscribe({"theme"}, broken)
+    settings.subscribe({"theme"}, changes.append)
+
+    assert settings.set("theme", "dark")
+    assert changes == [{"theme"}]
+
+
+def test_unsubscribe(make_settings):
+    settings = make_settings(flush_delay=60)
+    changes = []
+    callback = settings.subscribe({"theme"}, changes.append)
+    settings.unsubscribe(callback)
+
+    settings.set("theme", "dark")
+
+    assert changes == []
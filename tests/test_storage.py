@@ -0,0 +1,291 @@
+import json
+import time
+import sqlite3
+import datetime
+import pytest
+from src.data.storage import SCHEMA_VERSION, SQLiteStorage
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Path of a database in a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return str(tmp_path / "flashcards.db")
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    """Use a local timezone away from UTC, so local/UTC mix-ups change the results."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("Changing the timezone needs time.tzset")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+# Schema and ISO text timestamps as written before SCHEMA_VERSION 1
+VERSION_0_SCHEMA = '''
+CREATE TABLE decks (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    last_studied TEXT
+);
+CREATE TABLE flashcards (
+    id TEXT PRIMARY KEY,
+    deck_id TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_reviewed TEXT,
+    FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+);
+CREATE TABLE study_sessions (
+    id TEXT PRIMARY KEY,
+    deck_id TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    cards_studied INTEGER DEFAULT 0,
+    cards_correct INTEGER DEFAULT 0,
+    FOREIGN KEY (deck_id) REFERENCES decks(id) ON DELETE CASCADE
+);
+'''
+
+
+def epoch(iso: str) -> int:
+    """Whole epoch seconds of a naive local ISO timestamp."""
+    return int(datetime.datetime.fromisoformat(iso).timestamp())
+
+
+def test_migrates_version_0_database(db_path, local_timezone):
+    """Opening a version 0 database converts its ISO timestamps and builds the daily rollup."""
+    decks = [
+        ("d1", "Deck 1", "", "2026-03-01T08:00:00.123456", "2026-03-02T23:45:10.999999"),
+        ("d2", "Deck 2", None, "2026-03-01T12:30:00", None),
+    ]
+    cards = [
+        ("c1", "d1", "Q1", "A1", "T", "2026-03-01T08:00:00.500000", "2026-03-02T23:40:00.250000"),
+        ("c2", "d1", "Q2", "A2", "T", "2026-03-01T08:00:01", None),
+        ("c3", "d2", "Q3", "A3", "U", "2026-03-01T12:30:00.000001", None),
+    ]
+    sessions = [
+        # Starts late in the local day, ends after midnight: counts for the day it started
+        ("s1", "d1", "2026-03-02T23:30:00.750000", "2026-03-03T00:10:30.100000", 10, 7),
+        ("s2", "d1", "2026-03-02T09:00:00", "2026-03-02T09:05:00", 5, 5),
+        ("s3", "d2", "2026-03-03T10:00:00.500000", "2026-03-03T10:01:00.499999", 2, 1),
+        # Never completed, so not in the rollup
+        ("s4", "d2", "2026-03-03T11:00:00", None, 0, 0),
+    ]
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(VERSION_0_SCHEMA)
+        conn.executemany("INSERT INTO decks VALUES (?, ?, ?, ?, ?)", decks)
+        conn.executemany("INSERT INTO flashcards VALUES (?, ?, ?, ?, ?, ?, ?)", cards)
+        conn.executemany("INSERT INTO study_sessions VALUES (?, ?, ?, ?, ?, ?)", sessions)
+    conn.close()
+
+    storage = SQLiteStorage(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name LIKE '%legacy%'").fetchall() == []
+
+        assert conn.execute("SELECT * FROM decks ORDER BY id").fetchall() == [
+            ("d1", "Deck 1", "", epoch(decks[0][3]), epoch(decks[0][4])),
+            ("d2", "Deck 2", None, epoch(decks[1][3]), None),
+        ]
+        assert conn.execute("SELECT * FROM flashcards ORDER BY id").fetchall() == [
+            card[:5] + (epoch(card[5]), epoch(card[6]) if card[6] else None) for card in cards
+        ]
+        assert conn.execute("SELECT * FROM study_sessions ORDER BY id").fetchall() == [
+            session[:2] + (epoch(session[2]), epoch(session[3]) if session[3] else None) + session[4:]
+            for session in sessions
+        ]
+
+        expected_daily = {}
+        for _, deck_id, start, end, studied, correct in sessions:
+            if end is None:
+                continue
+            key = (deck_id, datetime.datetime.fromisoformat(start).date().isoformat())
+            row = expected_daily.setdefault(key, [0, 0, 0, 0])
+            row[0] += 1
+            row[1] += studied
+            row[2] += correct
+            row[3] += epoch(end) - epoch(start)
+        assert {
+            (deck_id, day): [sessions_count, studied, correct, seconds]
+            for deck_id, day, sessions_count, studied, correct, seconds
+            in conn.execute("SELECT * FROM daily_stats").fetchall()
+        } == expected_daily
+    finally:
+        conn.close()
+
+    # The migrated data reads back through the models, and reopening doesn't migrate again
+    deck = storage.get_deck("d1")
+    assert deck.created_at == datetime.datetime(2026, 3, 1, 8, 0, 0)
+    assert [card.id for card in deck.cards] == ["c1", "c2"]
+    SQLiteStorage(db_path)
+    assert storage.get_deck("d1") == deck
+
+
+def rollup_snapshot(storage, deck_ids):
+    """Everything read from the daily rollup: per-day totals and per-deck stats."""
+    return (
+        storage.get_daily_stats(),
+        {deck_id: storage.get_daily_stats(deck_id) for deck_id in deck_ids},
+        {deck_id: storage.get_deck_stats(deck_id) for deck_id in deck_ids}
+    )
+
+
+def assert_rollup_matches_rebuild(storage, deck_ids):
+    """The incrementally maintained rollup equals one recomputed from the sessions."""
+    maintained = rollup_snapshot(storage, deck_ids)
+    storage.rebuild_daily_stats()
+    assert rollup_snapshot(storage, deck_ids) == maintained
+    return maintained
+
+
+def test_daily_stats_follow_saved_sessions(db_path, local_timezone):
+    """Saving, re-saving and deleting keep daily_stats equal to rebuild_daily_stats()."""
+    from src.data.models import Flashcard, FlashcardDeck, StudySession
+
+    storage = SQLiteStorage(db_path)
+    decks = [FlashcardDeck.create(name, "", [Flashcard.create("Q", "A", name)]) for name in ("One", "Two")]
+    for deck in decks:
+        storage.save_deck(deck)
+    deck_ids = [deck.id for deck in decks]
+    one, two = deck_ids
+
+    day = datetime.datetime(2026, 3, 2)
+    morning = StudySession("s1", one, day.replace(hour=9))
+    # Starts before and ends after local midnight
+    late = StudySession("s2", one, day.replace(hour=23, minute=50), day + datetime.timedelta(days=1, minutes=5), 4, 3)
+    other = StudySession("s3", two, day.replace(hour=12), day.replace(hour=12, minute=10), 6, 2)
+
+    # An unfinished session is not counted
+    storage.save_study_session(morning)
+    assert assert_rollup_matches_rebuild(storage, deck_ids)[0] == []
+
+    for session in (late, other):
+        storage.save_study_session(session)
+    morning.end_time = day.replace(hour=9, minute=30)
+    morning.cards_studied, morning.cards_correct = 10, 8
+    storage.save_study_session(morning)
+    daily, _, stats = assert_rollup_matches_rebuild(storage, deck_ids)
+    assert daily == [(day.date(), 3, 20, 13, 30 * 60 + 15 * 60 + 10 * 60)]
+    assert (stats[one]['session_count'], stats[one]['total_studied'], stats[one]['total_correct']) == (2, 14, 11)
+
+    # Re-saving replaces the session's previous contribution instead of adding to it
+    morning.end_time = day.replace(hour=9, minute=45)
+    morning.cards_studied, morning.cards_correct = 12, 9
+    storage.save_study_session(morning)
+    storage.save_study_session(morning)
+    daily, _, stats = assert_rollup_matches_rebuild(storage, deck_ids)
+    assert daily == [(day.date(), 3, 22, 14, 45 * 60 + 15 * 60 + 10 * 60)]
+    assert stats[one]['session_count'] == 2
+
+    # Deleting a deck drops its sessions from the rollup
+    storage.delete_deck(one)
+    daily, by_deck, stats = assert_rollup_matches_rebuild(storage, deck_ids)
+    assert daily == [(day.date(), 1, 6, 2, 10 * 60)]
+    assert by_deck[one] == []
+    assert stats[one]['session_count'] == 0
+
+
+class FakeClock:
+    """Stands in for the time module of src.data.cache."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    from src.data import cache
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "time", clock)
+    response_cache = cache.ResponseCache(str(tmp_path / "responses.db"), ttl_seconds=3600, max_entries=0, max_bytes=0)
+    response_cache.clock = clock
+    return response_cache
+
+
+def cache_payload(topic, base_url="http://localhost:8000"):
+    return {'topic': topic, 'num_questions': 5, 'additional_notes': "", 'base_url': base_url}
+
+
+def cache_response(topic, answer="A"):
+    return {'topic': topic, 'cards': [{'question': "Q", 'answer': answer}], 'source_info': None}
+
+
+def put_at(response_cache, seconds_later, topic, answer="A"):
+    """Store a response a little later than the previous operation."""
+    response_cache.clock.now += seconds_later
+    assert response_cache.put(cache_payload(topic), cache_response(topic, answer))
+
+
+def cached_topics(response_cache):
+    """Normalized topics with an entry, read without touching the metrics."""
+    with response_cache._get_connection() as conn:
+        return sorted(json.loads(row[0])['topic'] for row in conn.execute("SELECT request FROM response_cache"))
+
+
+def test_response_cache_hits_misses_and_stats(response_cache):
+    assert response_cache.get(cache_payload("Math")) is None
+    put_at(response_cache, 1, "Math")
+    assert response_cache.get(cache_payload("Math")) == cache_response("Math")
+    # Equivalent requests share an entry
+    assert response_cache.get(cache_payload("  MATH ")) == cache_response("Math")
+
+    stats = response_cache.stats()
+    assert (stats['hits'], stats['misses'], stats['stores'], stats['entries']) == (2, 1, 1, 1)
+    assert stats['bytes'] > 0
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+
+def test_response_cache_keys_on_the_server(response_cache):
+    put_at(response_cache, 1, "Math")
+    assert response_cache.get(cache_payload("Math", "HTTP://LocalHost:8000/")) is not None
+    assert response_cache.get(cache_payload("Math", "http://other-server:8000")) is None
+    assert response_cache.get(cache_payload("Math", "")) is None
+
+
+def test_response_cache_expires_entries(response_cache):
+    put_at(response_cache, 1, "Math")
+    response_cache.clock.now += 3600
+    assert response_cache.get(cache_payload("Math")) is not None
+    response_cache.clock.now += 1
+    assert response_cache.get(cache_payload("Math")) is None
+    assert response_cache.stats()['expired'] == 1
+    assert cached_topics(response_cache) == []
+
+
+def test_response_cache_evicts_least_recently_used_entries(response_cache):
+    response_cache.max_entries = 2
+    put_at(response_cache, 1, "One")
+    put_at(response_cache, 1, "Two")
+    # Reading refreshes an entry
+    response_cache.clock.now += 1
+    assert response_cache.get(cache_payload("One")) is not None
+    put_at(response_cache, 1, "Three")
+    assert cached_topics(response_cache) == ["one", "three"]
+    assert response_cache.stats()['evictions'] == 1
+
+
+def test_response_cache_evicts_entries_over_the_byte_limit(response_cache):
+    put_at(response_cache, 1, "One")
+    entry_size = response_cache.stats()['bytes']
+    response_cache.max_bytes = 2 * entry_size + entry_size // 2
+    put_at(response_cache, 1, "Two")
+    put_at(response_cache, 1, "Six")
+    assert cached_topics(response_cache) == ["six", "two"]
+
+    # A response larger than the whole cache is not stored
+    assert not response_cache.put(cache_payload("Big"), cache_response("Big", "x" * (3 * entry_size)))
+    assert cached_topics(response_cache) == ["six", "two"]
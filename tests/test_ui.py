@@ -0,0 +1,256 @@
+import sys
+import time
+import pytest
+
+pytest.importorskip("PyQt6")
+
+
+@pytest.fixture
+def qapp(tmp_path, monkeypatch):
+    """Create an offscreen QApplication with settings and data in a temporary home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def test_startup_phases_within_budget(qapp):
+    """Fails when a startup phase exceeds its budget (see FLASHCARDS_STARTUP_BUDGETS)."""
+    from src.core.app import FlashCardApp
+    from src.core.startup import StartupTimer, load_budgets
+
+    timer = StartupTimer()
+    flashcard_app = FlashCardApp(timer)
+    flashcard_app.show()
+
+    # Run the event loop until the deferred loading has finished
+    deadline = time.monotonic() + 10
+    while timer.elapsed("interactive") is None and time.monotonic() < deadline:
+        qapp.processEvents()
+
+    try:
+        assert timer.elapsed("interactive") is not None, "Startup never became interactive"
+        assert timer.over_budget(load_budgets()) == []
+    finally:
+        flashcard_app.main_window.shutdown()
+        flashcard_app.main_window.deleteLater()
+
+
+# Starts the application in a fresh interpreter and prints the modules it loaded
+STARTUP_MODULES_SCRIPT = """
+import sys
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from src.core.app import FlashCardApp
+flashcard_app = FlashCardApp()
+print(" ".join(sys.modules))
+flashcard_app.main_window.shutdown()
+"""
+
+
+@pytest.mark.parametrize("module", ["httpx", "numpy"])
+def test_startup_does_not_import(tmp_path, module):
+    """httpx is only loaded by the first generation request, and numpy by the first insights dashboard."""
+    import os
+    import subprocess
+    # A fresh interpreter, since other tests import these modules
+    env = dict(os.environ, HOME=str(tmp_path), QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_MODULES_SCRIPT],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    assert module not in result.stdout.split()
+
+
+def test_error_dialog_from_worker_thread_runs_in_gui_thread(qapp, monkeypatch):
+    """A dialog requested by a worker thread is shown by the GUI thread, even if the worker asks first."""
+    import threading
+    from PyQt6.QtCore import QThread
+    from PyQt6.QtWidgets import QMessageBox
+    from src.utils import error_handling
+
+    shown = []
+    monkeypatch.setattr(QMessageBox, "critical",
+                        lambda *args: shown.append(QThread.currentThread() is qapp.thread()))
+    # Let the worker create the dispatcher
+    monkeypatch.setattr(error_handling, "_dispatcher", None)
+
+    worker = threading.Thread(target=error_handling.show_error_dialog, args=("Error", "Failed"))
+    worker.start()
+    worker.join()
+
+    deadline = time.monotonic() + 5
+    while not shown and time.monotonic() < deadline:
+        qapp.processEvents()
+
+    assert shown == [True]
+
+
+class InlineThreadPool:
+    """Runs workers immediately on the calling thread."""
+
+    def start(self, worker):
+        worker.run()
+
+
+def test_card_prefetcher_keeps_the_most_urgent_faces(qapp):
+    """When the cache is full, the faces asked for last in a prefetch are evicted first."""
+    from src.core.prefetch import CardPrefetcher, FaceStyle
+    style = FaceStyle(font=qapp.font().toString(), color="#000000", width=200, device_pixel_ratio=1.0)
+    prefetcher = CardPrefetcher(max_entries=4, thread_pool=InlineThreadPool())
+
+    faces = [(f"Face {i}", style) for i in range(6)]
+    assert prefetcher.prefetch(faces) == 6
+    assert [text for text, _ in prefetcher.images] == ["Face 3", "Face 2", "Face 1", "Face 0"]
+
+    # Faces already rendered are re-ranked by the new prefetch; only the new one is rendered
+    assert prefetcher.prefetch([faces[3], faces[0], ("Face 6", style)]) == 1
+    assert [text for text, _ in prefetcher.images] == ["Face 1", "Face 6", "Face 0", "Face 3"]
+    assert prefetcher.get("Face 2", style) is None
+
+    prefetcher.resize(2)
+    assert [text for text, _ in prefetcher.images] == ["Face 0", "Face 3"]
+
+
+def deliver_events(qapp, received):
+    """Run the event loop until the bus's coalescing timer has delivered something."""
+    deadline = time.monotonic() + 5
+    while not received and time.monotonic() < deadline:
+        qapp.processEvents()
+    # Anything else published in the same burst is delivered together
+    qapp.processEvents()
+
+
+def test_bulk_save_reaches_subscribers_as_one_event(qapp, tmp_path):
+    """Saving 500 cards in bulk publishes one DecksSaved and one CardsSaved."""
+    from src.core.events import EventBus, StorageEvent, CardsSaved, DecksSaved
+    from src.data.models import Flashcard, FlashcardDeck
+    from src.data.storage import SQLiteStorage
+
+    bus = EventBus()
+    received = []
+    bus.subscribe(StorageEvent, received.append)
+    storage = SQLiteStorage(str(tmp_path / "flashcards.db"), event_bus=bus)
+
+    decks = [
+        FlashcardDeck.create(f"Deck {i}", "", [Flashcard.create(f"Q{i}.{j}", "A", "T") for j in range(100)])
+        for i in range(5)
+    ]
+    assert storage.save_decks(decks)
+    deliver_events(qapp, received)
+
+    assert [type(event) for event in received] == [DecksSaved, CardsSaved]
+    assert received[0].deck_ids == [deck.id for deck in decks]
+    assert len(received[1].cards) == 500
+
+
+def test_event_bus_keeps_the_order_of_event_types(qapp):
+    """Only consecutive events of one type are merged; the order across types is kept."""
+    from src.core.events import EventBus, StorageEvent, CardsSaved, DecksDeleted
+
+    bus = EventBus()
+    received = []
+    bus.subscribe(StorageEvent, received.append)
+    bus.publish(CardsSaved([], ["A"]))
+    bus.publish(DecksDeleted(["A"]))
+    bus.publish(CardsSaved([], ["B"]))
+    bus.publish(CardsSaved([], ["C"]))
+    deliver_events(qapp, received)
+
+    assert received == [CardsSaved([], ["A"]), DecksDeleted(["A"]), CardsSaved([], ["B", "C"])]
+
+
+def block_event_loop(seconds):
+    """Stands in for a synchronous storage call in a view."""
+    time.sleep(seconds)
+
+
+def process_events_until(qapp, condition, timeout=2.0):
+    """Run the event loop until condition() holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+def test_watchdog_reports_a_stall_with_the_blocking_function(qapp):
+    from src.utils.watchdog import EventLoopWatchdog
+
+    watchdog = EventLoopWatchdog(interval_ms=10, stall_threshold_ms=100)
+    watchdog.start()
+    try:
+        assert process_events_until(qapp, lambda: len(watchdog.lags) >= 3)
+        assert watchdog.stalls == 0
+
+        block_event_loop(0.4)
+        assert process_events_until(qapp, lambda: watchdog.reports and not watchdog.reports[-1].ongoing)
+    finally:
+        watchdog.stop()
+
+    report, = watchdog.recent_reports()
+    assert report.function.startswith("block_event_loop (")
+    assert any(frame.startswith("test_watchdog_reports_a_stall") for frame in report.stack)
+    assert report.duration_ms >= 300
+    snapshot = watchdog.snapshot()
+    assert snapshot['stalls'] == 1
+    assert snapshot['worst'] == snapshot['max'] == report.duration_ms
+
+
+def test_flashcard_flip_switches_between_fixed_faces(qapp):
+    from src.ui.widgets.flashcard_widget import FlashcardWidget
+
+    widget = FlashcardWidget(animate_flips=True)
+    widget.show()
+    flips = []
+    widget.card_flipped.connect(flips.append)
+    widget.set_card("Capital of France?", "Paris")
+
+    widget.flip_card()
+    assert widget.face_stack.currentWidget() is widget.answer_frame
+    assert widget.answer_frame.graphicsEffect() is not None
+
+    # Showing the next card ends the fade and turns back to the question
+    widget.set_card("Capital of Italy?", "Rome")
+    assert widget.face_stack.currentWidget() is widget.question_frame
+    assert widget.answer_frame.graphicsEffect() is None
+    assert (widget.question_label.text(), widget.answer_label.text()) == ("Capital of Italy?", "Rome")
+
+    widget.flip_card()
+    assert process_events_until(qapp, lambda: widget._flip_animation is None)
+    assert widget.answer_frame.graphicsEffect() is None
+    assert flips == [True, True]
+    # The faces keep the style they were polished with
+    assert widget.question_frame.property("flipped") == "false"
+    assert widget.answer_frame.property("flipped") == "true"
+    widget.deleteLater()
+
+
+def test_flashcard_falls_back_to_text_when_resized(qapp):
+    from PyQt6.QtGui import QImage
+    from src.ui.widgets.flashcard_widget import FlashcardWidget
+
+    widget = FlashcardWidget(animate_flips=False)
+    widget.resize(600, 450)
+    widget.show()
+    qapp.processEvents()
+    question_style, answer_style = widget.face_styles()
+    assert question_style.width > 0 and question_style.width == answer_style.width
+
+    image = QImage(question_style.width, 40, QImage.Format.Format_ARGB32_Premultiplied)
+    widget.set_card("Capital of France?", "Paris", question_image=image, answer_image=image)
+    assert widget.showing_images
+    assert widget.question_label.accessibleName() == "Capital of France?"
+
+    resized = []
+    widget.width_changed.connect(lambda: resized.append(True))
+    widget.resize(500, 450)
+    qapp.processEvents()
+
+    assert resized and not widget.showing_images
+    assert (widget.question_label.text(), widget.answer_label.text()) == ("Capital of France?", "Paris")
+    widget.deleteLater()
@@ -0,0 +1,188 @@
+import logging
+import pytest
+
+
+@pytest.fixture
+def restore_log_levels():
+    """Put the application loggers back to their levels after the test."""
+    from src.utils.logger import configure_log_levels, get_logger
+    names = ("storage", "cache")
+    levels = {name: get_logger(name).level for name in (None,) + names}
+    yield
+    configure_log_levels({})
+    for name, level in levels.items():
+        get_logger(name).setLevel(level)
+
+
+def test_configure_log_levels_resets_dropped_modules(restore_log_levels):
+    from src.utils.logger import configure_log_levels, get_logger
+
+    configure_log_levels({"log_level": "INFO", "log_levels": {"storage": "DEBUG", "cache": "ERROR"}})
+    assert get_logger("storage").getEffectiveLevel() == logging.DEBUG
+    assert get_logger("cache").getEffectiveLevel() == logging.ERROR
+
+    # A module removed from the map follows the application level again
+    configure_log_levels({"log_level": "WARNING", "log_levels": {"cache": "ERROR"}})
+    assert get_logger("storage").level == logging.NOTSET
+    assert get_logger("storage").getEffectiveLevel() == logging.WARNING
+    assert get_logger("cache").getEffectiveLevel() == logging.ERROR
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Record spans into a small, empty ring buffer of its own."""
+    from src.utils import tracing
+    recorder = tracing.SpanRecorder(capacity=5)
+    monkeypatch.setattr(tracing, "recorder", recorder)
+    monkeypatch.setattr(tracing, "_enabled", True)
+    return recorder
+
+
+def record_spans(recorder, name, durations_ms, category="storage"):
+    """Record spans of the given durations one after another."""
+    for duration in durations_ms:
+        recorder.record(name, category, 0, int(duration * 1e6))
+
+
+@pytest.mark.parametrize("percent, expected", [(0, 1), (50, 5), (95, 10), (99, 10), (100, 10)])
+def test_percentile_uses_the_nearest_rank(percent, expected):
+    from src.utils.tracing import percentile
+    assert percentile([float(value) for value in range(1, 11)], percent) == expected
+
+
+def test_percentile_of_nothing_is_zero():
+    from src.utils.tracing import percentile
+    assert percentile([], 95) == 0.0
+
+
+def test_ring_buffer_keeps_the_most_recent_spans(recorder):
+    record_spans(recorder, "SQLiteStorage.get_deck", range(1, 8))
+
+    assert [span.duration / 1e6 for span in recorder.recent()] == [3, 4, 5, 6, 7]
+    # Lifetime totals also count the spans that were pushed out
+    assert recorder.lifetime_totals() == {"SQLiteStorage.get_deck": ("storage", 7, 28.0)}
+
+
+def test_stats_per_span_name_slowest_total_first(recorder):
+    record_spans(recorder, "SQLiteStorage.get_deck", [4, 1, 2])
+    record_spans(recorder, "APIClient.post", [20], category="api")
+
+    post, get_deck = recorder.stats()
+    assert (post.name, post.category, post.count, post.p50, post.max) == ("APIClient.post", "api", 1, 20, 20)
+    assert (get_deck.name, get_deck.count, get_deck.total) == ("SQLiteStorage.get_deck", 3, 7)
+    assert (get_deck.p50, get_deck.p95, get_deck.p99, get_deck.max) == (2, 4, 4, 4)
+
+
+def test_traced_records_calls_and_errors(recorder):
+    from src.utils.tracing import traced
+
+    @traced(name="load", category="storage")
+    def load(fail=False):
+        if fail:
+            raise ValueError("corrupt")
+        return "deck"
+
+    assert load() == "deck"
+    with pytest.raises(ValueError):
+        load(fail=True)
+
+    assert [(span.name, span.category, span.error) for span in recorder.recent()] == [
+        ("load", "storage", False), ("load", "storage", True)
+    ]
+    assert recorder.stats()[0].errors == 1
+
+
+def test_traced_coroutine_span_covers_the_await(recorder):
+    import asyncio
+    from src.utils.tracing import traced
+
+    @traced(category="api")
+    async def generate():
+        await asyncio.sleep(0.02)
+
+    asyncio.run(generate())
+
+    span, = recorder.recent()
+    assert span.name.endswith("generate")
+    assert span.duration >= 20e6
+
+
+def test_nothing_is_recorded_while_tracing_is_disabled(recorder, monkeypatch):
+    from src.utils import tracing
+
+    @tracing.traced()
+    def load():
+        with tracing.trace_span("inner"):
+            return "deck"
+
+    monkeypatch.setattr(tracing, "_enabled", False)
+    assert load() == "deck"
+    assert recorder.recent() == []
+
+
+def test_export_chrome_trace(recorder, tmp_path):
+    import json
+    import threading
+    from src.utils.tracing import export_chrome_trace, trace_span
+
+    with pytest.raises(KeyError):
+        with trace_span("HistoryView.fill_table", "ui"):
+            raise KeyError("deck")
+    path = export_chrome_trace(str(tmp_path / "trace.json"))
+
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    thread_name, span = events
+    assert thread_name["ph"] == "M"
+    assert thread_name["args"]["name"] == threading.current_thread().name
+    assert (span["name"], span["cat"], span["ph"]) == ("HistoryView.fill_table", "ui", "X")
+    assert span["tid"] == thread_name["tid"]
+    assert span["args"] == {"error": True}
+
+
+def test_latency_histogram_buckets():
+    from src.core.performance import latency_histogram
+    # Below 1 ms, 1-10 ms, 10-100 ms and from 100 ms up; bounds belong to the upper bucket
+    assert latency_histogram([0.2, 1, 9.9, 10, 99, 100, 2500]) == [1, 2, 2, 2]
+    assert latency_histogram([]) == [0, 0, 0, 0]
+
+
+def test_performance_sampler_groups_spans_by_category(recorder, tmp_path):
+    from types import SimpleNamespace
+    from src.core.performance import PerformanceSampler
+
+    record_spans(recorder, "SQLiteStorage.get_deck", [0.5, 5, 50, 500, 5, 5])
+    record_spans(recorder, "APIClient.post", [2000], category="api")
+    db_path = tmp_path / "flashcards.db"
+    db_path.write_bytes(b"x" * 1024)
+
+    snapshot = PerformanceSampler(SimpleNamespace(db_path=str(db_path))).collect()
+
+    assert snapshot.tracing_enabled
+    assert snapshot.calls == {"storage": 6, "api": 1}
+    row, = snapshot.spans["storage"]
+    # The histogram covers the ring buffer, the call count the whole lifetime
+    assert row.histogram == [0, 2, 1, 1]
+    assert (row.stats.count, row.lifetime_calls) == (4, 6)
+    assert snapshot.spans["api"][0].histogram == [0, 0, 0, 1]
+    assert snapshot.database_bytes == 1024
+    assert snapshot.cache is None
+
+
+def test_blocking_function_skips_the_decorators():
+    import os
+    import traceback
+    from src.utils import watchdog
+
+    def frame(path, name, line):
+        return traceback.FrameSummary(os.path.join(watchdog._SOURCE_ROOT, path), line, name)
+
+    stack = traceback.StackSummary.from_list([
+        frame(os.path.join("ui", "views", "history_view.py"), "refresh", 120),
+        frame(os.path.join("data", "storage.py"), "get_all_decks", 310),
+        frame(os.path.join("utils", "error_handling.py"), "wrapper", 80),
+        frame(os.path.join("utils", "tracing.py"), "wrapper", 300),
+    ])
+    expected = f"get_all_decks ({os.path.join('src', 'data', 'storage.py')}:310)"
+    assert watchdog.blocking_function(stack) == expected
+    assert watchdog.blocking_function(traceback.StackSummary()) == "unknown"